@@ -0,0 +1,79 @@
+"""Research batches: many queries on a bounded pool, sharing their tool work."""
+
+import asyncio
+import logging
+import time
+from collections import Counter, defaultdict
+
+from api.research import execute_research
+from api.schemas import (
+    BatchResearchRequest,
+    BatchResearchResponse,
+    ResearchRequest,
+    ResearchResponse,
+    RunTimings,
+)
+from arxiv_research_agent.config import settings
+from arxiv_research_agent.services import telemetry
+from arxiv_research_agent.services.batch_cache import batch_scope
+
+logger = logging.getLogger(__name__)
+
+
+async def execute_batch(batch: BatchResearchRequest) -> BatchResearchResponse:
+    """Run every request in the batch and collect the results in order.
+
+    At most `batch.concurrency` runs are in progress at once. The runs share
+    the papers they read and the searches they make, so overlapping topics
+    don't download the same papers twice. A run that fails becomes an
+    error result; the rest of the batch carries on.
+    """
+    concurrency = batch.concurrency or settings.batch_concurrency
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(request: ResearchRequest) -> ResearchResponse:
+        async with semaphore:
+            try:
+                return await execute_research(request)
+            except Exception as e:
+                logger.exception("❌ Batch run for '%s' failed", request.query)
+                return ResearchResponse(
+                    status="error",
+                    session_id=request.session_id,
+                    papers_analyzed=0,
+                    arxiv_calls_used=0,
+                    error=str(e),
+                )
+
+    logger.info("📦 Starting batch of %d research runs (concurrency %d)", len(batch.requests), concurrency)
+    started = time.perf_counter()
+    with batch_scope() as shared:
+        results = await asyncio.gather(*(run_one(r) for r in batch.requests))
+    elapsed = time.perf_counter() - started
+    telemetry.metrics.observe("research_batch_seconds", elapsed)
+
+    phases: dict[str, float] = defaultdict(float)
+    counts: Counter = Counter()
+    for result in results:
+        if result.timings is not None:
+            for phase, seconds in result.timings.phases.items():
+                phases[phase] += seconds
+            counts.update(result.timings.counts)
+
+    statuses = Counter(result.status for result in results)
+    stats = shared.stats()
+    logger.info(
+        "📦 Batch of %d finished in %.1fs (%s); shared %d papers (%d dropped), %d searches",
+        len(results), elapsed, dict(statuses), stats["papers"], stats["evictions"], stats["searches"],
+    )
+
+    return BatchResearchResponse(
+        results=results,
+        statuses=dict(sorted(statuses.items())),
+        requests_per_second=round(len(results) / elapsed, 3) if elapsed else 0.0,
+        timings=RunTimings(
+            total_seconds=round(elapsed, 3),
+            phases={k: round(v, 3) for k, v in sorted(phases.items())},
+            counts=dict(sorted(counts.items())),
+        ),
+    )
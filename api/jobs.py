@@ -0,0 +1,546 @@
+"""Background research jobs on a bounded worker pool."""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterator, Iterator
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+
+from api.research import stream_research
+from api.schemas import JobStatus, ResearchRequest, ResearchResponse
+from arxiv_research_agent.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFullError(Exception):
+    """Raised when the job queue is at capacity."""
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    request TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    result TEXT,
+    heartbeat_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created_at ON jobs (status, created_at);
+CREATE TABLE IF NOT EXISTS job_events (
+    job_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    event TEXT NOT NULL,
+    PRIMARY KEY (job_id, seq)
+);
+"""
+
+
+@dataclass
+class Job:
+    """A research run tracked by id, with a log of its progress events."""
+
+    id: str
+    request: ResearchRequest
+    status: str = "queued"
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    result: ResearchResponse | None = None
+    events: list[dict] = field(default_factory=list)
+    _closed: bool = False
+    _changed: asyncio.Condition = field(default_factory=asyncio.Condition)
+
+    async def publish(self, event: dict, final: bool = False) -> None:
+        """Append an event and wake anyone streaming this job.
+
+        `final` marks the last event; streams end once they've yielded it.
+        """
+        async with self._changed:
+            self.events.append(event)
+            self._closed = self._closed or final
+            self._changed.notify_all()
+
+    async def stream(self) -> AsyncIterator[dict]:
+        """Yield every event, past and future, until the job finishes."""
+        index = 0
+        while True:
+            async with self._changed:
+                await self._changed.wait_for(
+                    lambda: index < len(self.events) or self._closed
+                )
+                pending = self.events[index:]
+                done = self._closed
+            for event in pending:
+                yield event
+            index += len(pending)
+            if done and index >= len(self.events):
+                return
+
+    def to_status(self) -> JobStatus:
+        return JobStatus(
+            job_id=self.id,
+            status=self.status,
+            created_at=self.created_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+            result=self.result,
+        )
+
+
+class JobManager:
+    """Runs research jobs on a fixed number of background workers.
+
+    Submissions beyond `max_queue` waiting jobs are rejected so a burst of
+    requests can't grow memory or latency without bound. Finished jobs are
+    kept for `ttl` seconds so clients can collect results.
+    """
+
+    def __init__(self, workers: int = 2, max_queue: int = 20, ttl: float = 3600):
+        self._workers = workers
+        self._max_queue = max_queue
+        self._ttl = ttl
+        self._queue: asyncio.Queue[Job] | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._jobs: dict[str, Job] = {}
+
+    async def start(self) -> None:
+        """Start the worker tasks. Called on application startup."""
+        self._queue = asyncio.Queue(maxsize=self._max_queue)
+        self._tasks = [
+            asyncio.create_task(self._worker(i), name=f"research-worker-{i}")
+            for i in range(self._workers)
+        ]
+        logger.info("🧵 Job manager started (%d workers, queue %d)", self._workers, self._max_queue)
+
+    async def stop(self) -> None:
+        """Cancel the worker tasks. Called on application shutdown."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(self, request: ResearchRequest) -> Job:
+        """Queue a research run and return its job.
+
+        Raises:
+            QueueFullError: If the queue is at capacity.
+        """
+        if self._queue is None:
+            raise RuntimeError("JobManager.start() has not been called")
+
+        self._prune()
+        job = Job(id=str(uuid4()), request=request)
+        job.events.append({"type": "status", "status": job.status})
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise QueueFullError(
+                f"Research queue is full ({self._max_queue} jobs waiting)."
+            ) from None
+
+        self._jobs[job.id] = job
+        logger.info("📥 Queued job %s (%d waiting)", job.id, self._queue.qsize())
+        return job
+
+    async def get(self, job_id: str) -> Job | None:
+        return self._jobs.get(job_id)
+
+    async def queue_length(self) -> int:
+        """Jobs waiting for a worker."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        job.status = "running"
+        job.started_at = time.time()
+        await job.publish({"type": "status", "status": job.status})
+        logger.info("🏃 Running job %s", job.id)
+
+        try:
+            async for event in stream_research(job.request):
+                if event["type"] == "result":
+                    job.result = event["result"]
+                else:
+                    await job.publish(event)
+            job.status = "completed"
+        except Exception as e:
+            logger.exception("❌ Job %s failed", job.id)
+            job.result = ResearchResponse(
+                status="error",
+                papers_analyzed=0,
+                arxiv_calls_used=0,
+                error=str(e),
+            )
+            job.status = "failed"
+
+        job.finished_at = time.time()
+        await job.publish({
+            "type": "result",
+            "status": job.status,
+            "result": job.result,
+        }, final=True)
+
+    def _prune(self) -> None:
+        """Forget finished jobs older than the retention window."""
+        cutoff = time.time() - self._ttl
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+
+@dataclass
+class SharedJob(Job):
+    """A job kept in the shared job database, visible to every worker process."""
+
+    _manager: "SharedJobManager | None" = None
+
+    async def publish(self, event: dict, final: bool = False) -> None:
+        """Append an event and save it, with the job's status, for other processes."""
+        self.events.append(event)
+        await asyncio.to_thread(self._manager._save, self, len(self.events) - 1, event)
+
+    async def stream(self) -> AsyncIterator[dict]:
+        """Yield every event, past and future, until the job finishes."""
+        index = 0
+        while True:
+            events, done = await asyncio.to_thread(self._manager._events_since, self.id, index)
+            for event in events:
+                yield event
+            index += len(events)
+            if done:
+                return
+            await asyncio.sleep(self._manager.poll_interval)
+
+
+class SharedJobManager(JobManager):
+    """Job queue shared by the worker processes on a host through SQLite.
+
+    Any process can take a submission, run it, or report on it: jobs and
+    their events live in the database at `path`, each process's workers
+    claim the oldest queued job in a write transaction, and streams poll
+    for new events every `poll_interval` seconds. Submissions also wake
+    the submitting process's idle workers straight away. `max_queue`
+    bounds the queued jobs across all processes.
+
+    A running job holds a lease that its process renews every third of
+    `lease` seconds. Every process fails jobs whose lease has run out, so
+    a worker that crashed or was killed can't leave a job, or the streams
+    waiting on it, "running" forever. Database calls run on a thread: a
+    write may wait for another process's transaction.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        workers: int = 2,
+        max_queue: int = 20,
+        ttl: float = 3600,
+        poll_interval: float = 0.5,
+        lease: float = 30.0,
+    ):
+        super().__init__(workers, max_queue, ttl)
+        self._path = Path(path)
+        self.poll_interval = poll_interval
+        self._lease = lease
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._wakeup: asyncio.Event | None = None
+        self._running: dict[str, SharedJob] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self._path, timeout=30, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+            if "heartbeat_at" not in columns:
+                # Files from before leases. Another process may add it first.
+                with suppress(sqlite3.OperationalError):
+                    conn.execute("ALTER TABLE jobs ADD COLUMN heartbeat_at REAL")
+            self._conn = conn
+        return self._conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    async def start(self) -> None:
+        """Open the job database and start this process's workers."""
+        await asyncio.to_thread(self._connect)
+        self._wakeup = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._worker(i), name=f"research-worker-{i}")
+            for i in range(self._workers)
+        ]
+        self._tasks.append(asyncio.create_task(self._heartbeat(), name="research-job-heartbeat"))
+        logger.info("🧵 Shared job manager started (%d workers, queue %d, %s)",
+                    self._workers, self._max_queue, self._path)
+
+    async def stop(self) -> None:
+        """Cancel the workers and fail the jobs they were running.
+
+        Without this the jobs would stay "running" for every other process.
+        """
+        running = list(self._running.values())
+        await super().stop()
+        for job in running:
+            job.status = "failed"
+            job.finished_at = time.time()
+            job.result = ResearchResponse(
+                status="error",
+                papers_analyzed=0,
+                arxiv_calls_used=0,
+                error="The worker running this job shut down.",
+            )
+            await job.publish({"type": "result", "status": job.status, "result": job.result}, final=True)
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    async def submit(self, request: ResearchRequest) -> Job:
+        """Queue a research run and return its job.
+
+        Raises:
+            QueueFullError: If the queue is at capacity.
+        """
+        if self._wakeup is None:
+            raise RuntimeError("JobManager.start() has not been called")
+
+        job = SharedJob(id=str(uuid4()), request=request, _manager=self)
+        job.events.append({"type": "status", "status": job.status})
+        waiting = await asyncio.to_thread(self._insert, job)
+        self._wakeup.set()
+        logger.info("📥 Queued job %s (%d waiting)", job.id, waiting)
+        return job
+
+    async def get(self, job_id: str) -> Job | None:
+        return await asyncio.to_thread(self._load, job_id)
+
+    async def queue_length(self) -> int:
+        """Jobs waiting for a worker in any process."""
+        return await asyncio.to_thread(self._count_queued)
+
+    def _insert(self, job: SharedJob) -> int:
+        """Add a job to the queue and return how many jobs are now waiting.
+
+        Raises:
+            QueueFullError: If the queue is at capacity.
+        """
+        self._prune()
+        with self._transaction() as conn:
+            waiting = conn.execute("SELECT COUNT(*) FROM jobs WHERE status = 'queued'").fetchone()[0]
+            if waiting >= self._max_queue:
+                raise QueueFullError(f"Research queue is full ({self._max_queue} jobs waiting).")
+            conn.execute(
+                "INSERT INTO jobs (id, request, status, created_at) VALUES (?, ?, ?, ?)",
+                (job.id, job.request.model_dump_json(), job.status, job.created_at),
+            )
+            conn.execute(
+                "INSERT INTO job_events (job_id, seq, event) VALUES (?, 0, ?)",
+                (job.id, json.dumps(job.events[0])),
+            )
+        return waiting + 1
+
+    def _load(self, job_id: str) -> SharedJob | None:
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT id, request, status, created_at, started_at, finished_at, result "
+                "FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+            if row is None:
+                return None
+            events = conn.execute(
+                "SELECT event FROM job_events WHERE job_id = ? ORDER BY seq", (job_id,)
+            ).fetchall()
+        return self._job(row, [json.loads(event) for event, in events])
+
+    def _count_queued(self) -> int:
+        with self._lock:
+            conn = self._connect()
+            return conn.execute("SELECT COUNT(*) FROM jobs WHERE status = 'queued'").fetchone()[0]
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            job = await asyncio.to_thread(self._claim)
+            if job is None:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                self._wakeup.clear()
+                continue
+            self._running[job.id] = job
+            try:
+                await self._run(job)
+            finally:
+                self._running.pop(job.id, None)
+
+    def _claim(self) -> SharedJob | None:
+        """Take the oldest queued job, if any, for this process to run."""
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT id, request, status, created_at, started_at, finished_at, result "
+                "FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = 'running', heartbeat_at = ? WHERE id = ?",
+                (time.time(), row[0]),
+            )
+            events = conn.execute(
+                "SELECT event FROM job_events WHERE job_id = ? ORDER BY seq", (row[0],)
+            ).fetchall()
+        return self._job(row, [json.loads(event) for event, in events])
+
+    def _job(self, row: tuple, events: list[dict]) -> SharedJob:
+        job_id, request, status, created_at, started_at, finished_at, result = row
+        return SharedJob(
+            id=job_id,
+            request=ResearchRequest.model_validate_json(request),
+            status=status,
+            created_at=created_at,
+            started_at=started_at,
+            finished_at=finished_at,
+            result=ResearchResponse.model_validate_json(result) if result else None,
+            events=events,
+            _manager=self,
+        )
+
+    def _save(self, job: SharedJob, seq: int, event: dict) -> None:
+        """Record an event and the job's current status in one transaction.
+
+        Also renews the job's lease. A job already failed for an expired
+        lease stays failed; its late events are dropped.
+        """
+        result = job.result.model_dump_json() if job.result is not None else None
+        with self._transaction() as conn:
+            updated = conn.execute(
+                "UPDATE jobs SET status = ?, started_at = ?, finished_at = ?, result = ?, "
+                "heartbeat_at = ? WHERE id = ? AND finished_at IS NULL",
+                (job.status, job.started_at, job.finished_at, result, time.time(), job.id),
+            ).rowcount
+            if updated:
+                conn.execute(
+                    "INSERT INTO job_events (job_id, seq, event) VALUES (?, ?, ?)",
+                    (job.id, seq, json.dumps(jsonable_encoder(event))),
+                )
+
+    async def _heartbeat(self) -> None:
+        """Renew this process's leases and fail jobs whose lease ran out."""
+        while True:
+            await asyncio.sleep(self._lease / 3)
+            try:
+                await asyncio.to_thread(self._renew_and_reap, list(self._running))
+            except sqlite3.Error as e:
+                logger.warning("⚠️ Job lease renewal failed: %s", e)
+
+    def _renew_and_reap(self, job_ids: list[str]) -> None:
+        now = time.time()
+        result = ResearchResponse(
+            status="error",
+            papers_analyzed=0,
+            arxiv_calls_used=0,
+            error="The worker running this job stopped responding.",
+        )
+        with self._transaction() as conn:
+            conn.executemany(
+                "UPDATE jobs SET heartbeat_at = ? WHERE id = ? AND finished_at IS NULL",
+                [(now, job_id) for job_id in job_ids],
+            )
+            stale = conn.execute(
+                "SELECT id FROM jobs WHERE status = 'running' AND finished_at IS NULL "
+                "AND (heartbeat_at IS NULL OR heartbeat_at < ?)",
+                (now - self._lease,),
+            ).fetchall()
+            for job_id, in stale:
+                conn.execute(
+                    "UPDATE jobs SET status = 'failed', finished_at = ?, result = ? WHERE id = ?",
+                    (now, result.model_dump_json(), job_id),
+                )
+                event = {"type": "result", "status": "failed", "result": jsonable_encoder(result)}
+                conn.execute(
+                    "INSERT INTO job_events (job_id, seq, event) "
+                    "SELECT ?, COALESCE(MAX(seq), -1) + 1, ? FROM job_events WHERE job_id = ?",
+                    (job_id, json.dumps(event), job_id),
+                )
+        if stale:
+            logger.warning("⚠️ Failed %d jobs whose worker stopped renewing their lease", len(stale))
+
+    def _events_since(self, job_id: str, index: int) -> tuple[list[dict], bool]:
+        """A job's events from `index` on, and whether it has finished.
+
+        A finished job's final event is saved with its finish time, so once
+        finished is seen every event is already there. A job pruned in the
+        meantime counts as finished.
+        """
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT finished_at FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            events = conn.execute(
+                "SELECT event FROM job_events WHERE job_id = ? AND seq >= ? ORDER BY seq",
+                (job_id, index),
+            ).fetchall()
+        return [json.loads(event) for event, in events], row is None or row[0] is not None
+
+    def _prune(self) -> None:
+        """Forget finished jobs older than the retention window."""
+        cutoff = time.time() - self._ttl
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM job_events WHERE job_id IN "
+                "(SELECT id FROM jobs WHERE finished_at < ?)",
+                (cutoff,),
+            )
+            conn.execute("DELETE FROM jobs WHERE finished_at < ?", (cutoff,))
+
+
+if settings.multi_worker:
+    job_manager = SharedJobManager(
+        path=settings.shared_state_path("jobs.sqlite3"),
+        workers=settings.job_workers,
+        max_queue=settings.job_queue_size,
+        ttl=settings.job_ttl,
+        poll_interval=settings.job_poll_interval,
+        lease=settings.job_lease,
+    )
+else:
+    job_manager = JobManager(
+        workers=settings.job_workers,
+        max_queue=settings.job_queue_size,
+        ttl=settings.job_ttl,
+    )
@@ -1,8 +1,27 @@
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse
 
+from api.jobs import job_manager
 from api.routes import router
+from api.sessions import research_sessions
+from arxiv_research_agent.config import settings
+from arxiv_research_agent.services import (
+    close_http_client,
+    close_publisher,
+    get_html_executor,
+    get_metadata_harvester,
+    get_metadata_index,
+    get_parse_executor,
+    get_text_store,
+    shutdown_executors,
+    start_http_client,
+    telemetry,
+    warm_up_connections,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -11,10 +30,57 @@ logging.basicConfig(
     datefmt="%H:%M:%S",
 )
 
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared upstream connections on startup and close them on shutdown.
+
+    The agent loads, and upstream connections warm up, in the background:
+    the server starts answering straight away and /ready reports when the
+    work is done.
+    """
+    await start_http_client()
+    research_sessions.start()
+    app.state.connections_warm = None
+    if settings.warmup_connections:
+        app.state.connections_warm = asyncio.create_task(warm_up_connections([
+            settings.arxiv_api_url,
+            settings.arxiv_html_base_url,
+            settings.ar5iv_html_base_url,
+        ]))
+    missing = settings.missing_keys()
+    if missing:
+        logger.error("🔑 Missing required settings: %s", ", ".join(missing))
+    if settings.multi_worker and settings.session_backend == "memory":
+        logger.warning("⚠️ In-memory sessions with MULTI_WORKER: follow-ups only reach the worker that ran them")
+    await job_manager.start()
+    harvester = get_metadata_harvester()
+    if harvester is not None:
+        await harvester.start()
+    try:
+        yield
+    finally:
+        if app.state.connections_warm is not None:
+            app.state.connections_warm.cancel()
+        if harvester is not None:
+            await harvester.stop()
+        await job_manager.stop()
+        await research_sessions.close()
+        await close_http_client()
+        close_publisher()
+        shutdown_executors()
+        index = get_metadata_index()
+        if index is not None:
+            index.close()
+
+
 app = FastAPI(
     title="ArXiv Research Agent",
     description="AI agent for researching ArXiv papers and generating summaries",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 
@@ -25,3 +91,43 @@ app.include_router(router)
 @app.get("/health")
 async def health():
     return {"status": "healthy"}
+
+
+@app.get("/ready")
+async def ready():
+    """Readiness: 200 once the agent is loaded and warm-up is done, else 503.
+
+    /health only says the process is up; route traffic on this instead.
+    """
+    warming = app.state.connections_warm
+    checks = {
+        "agent": research_sessions.is_ready,
+        "connections": warming is None or warming.done(),
+        "settings": not settings.missing_keys(),
+    }
+    body = {"status": "ready" if all(checks.values()) else "starting", "checks": checks}
+    missing = settings.missing_keys()
+    if missing:
+        body["status"] = "misconfigured"
+        body["missing"] = missing
+    return JSONResponse(body, status_code=200 if body["status"] == "ready" else 503)
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus metrics: run, model, tool, arXiv, download and cache timings."""
+    telemetry.metrics.set_gauge("research_jobs_queued", await job_manager.queue_length())
+    for executor in (get_parse_executor(), get_html_executor()):
+        stats = executor.stats()
+        telemetry.metrics.set_gauge("executor_queue_depth", stats["queue_depth"], executor=executor.name)
+        telemetry.metrics.set_gauge("executor_in_flight", stats["in_flight"], executor=executor.name)
+        telemetry.metrics.set_gauge(
+            "executor_max_queue_depth", stats["max_queue_depth"], executor=executor.name
+        )
+    text_store = get_text_store()
+    if text_store is not None:
+        telemetry.metrics.set_gauge("text_store_bytes", text_store.size)
+    return PlainTextResponse(
+        telemetry.metrics.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
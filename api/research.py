@@ -0,0 +1,316 @@
+"""Research agent execution shared by the synchronous, streaming and job endpoints."""
+
+import asyncio
+import time
+from contextlib import aclosing
+from typing import TYPE_CHECKING, AsyncIterator
+
+from api.result_cache import get_result_cache
+from api.schemas import ResearchRequest, ResearchResponse, RunTimings
+from api.sessions import USER_ID, SessionBusyError, SessionNotFoundError, research_sessions
+from arxiv_research_agent.config import settings
+from arxiv_research_agent.services import telemetry
+from arxiv_research_agent.services.deadline import remaining
+
+if TYPE_CHECKING:
+    from google.adk.events import Event
+
+
+async def execute_research(request: ResearchRequest) -> ResearchResponse:
+    """Execute the research agent with the given query.
+
+    The agent will:
+    1. Search arXiv for relevant papers
+    2. Read promising papers in detail
+    3. Synthesize findings into a document
+    4. Save to surfacedocs and return the URL
+    """
+    async with aclosing(stream_research(request)) as events:
+        async for event in events:
+            if event["type"] == "result":
+                return event["result"]
+    raise RuntimeError("Research run ended without a result.")
+
+
+async def stream_research(request: ResearchRequest) -> AsyncIterator[dict]:
+    """Run the research agent, yielding progress events as they happen.
+
+    Yields dicts with a "type" key: "tool_call", "search_results",
+    "paper_fetched" and "document_saved" while the agent works, then a final
+    "result" event whose "result" is the ResearchResponse.
+
+    Closing the generator (e.g. when a streaming client disconnects) stops
+    the agent run, so no further model or arXiv calls are made.
+
+    With `request.session_id` the run continues that session: the agent
+    sees the earlier searches and papers in its history and gets a fresh
+    arXiv call budget.
+
+    Each run has a deadline (`request.deadline_seconds`, or the
+    `research_deadline` setting). Tools stop searching and reading a little
+    before it so the agent can still save a document; if the run is still
+    going when it passes, it is stopped and the result has status
+    "partial" with the papers read so far.
+
+    Unless `request.use_cache` is false, a new request equivalent to a
+    recent successful one returns that result (marked `cached`) without
+    running, and identical requests arriving together share one run.
+    Follow-ups always run.
+    """
+    cache = get_result_cache()
+    if cache is None or not request.use_cache or request.session_id is not None:
+        async for event in _run_in_session(request):
+            yield event
+        return
+
+    while True:
+        cached = cache.get(request)
+        if cached is not None:
+            yield {"type": "result", "result": cached}
+            return
+        pending = cache.claim(request)
+        if pending is None:
+            break
+        # Shielded so a waiter going away doesn't cancel the shared future.
+        shared = await asyncio.shield(pending)
+        if shared is not None:
+            yield {"type": "result", "result": shared}
+            return
+
+    completed = False
+    try:
+        async for event in _run_in_session(request):
+            if event["type"] == "result":
+                # Completed before yielding so waiters don't depend on the
+                # consumer closing this generator.
+                cache.complete(request, event["result"])
+                completed = True
+            yield event
+    finally:
+        if not completed:
+            cache.complete(request, None)
+
+
+async def _run_in_session(request: ResearchRequest) -> AsyncIterator[dict]:
+    """Open the request's session, run the agent in it and release it."""
+    try:
+        session_id = await research_sessions.open(request.session_id)
+    except (SessionNotFoundError, SessionBusyError) as e:
+        yield {
+            "type": "result",
+            "result": ResearchResponse(
+                status="error",
+                session_id=request.session_id,
+                papers_analyzed=0,
+                arxiv_calls_used=0,
+                error=str(e),
+            ),
+        }
+        return
+
+    try:
+        async for event in _run(request, session_id):
+            yield event
+    finally:
+        research_sessions.release(session_id)
+
+
+async def _run(request: ResearchRequest, session_id: str) -> AsyncIterator[dict]:
+    """Run the agent in a claimed session, timing where the run spends its time."""
+    with telemetry.track_run() as run_stats:
+        async for event in _run_agent(request, session_id):
+            if event["type"] == "result":
+                response = event["result"]
+                elapsed = run_stats.elapsed
+                # Straight to the registry: these describe the run, not a phase of it.
+                telemetry.metrics.observe("research_run_seconds", elapsed)
+                telemetry.metrics.inc("research_runs_total", status=response.status)
+                response.timings = RunTimings(
+                    total_seconds=round(elapsed, 3),
+                    phases={k: round(v, 3) for k, v in sorted(run_stats.phases.items())},
+                    counts=dict(sorted(run_stats.counts.items())),
+                )
+            yield event
+
+
+async def _run_agent(request: ResearchRequest, session_id: str) -> AsyncIterator[dict]:
+    """Run the agent in a claimed session."""
+    follow_up = request.session_id is not None
+
+    # Build the user message with query and parameters
+    if follow_up:
+        message_text = f"""Follow-up research query: {request.query}
+
+Parameters:
+- Search papers from the last {request.days_back} days
+- Analyze up to {request.max_papers} papers
+
+Build on the searches and papers from earlier in this conversation. Only search arXiv or read papers again for what they don't already cover. Save a new research summary document."""
+    else:
+        message_text = f"""Research query: {request.query}
+
+Parameters:
+- Search papers from the last {request.days_back} days
+- Analyze up to {request.max_papers} papers
+
+Please search arXiv, read relevant papers, and save a research summary document."""
+
+    # Imported here: google.genai takes seconds to import, and by the time a
+    # run starts the session runner has already loaded it.
+    from google.genai import types
+
+    content = types.Content(
+        role="user",
+        parts=[types.Part(text=message_text)],
+    )
+
+    # Tools read both deadlines from session state; searching and reading
+    # end early enough to leave time for writing and saving the document.
+    budget = request.deadline_seconds or settings.research_deadline
+    deadline = time.time() + budget
+    state_delta = {
+        # The query search results are ranked against.
+        "research_query": request.query,
+        "deadline": deadline,
+        "work_deadline": deadline - min(settings.research_finish_reserve, budget / 4),
+    }
+    if follow_up:
+        # Each run gets its own arXiv call budget.
+        state_delta["arxiv_calls_used"] = 0
+
+    # Run the agent and collect results
+    document_url = None
+    error_message = None
+    timed_out = False
+
+    try:
+        events = research_sessions.runner.run_async(
+            user_id=USER_ID,
+            session_id=session_id,
+            new_message=content,
+            state_delta=state_delta,
+        )
+
+        try:
+            while True:
+                # Timed per step rather than around the loop, so the
+                # timeout never fires while suspended at a yield.
+                async with asyncio.timeout(remaining(deadline)):
+                    event = await anext(events, None)
+                if event is None:
+                    break
+                for progress in _progress_events(event):
+                    if progress["type"] == "document_saved":
+                        document_url = progress["url"]
+                    yield progress
+        finally:
+            # Stops the runner promptly if the consumer went away mid-run.
+            await events.aclose()
+
+    except TimeoutError as e:
+        if remaining(deadline) > 0:
+            error_message = str(e) or "Timed out"
+        else:
+            timed_out = True
+    except Exception as e:
+        error_message = str(e)
+
+    # Get session state to extract metrics
+    state = await research_sessions.get_state(session_id)
+    arxiv_calls_used = state.get("arxiv_calls_used", 0)
+    papers_read = state.get("papers_read", [])
+
+    if error_message:
+        response = ResearchResponse(
+            status="error",
+            session_id=session_id,
+            document_url=None,
+            papers_analyzed=len(papers_read),
+            papers_read=papers_read,
+            arxiv_calls_used=arxiv_calls_used,
+            error=error_message,
+        )
+    elif document_url:
+        response = ResearchResponse(
+            status="success",
+            session_id=session_id,
+            document_url=document_url,
+            papers_analyzed=len(papers_read),
+            papers_read=papers_read,
+            arxiv_calls_used=arxiv_calls_used,
+            error=None,
+        )
+    elif timed_out:
+        response = ResearchResponse(
+            status="partial",
+            session_id=session_id,
+            document_url=None,
+            papers_analyzed=len(papers_read),
+            papers_read=papers_read,
+            arxiv_calls_used=arxiv_calls_used,
+            error=f"Run stopped at its {budget:g}s deadline before a document was saved.",
+        )
+    else:
+        response = ResearchResponse(
+            status="completed",
+            session_id=session_id,
+            document_url=None,
+            papers_analyzed=len(papers_read),
+            papers_read=papers_read,
+            arxiv_calls_used=arxiv_calls_used,
+            error="Agent completed but no document was saved.",
+        )
+
+    yield {"type": "result", "result": response}
+
+
+def _progress_events(event: "Event") -> list[dict]:
+    """Translate an ADK event into progress events for clients."""
+    progress = []
+
+    for call in event.get_function_calls():
+        args = call.args or {}
+        if call.name == "save_document":
+            # The document itself is large; the title is enough to show progress.
+            document = args.get("document") or {}
+            args = {"title": document.get("title")}
+        progress.append({"type": "tool_call", "tool": call.name, "args": args})
+
+    for response in event.get_function_responses():
+        result = response.response
+        if not isinstance(result, dict):
+            continue
+
+        if response.name == "search_arxiv":
+            progress.append({
+                "type": "search_results",
+                "status": result.get("status"),
+                "total_found": result.get("total_found", 0),
+                "calls_remaining": result.get("calls_remaining"),
+            })
+        elif response.name == "fetch_paper_content":
+            progress.append({
+                "type": "paper_fetched",
+                "status": result.get("status"),
+                "paper_id": result.get("paper_id"),
+                "title": result.get("title"),
+            })
+        elif response.name == "fetch_papers":
+            for paper in result.get("papers", []):
+                progress.append({
+                    "type": "paper_fetched",
+                    "status": "success",
+                    "paper_id": paper.get("paper_id"),
+                    "title": paper.get("title"),
+                })
+            for paper_id in result.get("failed", []):
+                progress.append({
+                    "type": "paper_fetched",
+                    "status": "error",
+                    "paper_id": paper_id,
+                    "title": None,
+                })
+        elif response.name == "save_document" and "url" in result:
+            progress.append({"type": "document_saved", "url": result["url"]})
+
+    return progress
@@ -0,0 +1,153 @@
+"""Cache of finished research runs, shared across requests."""
+
+import asyncio
+import logging
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+
+from api.schemas import ResearchRequest, ResearchResponse
+from arxiv_research_agent.config import settings
+from arxiv_research_agent.services import telemetry
+from arxiv_research_agent.services.search_cache import next_listing_time
+
+logger = logging.getLogger(__name__)
+
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+ResultKey = tuple[str, int, int]
+
+
+def normalize_research_query(query: str) -> str:
+    """Normalize a research query so trivially different phrasings match.
+
+    Applies Unicode compatibility folding, casefolds, drops punctuation and
+    collapses whitespace: "LLM agents?" and "llm  agents" share a key.
+    """
+    text = unicodedata.normalize("NFKC", query).casefold()
+    return " ".join(_PUNCTUATION.sub(" ", text).split())
+
+
+class ResultCache:
+    """Successful research results keyed by normalized request.
+
+    A request equivalent to one that produced a document within `ttl`
+    seconds gets that document back instead of a new run. Entries also
+    expire at the next arXiv listing, when new papers may change the answer.
+
+    Concurrent identical requests share one run: the first claims the key
+    and the rest wait for its response. If that run is abandoned (its
+    client disconnected) a waiter claims the key and runs it instead.
+    """
+
+    def __init__(self, ttl: float = 6 * 3600, max_entries: int = 256):
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: OrderedDict[ResultKey, tuple[ResearchResponse, float, float]] = OrderedDict()
+        self._inflight: dict[ResultKey, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+
+    @staticmethod
+    def key(request: ResearchRequest) -> ResultKey:
+        return (
+            normalize_research_query(request.query),
+            request.days_back,
+            request.max_papers,
+        )
+
+    def get(self, request: ResearchRequest) -> ResearchResponse | None:
+        """Return the cached response for an equivalent request, marked as cached."""
+        key = self.key(request)
+        entry = self._entries.get(key)
+        if entry is not None:
+            response, created_at, expires_at = entry
+            if expires_at > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                telemetry.count("cache_lookups", cache="result", result="hit")
+                return _as_cached(response, created_at)
+            del self._entries[key]
+
+        self.misses += 1
+        telemetry.count("cache_lookups", cache="result", result="miss")
+        return None
+
+    def claim(self, request: ResearchRequest) -> asyncio.Future | None:
+        """Claim the run for a request.
+
+        Returns None if the caller should run it, and must then call
+        `complete()`. Otherwise returns a future that resolves to the
+        response of the run already in flight, or to None if that run was
+        abandoned.
+        """
+        key = self.key(request)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.shared += 1
+            telemetry.count("cache_lookups", cache="result", result="shared")
+            return pending
+        self._inflight[key] = asyncio.get_running_loop().create_future()
+        return None
+
+    def complete(self, request: ResearchRequest, response: ResearchResponse | None) -> None:
+        """Finish a claimed run, caching its response if it succeeded.
+
+        Pass None when the run was abandoned before producing a response.
+        """
+        key = self.key(request)
+        now = time.time()
+
+        if response is not None and response.status == "success":
+            self._entries[key] = (response, now, min(now + self._ttl, next_listing_time(now)))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            shared = _as_cached(response, now)
+        elif response is not None:
+            # The session belongs to the run's own caller.
+            shared = response.model_copy(update={"session_id": None})
+        else:
+            shared = None
+
+        pending = self._inflight.pop(key, None)
+        if pending is not None and not pending.done():
+            pending.set_result(shared)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "shared": self.shared,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "in_flight": len(self._inflight),
+        }
+
+
+def _as_cached(response: ResearchResponse, created_at: float) -> ResearchResponse:
+    # The original run's timings don't describe this request, and its
+    # session stays with the caller that ran it: a follow-up from here would
+    # otherwise continue, or collide with, someone else's conversation.
+    return response.model_copy(
+        update={"cached": True, "cached_at": created_at, "timings": None, "session_id": None}
+    )
+
+
+_result_cache: ResultCache | None = None
+
+
+def get_result_cache() -> ResultCache | None:
+    """Return the process-wide result cache, or None when disabled."""
+    global _result_cache
+    if not settings.result_cache_enabled:
+        return None
+    if _result_cache is None:
+        _result_cache = ResultCache(
+            ttl=settings.result_cache_ttl,
+            max_entries=settings.result_cache_max_entries,
+        )
+    return _result_cache
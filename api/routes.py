@@ -1,20 +1,27 @@
 """API routes for the research agent."""
 
-from uuid import uuid4
+import json
+from typing import Literal
 
 from fastapi import APIRouter, HTTPException
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
-from google.genai import types
-
-from api.schemas import ResearchRequest, ResearchResponse
-from arxiv_research_agent.agent import research_agent
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+
+from api.batch import execute_batch
+from api.jobs import Job, QueueFullError, job_manager
+from api.research import execute_research, stream_research
+from api.schemas import (
+    BatchResearchRequest,
+    BatchResearchResponse,
+    JobStatus,
+    ResearchRequest,
+    ResearchResponse,
+)
+from api.sessions import SessionBusyError, SessionNotFoundError, research_sessions
 from arxiv_research_agent.config import settings
 
 router = APIRouter()
 
-APP_NAME = "arxiv-research-agent"
-
 
 @router.post("/research", response_model=ResearchResponse)
 async def run_research(request: ResearchRequest) -> ResearchResponse:
@@ -26,108 +33,109 @@ async def run_research(request: ResearchRequest) -> ResearchResponse:
     3. Synthesize findings into a document
     4. Save to surfacedocs and return the URL
     """
-    # Create a unique session for this request
-    user_id = "api_user"
-    session_id = str(uuid4())
-
-    # Set up session service and runner
-    session_service = InMemorySessionService()
-    await session_service.create_session(
-        app_name=APP_NAME,
-        user_id=user_id,
-        session_id=session_id,
-    )
-
-    runner = Runner(
-        agent=research_agent,
-        app_name=APP_NAME,
-        session_service=session_service,
-    )
-
-    # Build the user message with query and parameters
-    message_text = f"""Research query: {request.query}
-
-Parameters:
-- Search papers from the last {request.days_back} days
-- Analyze up to {request.max_papers} papers
-
-Please search arXiv, read relevant papers, and save a research summary document."""
-
-    content = types.Content(
-        role="user",
-        parts=[types.Part(text=message_text)],
-    )
-
-    # Run the agent and collect results
-    document_url = None
-    error_message = None
+    await _check_session(request)
+    return await execute_research(request)
 
-    try:
-        events = runner.run_async(
-            user_id=user_id,
-            session_id=session_id,
-            new_message=content,
-        )
 
-        async for event in events:
-            # Check for tool results containing the document URL
-            if hasattr(event, "tool_result") and event.tool_result:
-                result = event.tool_result
-                if isinstance(result, dict) and result.get("url"):
-                    document_url = result["url"]
-
-            # Alternative: Look for function call results in content parts
-            if hasattr(event, "content") and event.content:
-                for part in event.content.parts:
-                    # Check if this is a function response
-                    if hasattr(part, "function_response") and part.function_response:
-                        response = part.function_response
-                        if response.name == "save_document":
-                            result = response.response
-                            if isinstance(result, dict) and "url" in result:
-                                document_url = result["url"]
-
-            # Capture final response
-            if event.is_final_response():
-                # Agent has completed
-                pass
-
-    except Exception as e:
-        error_message = str(e)
-
-    # Get session state to extract metrics
-    session = await session_service.get_session(
-        app_name=APP_NAME,
-        user_id=user_id,
-        session_id=session_id,
-    )
-
-    state = session.state if session else {}
-    arxiv_calls_used = state.get("arxiv_calls_used", 0)
-    papers_read = state.get("papers_read", [])
-
-    if error_message:
-        return ResearchResponse(
-            status="error",
-            document_url=None,
-            papers_analyzed=len(papers_read),
-            arxiv_calls_used=arxiv_calls_used,
-            error=error_message,
-        )
+@router.post("/research/stream")
+async def stream_research_progress(
+    request: ResearchRequest,
+    format: Literal["sse", "ndjson"] = "sse",
+) -> StreamingResponse:
+    """Execute the research agent, streaming progress as it happens.
 
-    if not document_url:
-        return ResearchResponse(
-            status="completed",
-            document_url=None,
-            papers_analyzed=len(papers_read),
-            arxiv_calls_used=arxiv_calls_used,
-            error="Agent completed but no document was saved.",
+    Emits tool calls, search result counts, fetched papers and the saved
+    document URL, then a final "result" event with the ResearchResponse.
+    Disconnecting cancels the run.
+    """
+    await _check_session(request)
+    if format == "ndjson":
+        encode, media_type = _ndjson, "application/x-ndjson"
+    else:
+        encode, media_type = _sse, "text/event-stream"
+
+    async def event_stream():
+        events = stream_research(request)
+        try:
+            async for event in events:
+                yield encode(event)
+        finally:
+            await events.aclose()
+
+    return StreamingResponse(event_stream(), media_type=media_type)
+
+
+@router.post("/research/batch", response_model=BatchResearchResponse)
+async def run_research_batch(batch: BatchResearchRequest) -> BatchResearchResponse:
+    """Run several research queries, sharing searches and papers between them.
+
+    Results come back in request order. A run that fails, including a
+    follow-up for an unknown or busy session, is an error result rather
+    than failing the batch.
+    """
+    if len(batch.requests) > settings.batch_max_requests:
+        raise HTTPException(
+            status_code=422,
+            detail=f"A batch can have at most {settings.batch_max_requests} requests.",
         )
+    return await execute_batch(batch)
+
+
+@router.post("/research/jobs", response_model=JobStatus, status_code=202)
+async def submit_research_job(request: ResearchRequest) -> JobStatus:
+    """Queue a research run in the background and return its job id.
+
+    Poll `GET /research/{job_id}` or stream `GET /research/{job_id}/events`
+    for the result. Returns 429 when the queue is full.
+    """
+    await _check_session(request)
+    try:
+        job = await job_manager.submit(request)
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "30"})
+    return job.to_status()
+
+
+@router.get("/research/{job_id}", response_model=JobStatus)
+async def get_research_job(job_id: str) -> JobStatus:
+    """Return the status, and the result once finished, of a research job."""
+    return (await _get_job(job_id)).to_status()
+
+
+@router.get("/research/{job_id}/events")
+async def stream_research_job(job_id: str) -> StreamingResponse:
+    """Stream a research job's events as server-sent events."""
+    job = await _get_job(job_id)
+
+    async def event_stream():
+        async for event in job.stream():
+            yield _sse(event)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+async def _get_job(job_id: str) -> Job:
+    job = await job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found.")
+    return job
+
+
+async def _check_session(request: ResearchRequest) -> None:
+    """Reject a follow-up for a session that doesn't exist or is in use."""
+    if request.session_id is None:
+        return
+    try:
+        await research_sessions.check(request.session_id)
+    except SessionNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except SessionBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+
+def _sse(event: dict) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(jsonable_encoder(event))}\n\n"
+
 
-    return ResearchResponse(
-        status="success",
-        document_url=document_url,
-        papers_analyzed=len(papers_read),
-        arxiv_calls_used=arxiv_calls_used,
-        error=None,
-    )
+def _ndjson(event: dict) -> str:
+    return json.dumps(jsonable_encoder(event)) + "\n"
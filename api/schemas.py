@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -7,13 +9,84 @@ class ResearchRequest(BaseModel):
     query: str = Field(..., description="Research query or topic")
     max_papers: int = Field(default=10, ge=1, le=50)
     days_back: int = Field(default=7, ge=1, le=30)
+    session_id: str | None = Field(
+        default=None,
+        description="Continue an earlier research session, reusing its searches and papers",
+    )
+    use_cache: bool = Field(
+        default=True,
+        description="Return a recent equivalent run's result instead of running again",
+    )
+    deadline_seconds: float | None = Field(
+        default=None,
+        gt=0,
+        le=3600,
+        description="Time the run may take; past it the run stops with status 'partial'",
+    )
+
+
+class RunTimings(BaseModel):
+    """Where a research run's time went."""
+
+    total_seconds: float
+    phases: dict[str, float] = Field(
+        default_factory=dict,
+        description="Seconds per phase, e.g. llm_turn or tool.search_arxiv. Phases overlap.",
+    )
+    counts: dict[str, int] = Field(
+        default_factory=dict,
+        description="Model turns and tokens, cache lookups, and bytes and characters moved",
+    )
 
 
 class ResearchResponse(BaseModel):
     """Response from research agent."""
 
     status: str
+    session_id: str | None = None
     document_url: str | None = None
     papers_analyzed: int
+    papers_read: list[str] = Field(default_factory=list)
     arxiv_calls_used: int
     error: str | None = None
+    cached: bool = False
+    cached_at: float | None = None
+    timings: RunTimings | None = None
+
+
+class BatchResearchRequest(BaseModel):
+    """Request to run several research queries as one batch."""
+
+    requests: list[ResearchRequest] = Field(..., min_length=1)
+    concurrency: int | None = Field(
+        default=None,
+        ge=1,
+        le=32,
+        description="Runs in progress at once; defaults to the server's batch_concurrency",
+    )
+
+
+class BatchResearchResponse(BaseModel):
+    """Results of a research batch, in request order."""
+
+    results: list[ResearchResponse]
+    statuses: dict[str, int] = Field(
+        default_factory=dict,
+        description="Number of results with each status",
+    )
+    requests_per_second: float
+    timings: RunTimings = Field(
+        ...,
+        description="Wall-clock total_seconds, with phases and counts summed over the runs",
+    )
+
+
+class JobStatus(BaseModel):
+    """Status of a background research job."""
+
+    job_id: str
+    status: Literal["queued", "running", "completed", "failed"]
+    created_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+    result: ResearchResponse | None = None
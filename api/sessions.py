@@ -0,0 +1,255 @@
+"""Session storage and the Runner shared by every research run."""
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from arxiv_research_agent.config import settings
+
+# ADK and the agent take seconds to import, so they are loaded on a worker
+# thread after startup (see ResearchSessions.start) rather than on import.
+if TYPE_CHECKING:
+    from google.adk.runners import Runner
+    from google.adk.sessions import BaseSessionService
+
+logger = logging.getLogger(__name__)
+
+APP_NAME = "arxiv-research-agent"
+USER_ID = "api_user"
+
+# How often idle sessions are looked for, in seconds.
+PRUNE_INTERVAL = 300
+
+
+class SessionNotFoundError(Exception):
+    """Raised when a request continues a session that doesn't exist."""
+
+
+class SessionBusyError(Exception):
+    """Raised when a request continues a session that is already running."""
+
+
+class ResearchSessions:
+    """Owns the session service and the Runner shared by all requests.
+
+    Sessions outlive the run that created them, so a follow-up request can
+    continue one by id with earlier searches and papers still in its
+    history. One run at a time may use a session. Sessions idle for longer
+    than `ttl` seconds are deleted.
+
+    The runner, with the agent, is loaded in the background from `start()`;
+    session methods wait for it with `ready()`.
+    """
+
+    def __init__(self, backend: str = "memory", db_url: str | None = None, ttl: float = 86400):
+        self._backend = backend
+        self._db_url = db_url
+        self._ttl = ttl
+        self._service: "BaseSessionService | None" = None
+        self._runner: "Runner | None" = None
+        self._loading: asyncio.Task | None = None
+        self._active: set[str] = set()
+        self._last_prune = 0.0
+        self._pruning: asyncio.Task | None = None
+
+    @property
+    def service(self) -> "BaseSessionService":
+        if self._service is None:
+            self._load()
+        return self._service
+
+    @property
+    def runner(self) -> "Runner":
+        """The shared runner, loaded on first use if `start()` wasn't called."""
+        if self._runner is None:
+            self._load()
+        return self._runner
+
+    @property
+    def is_ready(self) -> bool:
+        return self._runner is not None
+
+    def start(self) -> None:
+        """Start loading the agent, session service and runner in the background.
+
+        Called on application startup, so the server accepts connections
+        (and answers /health) while ADK is still importing. A failed load
+        is retried on the next call.
+        """
+        if self._loading is None or (self._loading.done() and self._runner is None):
+            self._loading = asyncio.create_task(asyncio.to_thread(self._load))
+
+    async def ready(self) -> None:
+        """Wait until the runner is loaded, starting the load if needed."""
+        if self._runner is None:
+            self.start()
+            # Shielded so a cancelled request doesn't abandon the shared load.
+            await asyncio.shield(self._loading)
+
+    async def close(self) -> None:
+        """Release the runner. Called on application shutdown."""
+        if self._loading is not None and not self._loading.done():
+            await asyncio.wait([self._loading])
+        if self._pruning is not None:
+            self._pruning.cancel()
+            await asyncio.wait([self._pruning])
+        if self._runner is not None:
+            await self._runner.close()
+            self._runner = None
+
+    async def check(self, session_id: str) -> None:
+        """Check a session can be continued.
+
+        Raises:
+            SessionNotFoundError: If the session doesn't exist.
+            SessionBusyError: If a run is already using it.
+        """
+        await self.ready()
+        self._check_idle(session_id)
+        await self._check_exists(session_id)
+
+    async def open(self, session_id: str | None = None) -> str:
+        """Create a session, or claim an existing one, for a run.
+
+        Call `release()` when the run ends.
+
+        Raises:
+            SessionNotFoundError: If `session_id` doesn't exist.
+            SessionBusyError: If a run is already using `session_id`.
+        """
+        await self.ready()
+        self._schedule_prune()
+
+        if session_id is None:
+            session_id = await self._create()
+            self._active.add(session_id)
+            return session_id
+
+        # Claim before the first await so a concurrent follow-up on the same
+        # session sees it busy rather than both passing the check.
+        self._check_idle(session_id)
+        self._active.add(session_id)
+        try:
+            await self._check_exists(session_id)
+        except BaseException:
+            self._active.discard(session_id)
+            raise
+        return session_id
+
+    def _check_idle(self, session_id: str) -> None:
+        if session_id in self._active:
+            raise SessionBusyError(f"Session {session_id} already has a research run in progress.")
+
+    async def _check_exists(self, session_id: str) -> None:
+        session = await self.service.get_session(
+            app_name=APP_NAME, user_id=USER_ID, session_id=session_id
+        )
+        if session is None:
+            raise SessionNotFoundError(f"Session {session_id} not found.")
+
+    async def _create(self) -> str:
+        try:
+            session = await self.service.create_session(app_name=APP_NAME, user_id=USER_ID)
+        except Exception as e:
+            from sqlalchemy.exc import IntegrityError
+
+            # Worker processes sharing the database race to create the app's
+            # and user's state rows on their first sessions; the loser's
+            # retry finds them.
+            if self._backend != "database" or not isinstance(e, IntegrityError):
+                raise
+            session = await self.service.create_session(app_name=APP_NAME, user_id=USER_ID)
+        return session.id
+
+    def release(self, session_id: str) -> None:
+        self._active.discard(session_id)
+
+    async def get_state(self, session_id: str) -> dict:
+        await self.ready()
+        session = await self.service.get_session(
+            app_name=APP_NAME, user_id=USER_ID, session_id=session_id
+        )
+        return dict(session.state) if session else {}
+
+    def _schedule_prune(self) -> None:
+        """Start a background prune if PRUNE_INTERVAL has passed since the last.
+
+        Listing and deleting every session is slow with the database backend,
+        so it never runs on the request that triggers it.
+        """
+        now = time.time()
+        if now - self._last_prune < PRUNE_INTERVAL:
+            return
+        if self._pruning is not None and not self._pruning.done():
+            return
+        self._last_prune = now
+        self._pruning = asyncio.create_task(self._prune(now))
+        self._pruning.add_done_callback(self._pruned)
+
+    @staticmethod
+    def _pruned(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("⚠️ Session prune failed: %s", task.exception())
+
+    async def _prune(self, now: float) -> None:
+        """Delete sessions idle past the TTL."""
+        response = await self.service.list_sessions(app_name=APP_NAME, user_id=USER_ID)
+        expired = [
+            s.id
+            for s in response.sessions
+            if now - s.last_update_time > self._ttl and s.id not in self._active
+        ]
+        for session_id in expired:
+            await self.service.delete_session(
+                app_name=APP_NAME, user_id=USER_ID, session_id=session_id
+            )
+        if expired:
+            logger.info("🧹 Deleted %d idle sessions", len(expired))
+
+    def _load(self) -> None:
+        """Import ADK and the agent, and build the session service and runner."""
+        started = time.perf_counter()
+        from google.adk.runners import Runner
+
+        from arxiv_research_agent.agent import research_agent
+
+        service = self._build_service()
+        runner = Runner(agent=research_agent, app_name=APP_NAME, session_service=service)
+        # The service first: is_ready checks the runner, and another thread
+        # may read the service as soon as it is true.
+        self._service = service
+        self._runner = runner
+        logger.info(
+            "🗃️ Agent and session service ready (%s) in %.1fs",
+            self._backend, time.perf_counter() - started,
+        )
+
+    def _build_service(self) -> "BaseSessionService":
+        from google.adk.sessions import DatabaseSessionService, InMemorySessionService
+
+        if self._backend == "memory":
+            return InMemorySessionService()
+
+        # SQLite creates the database file but not its directory.
+        scheme, _, path = self._db_url.partition(":///")
+        if scheme.startswith("sqlite") and path and path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        try:
+            return DatabaseSessionService(db_url=self._db_url)
+        except Exception as e:
+            from sqlalchemy.exc import OperationalError
+
+            # Worker processes starting together race to create the tables;
+            # the loser's retry finds them.
+            if not isinstance(e, OperationalError):
+                raise
+            return DatabaseSessionService(db_url=self._db_url)
+
+
+research_sessions = ResearchSessions(
+    backend=settings.session_backend,
+    db_url=settings.session_db_url,
+    ttl=settings.session_ttl,
+)
@@ -3,7 +3,13 @@
 from google.adk.agents import Agent
 from surfacedocs import SYSTEM_PROMPT as SURFACEDOCS_SCHEMA
 
-from arxiv_research_agent.tools import search_arxiv, fetch_paper_content, save_document
+from arxiv_research_agent.callbacks import after_model, after_tool, before_model, before_tool
+from arxiv_research_agent.tools import (
+    search_arxiv,
+    fetch_paper_content,
+    fetch_papers,
+    save_document,
+)
 
 AGENT_INSTRUCTION = f"""You are a research assistant that finds and summarizes academic papers from arXiv.
 
@@ -11,15 +17,16 @@ Your goal: Given a research query, search for relevant papers, read the most pro
 
 ## Tools Available
 
-1. **search_arxiv** - Search for papers by keywords/topics. You have a maximum of 5 searches, so be strategic.
-2. **fetch_paper_content** - Read the full text of a specific paper. Use for papers that seem highly relevant.
-3. **save_document** - Save your final research summary. Call this once at the end.
+1. **search_arxiv** - Search for papers by keywords/topics. You have a maximum of 5 searches, so be strategic. Pass related phrasings in additional_queries to cover them in a single search.
+2. **fetch_paper_content** - Read a specific paper, most important sections first. Use for papers that seem highly relevant. If the response has a `next_cursor`, you can call again with that cursor (or with specific `sections`) to read more, but only when you need the detail.
+3. **fetch_papers** - Read several papers at once, in parallel. Prefer this when you already know which papers you want.
+4. **save_document** - Save your final research summary. Call this once at the end.
 
 ## Strategy
 
 1. Start with a broad search on the main topic
 2. Review abstracts to identify the most relevant papers
-3. Fetch full content for 2-4 key papers that seem most important
+3. Fetch full content for 2-4 key papers that seem most important, ideally in one fetch_papers call
 4. If needed, do a more targeted follow-up search based on what you learned
 5. Synthesize findings into a well-structured document
 
@@ -43,6 +50,7 @@ Always include links to the arXiv papers you reference. Use the arXiv abstract U
 - Focus on recent developments and novel contributions
 - Connect findings to practical implications when possible
 - Always save your document at the end, even if you found limited results
+- Tool results include `seconds_left`, the time left for searching and reading. When it runs low, or a tool says you are out of time, stop and save your document with what you have
 
 ## Surfacedocs Document Format
 
@@ -54,5 +62,9 @@ research_agent = Agent(
     model="gemini-3-pro-preview",
     description="Research agent that searches arXiv and produces summary documents.",
     instruction=AGENT_INSTRUCTION,
-    tools=[search_arxiv, fetch_paper_content, save_document],
+    tools=[search_arxiv, fetch_paper_content, fetch_papers, save_document],
+    before_model_callback=before_model,
+    after_model_callback=after_model,
+    before_tool_callback=before_tool,
+    after_tool_callback=after_tool,
 )
@@ -0,0 +1,79 @@
+"""ADK callbacks timing model calls and tool calls for telemetry.
+
+The model callback also puts stored paper text back into each request.
+"""
+
+import asyncio
+import json
+import time
+from typing import Any
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
+from google.adk.tools import BaseTool, ToolContext
+
+from arxiv_research_agent.services import telemetry
+from arxiv_research_agent.tools.arxiv import materialize_paper_text
+
+# Start times live in "temp:" state, which ADK keeps on the event being
+# built and never writes to the session: the model callbacks share the
+# model response event's actions and the tool callbacks share one
+# ToolContext, so nothing outlives a call that raises or is cancelled.
+MODEL_STARTED_KEY = "temp:llm_turn_started"
+TOOL_STARTED_KEY = "temp:tool_started"
+
+
+async def before_model(callback_context: CallbackContext, llm_request: LlmRequest) -> None:
+    # Request contents are copies of the session events; the session keeps
+    # the references. Evicted text is re-read concurrently, within the run.
+    deadline = callback_context.state.get("deadline")
+    responses = [
+        part.function_response
+        for content in llm_request.contents
+        for part in content.parts or []
+        if part.function_response is not None and part.function_response.response
+    ]
+    await asyncio.gather(*(
+        materialize_paper_text(response.name, response.response, deadline)
+        for response in responses
+    ))
+    callback_context.state[MODEL_STARTED_KEY] = time.perf_counter()
+
+
+def after_model(callback_context: CallbackContext, llm_response: LlmResponse) -> None:
+    if llm_response.partial:
+        return None
+
+    started = callback_context.state.get(MODEL_STARTED_KEY)
+    if started is not None:
+        telemetry.observe_seconds("llm_turn", time.perf_counter() - started)
+        telemetry.count("llm_turns")
+
+    usage = llm_response.usage_metadata
+    if usage is not None:
+        telemetry.count("llm_tokens", usage.prompt_token_count or 0, kind="prompt")
+        telemetry.count("llm_tokens", usage.candidates_token_count or 0, kind="output")
+    return None
+
+
+def before_tool(tool: BaseTool, args: dict[str, Any], tool_context: ToolContext) -> None:
+    tool_context.state[TOOL_STARTED_KEY] = time.perf_counter()
+
+
+def after_tool(
+    tool: BaseTool,
+    args: dict[str, Any],
+    tool_context: ToolContext,
+    tool_response: dict,
+) -> None:
+    started = tool_context.state.get(TOOL_STARTED_KEY)
+    if started is not None:
+        telemetry.observe_seconds("tool", time.perf_counter() - started, tool=tool.name)
+    # What the model has to read back, as it is serialized into the prompt,
+    # counting paper text held in the text store.
+    chars = len(json.dumps(tool_response, default=str))
+    for payload in tool_response.get("papers") or [tool_response]:
+        if isinstance(payload, dict) and "sections_ref" in payload:
+            chars += payload["sections_ref"]["chars"]
+    telemetry.record_size("tool_result_chars", chars, tool=tool.name)
+    return None
@@ -1,13 +1,26 @@
+from pathlib import Path
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
-    # Google AI
-    google_api_key: str
+    # Google AI. Required to run research, but optional here so the app can
+    # be imported without it; /ready reports it missing.
+    google_api_key: str | None = None
 
     # Surfacedocs
-    surfacedocs_api_key: str
+    surfacedocs_api_key: str | None = None
     surfacedocs_folder_id: str | None = None
+    surfacedocs_base_url: str | None = None
+    surfacedocs_max_retries: int = 3
+    surfacedocs_retry_backoff: float = 0.5
+    surfacedocs_timeout: float = 30.0
+
+    # Upstream URLs, overridable to point at a local stand-in
+    arxiv_api_url: str = "https://export.arxiv.org/api/query"
+    arxiv_html_base_url: str = "https://arxiv.org/html"
+    ar5iv_html_base_url: str = "https://ar5iv.org/html"
 
     # Agent settings
     max_arxiv_calls: int = 5
@@ -17,7 +30,119 @@ class Settings(BaseSettings):
     # ArXiv categories to search
     arxiv_categories: list[str] = ["cs.AI", "cs.LG", "cs.CL", "cs.MA"]
 
+    # Process-wide pacing of arXiv API requests
+    arxiv_rate_limit_interval: float = 3.0
+    arxiv_rate_limit_burst: int = 1
+
+    # Search paging and multi-query searches
+    arxiv_page_size: int = 50
+    arxiv_max_pages: int = 4
+    search_max_queries: int = 4
+
+    # Fields search_arxiv returns per paper
+    search_result_fields: list[
+        Literal["id", "title", "abstract", "authors", "published", "url", "pdf_url", "categories"]
+    ] = ["id", "title", "abstract", "authors", "published"]
+    search_abstract_chars: int = 300
+    search_max_authors: int = 3
+
+    # Local relevance ranking of search results
+    search_rank_enabled: bool = True
+    search_rank_candidates: int = 30
+    search_rank_top_k: int = 10
+
+    # Shared HTTP client pool
+    http2_enabled: bool = True
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 30.0
+    http_timeout: float = 30.0
+
+    # Budgeted paper reads
+    paper_max_chars: int = 20000
+    paper_chunk_chars: int = 4000
+
+    # Batch paper fetches
+    paper_batch_max_chars: int = 10000
+    fetch_batch_max_papers: int = 6
+    fetch_concurrency: int = 4
+    fetch_race_sources: bool = False
+    fetch_hedge_after: float | None = 3.0
+
+    # Paper content cache
+    paper_cache_enabled: bool = True
+    paper_cache_path: str = ".cache/papers.sqlite3"
+    paper_cache_max_bytes: int = 512 * 1024 * 1024
+    paper_cache_unversioned_ttl: float = 24 * 3600
+
+    # Compressed store of paper text referenced from session histories;
+    # max bytes is the per-worker ceiling on compressed text
+    text_store_enabled: bool = True
+    text_store_max_bytes: int = 64 * 1024 * 1024
+
+    # Search result cache
+    search_cache_enabled: bool = True
+    search_cache_ttl: float = 6 * 3600
+    search_cache_max_entries: int = 256
+    search_cache_align_to_listing: bool = True
+    search_cache_path: str | None = None
+
+    # Local metadata index
+    metadata_index_enabled: bool = False
+    metadata_index_path: str = ".cache/metadata.sqlite3"
+    metadata_index_days: int = 30
+    metadata_index_max_age: float = 6 * 3600
+    metadata_harvest_interval: float = 3600
+
+    # Parsing worker pools
+    parse_executor_workers: int = 4
+    html_executor_kind: Literal["thread", "process"] = "thread"
+    html_executor_workers: int = 2
+
+    # Background research jobs
+    job_workers: int = 2
+    job_queue_size: int = 20
+    job_ttl: float = 3600
+    job_poll_interval: float = 0.5
+    job_lease: float = 30.0
+
+    # Batch research
+    batch_max_requests: int = 200
+    batch_concurrency: int = 4
+    batch_cache_max_chars: int = 32 * 1024 * 1024
+
+    # Startup
+    warmup_connections: bool = False
+
+    # Research sessions
+    session_backend: Literal["memory", "database"] = "memory"
+    session_db_url: str = "sqlite:///.cache/sessions.sqlite3"
+    session_ttl: float = 24 * 3600
+
+    # Per-run deadlines
+    research_deadline: float = 600
+    research_finish_reserve: float = 60
+
+    # Multi-worker deployment: worker processes on one host share arXiv
+    # pacing, the job queue and the search cache through SQLite files here,
+    # and one of them harvests the metadata index
+    multi_worker: bool = False
+    shared_state_dir: str = ".cache/shared"
+
+    # Cross-run research result cache
+    result_cache_enabled: bool = True
+    result_cache_ttl: float = 6 * 3600
+    result_cache_max_entries: int = 256
+
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
+    def missing_keys(self) -> list[str]:
+        """Names of the required API keys that aren't set."""
+        return [name for name in ("google_api_key", "surfacedocs_api_key") if not getattr(self, name)]
+
+    def shared_state_path(self, filename: str) -> str:
+        """Path of a file shared by the worker processes in multi-worker mode."""
+        return str(Path(self.shared_state_dir) / filename)
+
 
 settings = Settings()
@@ -1,10 +1,16 @@
+from dataclasses import asdict, dataclass
 from datetime import datetime
 
 from pydantic import BaseModel
 
 
-class Paper(BaseModel):
-    """ArXiv paper metadata."""
+@dataclass(slots=True)
+class Paper:
+    """ArXiv paper metadata.
+
+    A slotted dataclass rather than a pydantic model: papers are built in
+    bulk while parsing feeds and only leave the process as tool output.
+    """
 
     id: str
     title: str
@@ -15,13 +21,41 @@ class Paper(BaseModel):
     pdf_url: str
     categories: list[str]
 
+    def to_dict(self) -> dict:
+        """Return a JSON-serializable dict of the paper."""
+        data = asdict(self)
+        data["published"] = self.published.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Paper":
+        """Build a paper from the output of to_dict."""
+        return cls(**{**data, "published": datetime.fromisoformat(data["published"])})
+
+
+class PaperSection(BaseModel):
+    """A top-level section of a paper."""
+
+    title: str
+    content: str
+
 
 class PaperContent(BaseModel):
-    """Full paper content from HTML."""
+    """Full paper content from HTML, split into sections."""
 
     paper_id: str
     title: str
-    content: str  # Cleaned text from HTML
+    abstract: str = ""
+    sections: list[PaperSection] = []
+    references: list[str] = []
+
+    @property
+    def content(self) -> str:
+        """Cleaned text of the abstract and all sections, without references."""
+        parts = [self.abstract] if self.abstract else []
+        for section in self.sections:
+            parts.append(f"{section.title} {section.content}".strip())
+        return " ".join(parts)
 
 
 class SearchResult(BaseModel):
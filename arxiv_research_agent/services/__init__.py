@@ -1,4 +1,63 @@
 from arxiv_research_agent.services.arxiv_client import ArxivClient
+from arxiv_research_agent.services.executor import (
+    ParseExecutor,
+    get_html_executor,
+    get_parse_executor,
+    shutdown_executors,
+)
+from arxiv_research_agent.services.http_client import (
+    close_http_client,
+    get_http_client,
+    start_http_client,
+    warm_up_connections,
+)
+from arxiv_research_agent.services.metadata_harvester import (
+    MetadataHarvester,
+    get_metadata_harvester,
+)
+from arxiv_research_agent.services.metadata_index import MetadataIndex, get_metadata_index
+from arxiv_research_agent.services.paper_cache import PaperCache, get_paper_cache
 from arxiv_research_agent.services.paper_fetcher import PaperFetcher
+from arxiv_research_agent.services.rate_limiter import (
+    SharedTokenBucketLimiter,
+    SingleFlight,
+    TokenBucketLimiter,
+    get_arxiv_rate_limiter,
+)
+from arxiv_research_agent.services.search_cache import SearchCache, get_search_cache
+from arxiv_research_agent.services.surfacedocs_publisher import (
+    DocumentPublisher,
+    close_publisher,
+    get_publisher,
+)
+from arxiv_research_agent.services.text_store import TextStore, get_text_store
 
-__all__ = ["ArxivClient", "PaperFetcher"]
+__all__ = [
+    "ArxivClient",
+    "DocumentPublisher",
+    "MetadataHarvester",
+    "MetadataIndex",
+    "PaperCache",
+    "PaperFetcher",
+    "ParseExecutor",
+    "SearchCache",
+    "SharedTokenBucketLimiter",
+    "SingleFlight",
+    "TextStore",
+    "TokenBucketLimiter",
+    "close_http_client",
+    "close_publisher",
+    "get_arxiv_rate_limiter",
+    "get_html_executor",
+    "get_http_client",
+    "get_metadata_harvester",
+    "get_metadata_index",
+    "get_paper_cache",
+    "get_parse_executor",
+    "get_publisher",
+    "get_search_cache",
+    "get_text_store",
+    "shutdown_executors",
+    "start_http_client",
+    "warm_up_connections",
+]
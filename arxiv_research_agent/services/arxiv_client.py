@@ -1,11 +1,25 @@
 """ArXiv API client for searching research papers."""
 
+import asyncio
+import logging
+from urllib.parse import urlencode
+
 import httpx
-import feedparser
 from datetime import datetime, timedelta, timezone
 
 from arxiv_research_agent.models import Paper
 from arxiv_research_agent.config import settings
+from arxiv_research_agent.services.atom_parser import AtomFeedParser
+from arxiv_research_agent.services.batch_cache import current_batch
+from arxiv_research_agent.services.deadline import remaining, trim_timeout
+from arxiv_research_agent.services.executor import ParseExecutor
+from arxiv_research_agent.services.http_client import get_http_client
+from arxiv_research_agent.services.metadata_index import MetadataIndex
+from arxiv_research_agent.services.rate_limiter import SingleFlight, TokenBucketLimiter
+from arxiv_research_agent.services.search_cache import SearchCache, normalize_query
+from arxiv_research_agent.services import telemetry
+
+logger = logging.getLogger(__name__)
 
 ARXIV_API_URL = "https://export.arxiv.org/api/query"
 
@@ -13,8 +27,28 @@ ARXIV_API_URL = "https://export.arxiv.org/api/query"
 class ArxivClient:
     """Client for fetching papers from arXiv API."""
 
-    def __init__(self, timeout: float = 30.0):
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        http_client: httpx.AsyncClient | None = None,
+        cache: SearchCache | None = None,
+        executor: ParseExecutor | None = None,
+        rate_limiter: TokenBucketLimiter | None = None,
+        index: MetadataIndex | None = None,
+        page_size: int = 50,
+        max_pages: int = 4,
+        api_url: str = ARXIV_API_URL,
+    ):
         self._timeout = timeout
+        self._api_url = api_url
+        self._http_client = http_client
+        self._cache = cache
+        self._executor = executor
+        self._rate_limiter = rate_limiter
+        self._index = index
+        self._page_size = page_size
+        self._max_pages = max_pages
+        self._single_flight = SingleFlight("arxiv_search")
         self._categories = settings.arxiv_categories
 
     async def search(
@@ -22,25 +56,197 @@ class ArxivClient:
         query: str,
         days_back: int = 7,
         max_results: int = 20,
+        deadline: float | None = None,
     ) -> list[Paper]:
         """Search arXiv for papers matching query.
 
+        Answered from the local metadata index when it is fresh and has
+        matches. Otherwise results are paged from the API newest first until
+        `max_results` papers from the window are collected or the listing
+        passes the `days_back` cutoff. Within a research batch, a search
+        the batch already ran is answered from the batch.
+
         Args:
             query: Search query (supports arXiv query syntax).
             days_back: Only return papers from last N days.
             max_results: Maximum papers to return.
+            deadline: Wall-clock time by which to stop waiting; TimeoutError
+                      is raised past it. An upstream search other callers
+                      share carries on and fills the cache.
 
         Returns:
-            List of Paper objects.
+            List of Paper objects, newest first.
         """
         search_query = self._build_query(query)
-        url = self._build_url(search_query, max_results)
+        key = (normalize_query(search_query), max_results, days_back)
+
+        batch = current_batch()
+        if batch is not None:
+            papers = batch.get_search(key)
+            telemetry.count("cache_lookups", cache="batch_search", result="miss" if papers is None else "hit")
+            if papers is not None:
+                logger.info("💾 Batch already ran query '%s'", query)
+                return papers
+
+        papers = await self._search(query, search_query, key, days_back, max_results, deadline)
+        if batch is not None:
+            batch.put_search(key, papers)
+        return papers
+
+    async def search_many(
+        self,
+        queries: list[str],
+        days_back: int = 7,
+        max_results: int = 20,
+        deadline: float | None = None,
+    ) -> list[Paper]:
+        """Run several searches concurrently and merge the results.
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.get(url)
-            response.raise_for_status()
+        Papers found by more than one query appear once. Requests still go
+        through the shared rate limiter, so concurrency here overlaps
+        parsing and waiting rather than exceeding arXiv's pacing.
+
+        Args:
+            queries: Search queries (supports arXiv query syntax).
+            days_back: Only return papers from last N days.
+            max_results: Maximum papers to return in total.
+            deadline: Wall-clock time by which to stop, as for search().
+
+        Returns:
+            Deduplicated list of Paper objects, newest first.
+        """
+        results = await asyncio.gather(
+            *(self.search(q, days_back, max_results, deadline) for q in queries)
+        )
+
+        merged: dict[str, Paper] = {}
+        for papers in results:
+            for paper in papers:
+                merged.setdefault(paper.id, paper)
+
+        papers = sorted(merged.values(), key=lambda p: p.published, reverse=True)
+        return papers[:max_results]
+
+    async def _search(
+        self,
+        query: str,
+        search_query: str,
+        key: tuple,
+        days_back: int,
+        max_results: int,
+        deadline: float | None,
+    ) -> list[Paper]:
+        """Answer a search from the caches, the metadata index or the API."""
+        since = datetime.now(timezone.utc) - timedelta(days=days_back)
 
-        return self._parse_response(response.text, days_back)
+        if self._cache is not None:
+            papers = await asyncio.to_thread(self._cache.get, search_query, max_results, since)
+            telemetry.count("cache_lookups", cache="search", result="miss" if papers is None else "hit")
+            if papers is not None:
+                logger.info("💾 Search cache hit for query '%s'", query)
+                return papers
+
+        if self._index is not None:
+            papers = await asyncio.to_thread(self._index.search, query, since, max_results)
+            telemetry.count("cache_lookups", cache="metadata_index", result="hit" if papers else "miss")
+            if papers:
+                logger.info("🗂️ Metadata index answered query '%s'", query)
+                return papers
+
+        # Identical searches already in flight share one upstream request.
+        # Callers may have different deadlines, so it runs without one and
+        # each caller waits only for its own time left.
+        papers = await asyncio.wait_for(
+            self._single_flight.do(key, lambda: self._fetch(search_query, max_results, since)),
+            remaining(deadline),
+        )
+        return self._filter_recent(papers, since)[:max_results]
+
+    async def _fetch(self, search_query: str, max_results: int, since: datetime) -> list[Paper]:
+        """Page through results until enough recent papers are found.
+
+        Stops at the first page that reaches past `since` (results are
+        sorted by submission date), when the listing runs out, or after
+        `max_pages` pages. The fetched papers are cached with how far back
+        the listing was read.
+        """
+        papers: list[Paper] = []
+        start = 0
+        exhausted = False
+
+        for page in range(self._max_pages):
+            page_size = min(self._page_size, max_results - len(papers))
+            page_papers, entries = await self.fetch_page(search_query, start, page_size, since)
+            papers.extend(page_papers)
+            start += entries
+
+            # Everything before the last paper is recent until this trips.
+            # Checked first: the parser stops reading at the cutoff, so a
+            # short page doesn't mean the listing ran out.
+            if papers and papers[-1].published < since:
+                break
+            if entries < page_size:
+                exhausted = True
+                break
+            if len(papers) >= max_results:
+                break
+
+        if page > 0:
+            logger.info("📑 Paged %d result pages for query '%s'", page + 1, search_query)
+
+        if self._cache is not None:
+            covered_since = 0.0 if exhausted or not papers else papers[-1].published.timestamp()
+            await asyncio.to_thread(self._cache.put, search_query, papers, covered_since)
+        return papers
+
+    async def fetch_page(
+        self,
+        search_query: str,
+        start: int,
+        page_size: int,
+        since: datetime | None = None,
+        deadline: float | None = None,
+    ) -> tuple[list[Paper], int]:
+        """Request and parse one page of results, newest first.
+
+        The response is parsed as it streams in. With `since`, reading stops
+        at the first paper older than it, which is included in the result.
+
+        Returns the parsed papers and the number of feed entries read,
+        which can exceed the paper count if some entries fail to parse.
+
+        With `deadline`, neither the rate limiter wait nor the request may
+        run past it; TimeoutError is raised when they would.
+        """
+        url = self._build_url(search_query, page_size, start)
+
+        if self._rate_limiter is not None:
+            waited = await asyncio.wait_for(self._rate_limiter.acquire(), remaining(deadline))
+            telemetry.observe_seconds("arxiv_rate_limit_wait", waited)
+            if waited > 0.1:
+                logger.info("⏳ Waited %.1fs for arXiv rate limiter", waited)
+
+        parser = AtomFeedParser(since)
+        papers: list[Paper] = []
+        client = self._http_client or get_http_client()
+        with telemetry.span("arxiv_request"):
+            timeout = trim_timeout(self._timeout, deadline)
+            async with client.stream("GET", url, timeout=timeout) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    papers.extend(await self._parse(parser.feed, chunk))
+                    if parser.done:
+                        break
+                else:
+                    papers.extend(await self._parse(parser.close))
+            telemetry.record_size("arxiv_response_bytes", response.num_bytes_downloaded)
+        return papers, parser.entries
+
+    async def _parse(self, fn, *args) -> list[Paper]:
+        """Run a parser step on the parse pool, or inline without one."""
+        if self._executor is not None:
+            return await self._executor.run("parse_feed", fn, *args)
+        return fn(*args)
 
     def _build_query(self, query: str) -> str:
         """Build arXiv query with category filters."""
@@ -50,54 +256,17 @@ class ArxivClient:
             return f"({query}) AND {cat_query}"
         return cat_query
 
-    def _build_url(self, search_query: str, max_results: int) -> str:
+    def _build_url(self, search_query: str, max_results: int, start: int = 0) -> str:
         """Build full API URL."""
         params = {
             "search_query": search_query,
-            "start": 0,
+            "start": start,
             "max_results": max_results,
             "sortBy": "submittedDate",
             "sortOrder": "descending",
         }
-        query_string = "&".join(f"{k}={v}" for k, v in params.items())
-        return f"{ARXIV_API_URL}?{query_string}"
-
-    def _parse_response(self, xml_content: str, days_back: int) -> list[Paper]:
-        """Parse Atom feed response into Paper objects."""
-        feed = feedparser.parse(xml_content)
-        papers = []
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_back)
-
-        for entry in feed.entries:
-            paper = self._parse_entry(entry)
-            if paper and paper.published >= cutoff_date:
-                papers.append(paper)
-
-        return papers
+        return f"{self._api_url}?{urlencode(params)}"
 
-    def _parse_entry(self, entry) -> Paper | None:
-        """Parse single feed entry into Paper."""
-        try:
-            arxiv_id = entry.id.split("/abs/")[-1]
-            published = datetime(*entry.published_parsed[:6], tzinfo=timezone.utc)
-            authors = [a.get("name", "") for a in entry.get("authors", [])]
-            categories = [t.get("term", "") for t in entry.get("tags", [])]
-
-            pdf_url = ""
-            for link in entry.get("links", []):
-                if link.get("type") == "application/pdf":
-                    pdf_url = link.get("href", "")
-                    break
-
-            return Paper(
-                id=arxiv_id,
-                title=" ".join(entry.title.split()),
-                abstract=" ".join(entry.summary.split()),
-                authors=authors,
-                published=published,
-                url=entry.link,
-                pdf_url=pdf_url,
-                categories=categories,
-            )
-        except (KeyError, AttributeError, ValueError):
-            return None
+    def _filter_recent(self, papers: list[Paper], since: datetime) -> list[Paper]:
+        """Keep only papers published since the cutoff."""
+        return [p for p in papers if p.published >= since]
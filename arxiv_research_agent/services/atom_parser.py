@@ -0,0 +1,110 @@
+"""Incremental parser for arXiv API Atom feeds."""
+
+from datetime import datetime
+from xml.etree import ElementTree
+
+from arxiv_research_agent.models import Paper
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+_ENTRY = f"{ATOM}entry"
+_ID = f"{ATOM}id"
+_PUBLISHED = f"{ATOM}published"
+_TITLE = f"{ATOM}title"
+_SUMMARY = f"{ATOM}summary"
+_AUTHOR = f"{ATOM}author"
+_NAME = f"{ATOM}name"
+_LINK = f"{ATOM}link"
+_CATEGORY = f"{ATOM}category"
+
+FEED_SLICE_BYTES = 64 * 1024
+
+
+class AtomFeedParser:
+    """Parse an Atom feed from raw bytes, yielding papers as entries close.
+
+    Feed bytes as they arrive with `feed()`, which returns the papers whose
+    entries completed in that chunk, then call `close()`. Each entry is
+    dropped from the tree once parsed, so memory stays flat however large
+    the response is.
+
+    When `since` is given, parsing stops at the first paper published
+    before it (results are sorted newest first). That paper is still
+    returned so callers can see the cutoff was crossed; `done` is then set
+    and further input is ignored.
+    """
+
+    def __init__(self, since: datetime | None = None):
+        self._since = since
+        self._parser = ElementTree.XMLPullParser(events=("start", "end"))
+        self._root: ElementTree.Element | None = None
+        self.entries = 0
+        self.done = False
+
+    def feed(self, data: bytes) -> list[Paper]:
+        if self.done:
+            return []
+        self._parser.feed(data)
+        return self._drain()
+
+    def close(self) -> list[Paper]:
+        if self.done:
+            return []
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> list[Paper]:
+        papers = []
+        for event, elem in self._parser.read_events():
+            if self._root is None:
+                self._root = elem
+            if event != "end" or elem.tag != _ENTRY:
+                continue
+
+            self.entries += 1
+            paper = parse_entry(elem)
+            self._root.remove(elem)
+            if paper is None:
+                continue
+
+            papers.append(paper)
+            if self._since is not None and paper.published < self._since:
+                self.done = True
+                break
+        return papers
+
+
+def parse_feed(xml: bytes | str, since: datetime | None = None) -> tuple[list[Paper], int]:
+    """Parse a whole feed. Returns the papers and the number of entries read."""
+    parser = AtomFeedParser(since)
+    data = xml.encode("utf-8") if isinstance(xml, str) else xml
+    papers = []
+    # Fed in slices so parsed entries are freed as we go, like a stream.
+    for offset in range(0, len(data), FEED_SLICE_BYTES):
+        papers.extend(parser.feed(data[offset:offset + FEED_SLICE_BYTES]))
+    papers.extend(parser.close())
+    return papers, parser.entries
+
+
+def parse_entry(entry: ElementTree.Element) -> Paper | None:
+    """Parse a single <entry> element, or return None if it's malformed."""
+    try:
+        url = ""
+        pdf_url = ""
+        for link in entry.iter(_LINK):
+            if link.get("type") == "application/pdf":
+                pdf_url = link.get("href", "")
+            elif link.get("rel", "alternate") == "alternate" and not url:
+                url = link.get("href", "")
+
+        return Paper(
+            id=entry.findtext(_ID).split("/abs/")[-1],
+            title=" ".join(entry.findtext(_TITLE).split()),
+            abstract=" ".join(entry.findtext(_SUMMARY).split()),
+            authors=[a.findtext(_NAME, "") for a in entry.iter(_AUTHOR)],
+            published=datetime.fromisoformat(entry.findtext(_PUBLISHED)),
+            url=url,
+            pdf_url=pdf_url,
+            categories=[c.get("term", "") for c in entry.iter(_CATEGORY)],
+        )
+    except (AttributeError, TypeError, ValueError):
+        return None
@@ -0,0 +1,98 @@
+"""Papers and searches shared between the runs of one research batch.
+
+Runs started inside `batch_scope()` share an in-memory map of the papers
+they read and the searches they made, so topics in a batch that overlap
+download each paper and run each search once, however the persistent
+caches are configured. Entries live only as long as the batch, and paper
+text is bounded: past the limit the least recently read papers are
+dropped and come from the paper cache, or are downloaded again, if a
+later run wants them.
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Hashable, Iterator
+
+from arxiv_research_agent.config import settings
+from arxiv_research_agent.models import Paper, PaperContent
+
+
+class BatchCache:
+    """Work done so far by one batch's runs.
+
+    Papers are kept in an LRU holding at most `max_paper_chars` characters
+    of text, so a large batch doesn't keep every paper it read in memory.
+    """
+
+    def __init__(self, max_paper_chars: int = 32 * 1024 * 1024):
+        self._max_paper_chars = max_paper_chars
+        self._papers: OrderedDict[str, tuple[PaperContent, int]] = OrderedDict()
+        self._paper_chars = 0
+        self._searches: dict[Hashable, list[Paper]] = {}
+        self.evictions = 0
+
+    def get_paper(self, arxiv_id: str) -> PaperContent | None:
+        entry = self._papers.get(arxiv_id)
+        if entry is None:
+            return None
+        self._papers.move_to_end(arxiv_id)
+        return entry[0]
+
+    def put_paper(self, arxiv_id: str, content: PaperContent) -> None:
+        size = _text_size(content)
+        previous = self._papers.pop(arxiv_id, None)
+        if previous is not None:
+            self._paper_chars -= previous[1]
+        self._papers[arxiv_id] = (content, size)
+        self._paper_chars += size
+        while self._paper_chars > self._max_paper_chars and len(self._papers) > 1:
+            _, (_, evicted) = self._papers.popitem(last=False)
+            self._paper_chars -= evicted
+            self.evictions += 1
+
+    def get_search(self, key: Hashable) -> list[Paper] | None:
+        papers = self._searches.get(key)
+        return None if papers is None else list(papers)
+
+    def put_search(self, key: Hashable, papers: list[Paper]) -> None:
+        self._searches[key] = list(papers)
+
+    def stats(self) -> dict:
+        return {
+            "papers": len(self._papers),
+            "paper_chars": self._paper_chars,
+            "evictions": self.evictions,
+            "searches": len(self._searches),
+        }
+
+
+def _text_size(content: PaperContent) -> int:
+    return (
+        len(content.title)
+        + len(content.abstract)
+        + sum(len(s.title) + len(s.content) for s in content.sections)
+        + sum(len(r) for r in content.references)
+    )
+
+
+_current_batch: ContextVar[BatchCache | None] = ContextVar("current_batch", default=None)
+
+
+@contextmanager
+def batch_scope() -> Iterator[BatchCache]:
+    """Share papers and searches between runs started in this context.
+
+    Tasks started inside inherit the batch through contextvars.
+    """
+    cache = BatchCache(max_paper_chars=settings.batch_cache_max_chars)
+    token = _current_batch.set(cache)
+    try:
+        yield cache
+    finally:
+        _current_batch.reset(token)
+
+
+def current_batch() -> BatchCache | None:
+    """The batch the calling run belongs to, if any."""
+    return _current_batch.get()
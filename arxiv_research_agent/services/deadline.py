@@ -0,0 +1,33 @@
+"""Per-run deadlines shared by the agent tools and the services they call.
+
+A deadline is an absolute wall-clock time (as from time.time()) so it can
+travel through session state. Services take an optional deadline and trim
+their own timeouts to whatever is left of it.
+"""
+
+import time
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a deadline has passed before work could start."""
+
+
+def remaining(deadline: float | None) -> float | None:
+    """Seconds left until `deadline`, or None without one."""
+    if deadline is None:
+        return None
+    return deadline - time.time()
+
+
+def trim_timeout(timeout: float, deadline: float | None) -> float:
+    """Cap `timeout` to the time left before `deadline`.
+
+    Raises:
+        DeadlineExceeded: If the deadline has already passed.
+    """
+    left = remaining(deadline)
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceeded("Deadline reached")
+    return min(timeout, left)
@@ -0,0 +1,136 @@
+"""Worker pools for CPU-bound parsing, kept off the event loop."""
+
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
+
+from arxiv_research_agent.config import settings
+from arxiv_research_agent.services import telemetry
+
+
+def _timed_call(fn: Callable, args: tuple) -> tuple[float, float, Any]:
+    """Run fn in the worker and report when it started and finished.
+
+    Module-level so it can be pickled for process pools.
+    """
+    started = time.time()
+    result = fn(*args)
+    return started, time.time(), result
+
+
+class ParseExecutor:
+    """Runs parsing functions on a thread or process pool.
+
+    Tracks how many tasks are waiting for a worker (queue depth) and, per
+    task name, how long tasks waited and ran.
+    """
+
+    def __init__(self, name: str, kind: str = "thread", max_workers: int = 4):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor kind: {kind!r}")
+        self.name = name
+        self.kind = kind
+        self._max_workers = max_workers
+        self._pool: Executor | None = None
+        self._in_flight = 0
+        self._max_queue_depth = 0
+        self._timings: dict[str, dict[str, float]] = {}
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.kind == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self._max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix=f"{self.name}-worker",
+                )
+        return self._pool
+
+    async def run(self, task: str, fn: Callable, *args) -> Any:
+        """Run fn(*args) on the pool and return its result.
+
+        For process pools, fn and args must be picklable.
+        """
+        loop = asyncio.get_running_loop()
+        submitted = time.time()
+        self._in_flight += 1
+        self._max_queue_depth = max(self._max_queue_depth, self.queue_depth)
+        try:
+            started, finished, result = await loop.run_in_executor(
+                self._get_pool(), _timed_call, fn, args
+            )
+        finally:
+            self._in_flight -= 1
+
+        self._record(task, wait=started - submitted, run=finished - started)
+        return result
+
+    @property
+    def queue_depth(self) -> int:
+        """Tasks submitted but still waiting for a free worker."""
+        return max(self._in_flight - self._max_workers, 0)
+
+    def _record(self, task: str, wait: float, run: float) -> None:
+        timing = self._timings.setdefault(
+            task, {"count": 0, "wait_seconds": 0.0, "run_seconds": 0.0, "max_run_seconds": 0.0}
+        )
+        timing["count"] += 1
+        timing["wait_seconds"] += max(wait, 0.0)
+        timing["run_seconds"] += run
+        timing["max_run_seconds"] = max(timing["max_run_seconds"], run)
+        telemetry.observe_seconds("executor_wait", max(wait, 0.0), task=task)
+        telemetry.observe_seconds("executor_run", run, task=task)
+
+    def stats(self) -> dict:
+        """Return queue depth and per-task timing totals."""
+        return {
+            "kind": self.kind,
+            "max_workers": self._max_workers,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self._max_queue_depth,
+            "tasks": {name: dict(t) for name, t in self._timings.items()},
+        }
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+_parse_executor: ParseExecutor | None = None
+_html_executor: ParseExecutor | None = None
+
+
+def get_parse_executor() -> ParseExecutor:
+    """Return the pool used for Atom feed parsing."""
+    global _parse_executor
+    if _parse_executor is None:
+        _parse_executor = ParseExecutor(
+            "feed", kind="thread", max_workers=settings.parse_executor_workers
+        )
+    return _parse_executor
+
+
+def get_html_executor() -> ParseExecutor:
+    """Return the pool used for paper HTML extraction."""
+    global _html_executor
+    if _html_executor is None:
+        _html_executor = ParseExecutor(
+            "html",
+            kind=settings.html_executor_kind,
+            max_workers=settings.html_executor_workers,
+        )
+    return _html_executor
+
+
+def shutdown_executors() -> None:
+    """Stop all parsing pools. Called on application shutdown."""
+    global _parse_executor, _html_executor
+    for executor in (_parse_executor, _html_executor):
+        if executor is not None:
+            executor.shutdown()
+    _parse_executor = None
+    _html_executor = None
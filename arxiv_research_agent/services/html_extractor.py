@@ -0,0 +1,261 @@
+"""Single-pass streaming text extractor for arXiv/ar5iv paper HTML."""
+
+import re
+from html import unescape
+
+from arxiv_research_agent.models import PaperContent, PaperSection
+
+# Elements whose content is never useful to the model.
+SKIP_TAGS = frozenset({
+    "script", "style", "noscript", "svg", "nav", "footer", "figure", "button",
+})
+
+# Elements whose content is raw text and may contain unescaped "<".
+RAW_TEXT_TAGS = frozenset({"script", "style"})
+
+# Headings that start a new top-level section.
+SECTION_HEADINGS = frozenset({"h1", "h2"})
+
+# LaTeXML classes marking page chrome.
+SKIP_CLASSES = ("ltx_page_footer", "ltx_page_navbar", "ltx_page_logo")
+
+_TOKEN = re.compile(
+    r"<!--(?:.*?-->)?"                              # comment, maybe unterminated
+    r"|<(/?)([a-zA-Z][a-zA-Z0-9:-]*)([^>]*)>"       # start/end tag
+    r"|<[!?][^>]*>"                                 # doctype / processing instruction
+    r"|([^<]+)"                                     # text
+    r"|<",                                          # stray "<"
+    re.DOTALL,
+)
+_SKIP_CLASS = re.compile(
+    r"""class\s*=\s*["'][^"']*\b(?:%s)\b""" % "|".join(SKIP_CLASSES)
+)
+_ABSTRACT_CLASS = re.compile(r"""class\s*=\s*["'][^"']*\bltx_abstract\b""")
+_BIBLIOGRAPHY_CLASS = re.compile(r"""class\s*=\s*["'][^"']*\bltx_bibliography\b""")
+_ALTTEXT = re.compile(r"""alttext\s*=\s*"([^"]*)\"""")
+_ABSTRACT_PREFIX = re.compile(r"^abstract[.:]?\s*", re.IGNORECASE)
+
+
+class PaperHTMLExtractor:
+    """Extract title, abstract, sections and references in one pass.
+
+    Feed decoded chunks as they arrive with `feed()`, then call `close()`.
+    Scripts, styles, figures and navigation are dropped, and MathML is
+    replaced by its `alttext` (the LaTeX source) instead of the verbose
+    presentation markup. Text is split into sections at h1/h2 headings; the
+    LaTeXML abstract and bibliography are split out on their own. Skipped
+    subtrees are jumped over with a single search, and whitespace is
+    collapsed as text is emitted, so only the cleaned output is kept in
+    memory.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._title_parts: list[str] = []
+        self._in_title = False
+        self._heading_tag: str | None = None
+        self._heading_parts: list[str] = []
+        self._sections: list[tuple[str, list[str]]] = [("", [])]
+        self._abstract_parts: list[str] = []
+        self._references: list[list[str]] = []
+        self._region: str | None = None
+        self._region_tag: str | None = None
+        self._region_depth = 0
+        self._skip_tag: str | None = None
+        self._skip_pattern: re.Pattern | None = None
+        self._skip_depth = 0
+        self._in_comment = False
+
+    @property
+    def title(self) -> str:
+        title = " ".join(" ".join(self._title_parts).split())
+        return title or "Unknown Title"
+
+    @property
+    def text(self) -> str:
+        return self.to_paper_content("").content
+
+    def to_paper_content(self, paper_id: str) -> PaperContent:
+        """Build a structured PaperContent from everything fed so far."""
+        sections = [
+            PaperSection(title=title, content=" ".join(parts))
+            for title, parts in self._sections
+            if parts
+        ]
+        abstract = _ABSTRACT_PREFIX.sub("", " ".join(self._abstract_parts))
+        if not abstract:
+            for i, section in enumerate(sections):
+                if section.title.lower().endswith("abstract"):
+                    abstract = sections.pop(i).content
+                    break
+
+        return PaperContent(
+            paper_id=paper_id,
+            title=self.title,
+            abstract=abstract,
+            sections=sections,
+            references=[" ".join(parts) for parts in self._references if parts],
+        )
+
+    def feed(self, chunk: str) -> None:
+        """Process a chunk of decoded HTML."""
+        buffer = self._buffer + chunk
+        # Only consume up to the last complete tag; the tail may be a
+        # partial tag or a word split across chunks.
+        end = buffer.rfind(">") + 1
+        self._buffer = buffer[end:]
+        self._process(buffer, end)
+
+    def close(self) -> None:
+        """Flush any buffered trailing text."""
+        buffer, self._buffer = self._buffer, ""
+        if self._skip_tag is None and not self._in_comment and buffer:
+            self._handle_text(buffer.replace("<", " "))
+
+    def _process(self, buffer: str, end: int) -> None:
+        pos = 0
+        while pos < end:
+            if self._skip_tag is not None:
+                pos = self._skip(buffer, pos, end)
+                continue
+            if self._in_comment:
+                pos = self._skip_comment(buffer, pos, end)
+                continue
+
+            match = _TOKEN.match(buffer, pos, end)
+            pos = match.end()
+            if match.group(0) == "<!--":
+                # The comment runs past this chunk and may contain ">".
+                self._in_comment = True
+                continue
+
+            text = match.group(4)
+            if text is not None:
+                self._handle_text(text)
+                continue
+
+            tag = match.group(2)
+            if tag is None:
+                continue
+
+            tag = tag.lower()
+            if match.group(1):
+                self._handle_endtag(tag)
+            else:
+                self._handle_starttag(tag, match.group(3))
+
+    def _handle_starttag(self, tag: str, attrs: str) -> None:
+        if attrs.endswith("/"):
+            # Self-closing: nothing to skip and no end tag will follow.
+            if tag == "math":
+                self._emit_alttext(attrs)
+            return
+
+        if tag == "math":
+            self._emit_alttext(attrs)
+            self._start_skip(tag)
+            return
+        if tag in SKIP_TAGS or ("class" in attrs and _SKIP_CLASS.search(attrs)):
+            self._start_skip(tag)
+            return
+
+        if tag == self._region_tag:
+            self._region_depth += 1
+
+        if tag == "title":
+            self._in_title = True
+        elif self._region == "references":
+            if tag == "li":
+                self._references.append([])
+        elif self._region is None and "class" in attrs and _ABSTRACT_CLASS.search(attrs):
+            self._start_region("abstract", tag)
+        elif self._region is None and "class" in attrs and _BIBLIOGRAPHY_CLASS.search(attrs):
+            self._start_region("references", tag)
+        elif self._region is None and tag in SECTION_HEADINGS and self._heading_tag is None:
+            self._heading_tag = tag
+            self._heading_parts = []
+
+    def _handle_endtag(self, tag: str) -> None:
+        if tag == "title":
+            self._in_title = False
+        elif tag == self._heading_tag:
+            heading = " ".join(self._heading_parts)
+            self._sections.append((heading, []))
+            self._heading_tag = None
+        elif tag == self._region_tag:
+            self._region_depth -= 1
+            if self._region_depth == 0:
+                self._region = None
+                self._region_tag = None
+
+    def _handle_text(self, data: str) -> None:
+        if "&" in data:
+            data = unescape(data)
+        if self._in_title:
+            self._title_parts.append(data)
+            return
+
+        chunk = " ".join(data.split())
+        if not chunk:
+            return
+
+        if self._heading_tag is not None:
+            self._heading_parts.append(chunk)
+        elif self._region == "abstract":
+            self._abstract_parts.append(chunk)
+        elif self._region == "references":
+            if self._references:
+                self._references[-1].append(chunk)
+        else:
+            self._sections[-1][1].append(chunk)
+
+    def _emit_alttext(self, attrs: str) -> None:
+        match = _ALTTEXT.search(attrs)
+        if match:
+            self._handle_text(match.group(1))
+
+    def _start_region(self, region: str, tag: str) -> None:
+        self._region = region
+        self._region_tag = tag
+        self._region_depth = 1
+
+    def _start_skip(self, tag: str) -> None:
+        self._skip_tag = tag
+        self._skip_depth = 1
+        if tag in RAW_TEXT_TAGS:
+            self._skip_pattern = re.compile(rf"</({tag})\s*>", re.IGNORECASE)
+        else:
+            self._skip_pattern = re.compile(rf"<(/?)({tag})\b[^>]*?(/?)>", re.IGNORECASE)
+
+    def _skip(self, buffer: str, pos: int, end: int) -> int:
+        """Jump over a skipped subtree, tracking nesting of the same tag."""
+        raw = self._skip_tag in RAW_TEXT_TAGS
+        while True:
+            match = self._skip_pattern.search(buffer, pos, end)
+            if match is None:
+                return end
+            pos = match.end()
+            if raw or match.group(1):
+                self._skip_depth -= 1
+            elif not match.group(3):
+                self._skip_depth += 1
+            if self._skip_depth == 0:
+                self._skip_tag = None
+                self._skip_pattern = None
+                return pos
+
+    def _skip_comment(self, buffer: str, pos: int, end: int) -> int:
+        """Jump to the end of a comment opened in an earlier chunk."""
+        close = buffer.find("-->", pos, end)
+        if close == -1:
+            return end
+        self._in_comment = False
+        return close + 3
+
+
+def extract_paper_html(html: str, paper_id: str) -> PaperContent:
+    """Extract a structured PaperContent from a complete HTML document."""
+    extractor = PaperHTMLExtractor()
+    extractor.feed(html)
+    extractor.close()
+    return extractor.to_paper_content(paper_id)
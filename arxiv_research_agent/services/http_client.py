@@ -0,0 +1,86 @@
+"""Process-wide pooled HTTP client shared by the upstream services."""
+
+import asyncio
+import logging
+from urllib.parse import urlsplit
+
+import httpx
+
+from arxiv_research_agent.config import settings
+
+logger = logging.getLogger(__name__)
+
+_client: httpx.AsyncClient | None = None
+
+
+def _build_client() -> httpx.AsyncClient:
+    """Build an AsyncClient configured from settings."""
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry,
+    )
+    return httpx.AsyncClient(
+        http2=settings.http2_enabled,
+        limits=limits,
+        timeout=settings.http_timeout,
+        follow_redirects=True,
+    )
+
+
+async def start_http_client() -> httpx.AsyncClient:
+    """Open the shared client. Called on application startup."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+        logger.info(
+            "🔌 HTTP client pool started (http2=%s, max_connections=%d)",
+            settings.http2_enabled,
+            settings.http_max_connections,
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client. Called on application shutdown."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+        logger.info("🔌 HTTP client pool closed")
+    _client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use.
+
+    Lazy creation keeps the services usable outside the FastAPI app
+    (e.g. from `adk run`), where no startup hook opens the pool.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+    return _client
+
+
+async def warm_up_connections(urls: list[str], timeout: float = 5.0) -> None:
+    """Open pooled connections to the hosts of `urls` ahead of the first request.
+
+    Sends one HEAD request to each distinct origin, so DNS, TCP and TLS
+    setup happen before a research run needs them. Failures are logged
+    and ignored.
+    """
+    client = get_http_client()
+    origins = list(dict.fromkeys(
+        f"{parts.scheme}://{parts.netloc}/" for parts in map(urlsplit, urls) if parts.netloc
+    ))
+
+    async def head(origin: str) -> bool:
+        try:
+            await client.head(origin, timeout=timeout)
+            return True
+        except httpx.HTTPError as e:
+            logger.warning("⚠️ Connection warm-up to %s failed: %s", origin, e)
+            return False
+
+    warmed = await asyncio.gather(*(head(origin) for origin in origins))
+    logger.info("🔌 Warmed up connections to %d of %d hosts", sum(warmed), len(origins))
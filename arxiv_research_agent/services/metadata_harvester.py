@@ -0,0 +1,173 @@
+"""Background harvester that keeps the local metadata index current."""
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+
+from arxiv_research_agent.config import settings
+from arxiv_research_agent.services.arxiv_client import ArxivClient
+from arxiv_research_agent.services.executor import get_parse_executor
+from arxiv_research_agent.services.metadata_index import MetadataIndex, get_metadata_index
+from arxiv_research_agent.services.rate_limiter import get_arxiv_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+HARVEST_PAGE_SIZE = 200
+HARVEST_MAX_PAGES = 100
+
+# Submissions are announced up to a few days after they're made (weekends
+# included), so incremental harvests re-read this far behind the newest
+# paper already indexed.
+HARVEST_OVERLAP = 3 * 86400
+
+
+class MetadataHarvester:
+    """Pages each category's listing into the metadata index.
+
+    The first harvest of a category backfills `days` days. Later harvests
+    stop once they reach papers already indexed. Requests go through the
+    client's rate limiter, so harvesting shares arXiv's pacing with agent
+    searches.
+
+    With a `lock_path`, only the process holding an exclusive lock on that
+    file harvests, so worker processes sharing one index don't each page
+    the same listings. The others retry the lock every interval and take
+    over if the holder exits.
+    """
+
+    def __init__(
+        self,
+        index: MetadataIndex,
+        client: ArxivClient,
+        categories: list[str],
+        days: int = 30,
+        interval: float = 3600,
+        lock_path: str | None = None,
+    ):
+        self._index = index
+        self._client = client
+        self._categories = categories
+        self._days = days
+        self._interval = interval
+        self._lock_path = lock_path
+        self._lock_file = None
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        """Start harvesting in the background. Called on application startup."""
+        self._task = asyncio.create_task(self._loop(), name="metadata-harvester")
+        logger.info("🗂️ Metadata harvester started (%d categories)", len(self._categories))
+
+    async def stop(self) -> None:
+        """Stop the background harvest. Called on application shutdown."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    async def harvest(self) -> int:
+        """Harvest every category once and return the papers indexed."""
+        cutoff = time.time() - self._days * 86400
+        total = 0
+        for category in self._categories:
+            total += await self._harvest_category(category, cutoff)
+
+        pruned = await asyncio.to_thread(self._index.prune, cutoff)
+        logger.info("🗂️ Metadata harvest indexed %d papers, pruned %d", total, pruned)
+        return total
+
+    async def _loop(self) -> None:
+        while True:
+            if self._lead():
+                try:
+                    await self.harvest()
+                except Exception:
+                    logger.exception("❌ Metadata harvest failed")
+            await asyncio.sleep(self._interval)
+
+    def _lead(self) -> bool:
+        """Whether this process should harvest, taking the lock if it's free."""
+        if self._lock_path is None or self._lock_file is not None:
+            return True
+        import fcntl
+
+        Path(self._lock_path).parent.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self._lock_path, "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            logger.info("🗂️ Metadata harvest left to the worker holding %s", self._lock_path)
+            return False
+        self._lock_file = lock_file
+        logger.info("🗂️ Metadata harvester leading for this host")
+        return True
+
+    async def _harvest_category(self, category: str, cutoff: float) -> int:
+        """Page one category newest first until reaching already-indexed papers.
+
+        The category is only recorded as harvested when the listing was read
+        all the way down, so a partial harvest never makes the index answer
+        searches it can't answer completely.
+        """
+        state = await asyncio.to_thread(self._index.harvest_state, category)
+        stop_at = cutoff if state is None else max(cutoff, state[0] - HARVEST_OVERLAP)
+
+        newest = state[0] if state else 0.0
+        start = 0
+        indexed = 0
+        complete = False
+
+        for _ in range(HARVEST_MAX_PAGES):
+            papers, entries = await self._client.fetch_page(
+                f"cat:{category}", start, HARVEST_PAGE_SIZE
+            )
+            start += entries
+            if papers:
+                indexed += await asyncio.to_thread(self._index.add, papers)
+                newest = max(newest, papers[0].published.timestamp())
+
+            if entries < HARVEST_PAGE_SIZE or (
+                papers and papers[-1].published.timestamp() < stop_at
+            ):
+                complete = True
+                break
+
+        if complete:
+            oldest = state[1] if state else cutoff
+            await asyncio.to_thread(self._index.record_harvest, category, newest, oldest)
+        else:
+            logger.warning("⚠️ Metadata harvest of %s stopped after %d papers", category, start)
+        return indexed
+
+
+_harvester: MetadataHarvester | None = None
+
+
+def get_metadata_harvester() -> MetadataHarvester | None:
+    """Return the process-wide harvester, or None when the index is disabled."""
+    global _harvester
+    index = get_metadata_index()
+    if index is None:
+        return None
+    if _harvester is None:
+        _harvester = MetadataHarvester(
+            index=index,
+            client=ArxivClient(
+                executor=get_parse_executor(),
+                rate_limiter=get_arxiv_rate_limiter(),
+                api_url=settings.arxiv_api_url,
+            ),
+            categories=settings.arxiv_categories,
+            days=settings.metadata_index_days,
+            interval=settings.metadata_harvest_interval,
+            # Worker processes share the index; one of them harvests it.
+            lock_path=(
+                f"{settings.metadata_index_path}.harvest.lock" if settings.multi_worker else None
+            ),
+        )
+    return _harvester
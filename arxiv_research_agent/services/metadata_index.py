@@ -0,0 +1,350 @@
+"""Local SQLite FTS5 index of recent arXiv metadata."""
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+
+from arxiv_research_agent.config import settings
+from arxiv_research_agent.models import Paper
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS papers (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    version_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    abstract TEXT NOT NULL,
+    authors TEXT NOT NULL,
+    published REAL NOT NULL,
+    url TEXT NOT NULL,
+    pdf_url TEXT NOT NULL,
+    categories TEXT NOT NULL
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
+    title, abstract, authors,
+    content='papers', content_rowid='rowid', tokenize='porter unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS papers_ai AFTER INSERT ON papers BEGIN
+    INSERT INTO papers_fts (rowid, title, abstract, authors)
+    VALUES (new.rowid, new.title, new.abstract, new.authors);
+END;
+CREATE TRIGGER IF NOT EXISTS papers_ad AFTER DELETE ON papers BEGIN
+    INSERT INTO papers_fts (papers_fts, rowid, title, abstract, authors)
+    VALUES ('delete', old.rowid, old.title, old.abstract, old.authors);
+END;
+CREATE TRIGGER IF NOT EXISTS papers_au AFTER UPDATE ON papers BEGIN
+    INSERT INTO papers_fts (papers_fts, rowid, title, abstract, authors)
+    VALUES ('delete', old.rowid, old.title, old.abstract, old.authors);
+    INSERT INTO papers_fts (rowid, title, abstract, authors)
+    VALUES (new.rowid, new.title, new.abstract, new.authors);
+END;
+
+CREATE TABLE IF NOT EXISTS harvest_state (
+    category TEXT PRIMARY KEY,
+    newest REAL NOT NULL,
+    oldest REAL NOT NULL,
+    harvested_at REAL NOT NULL
+);
+"""
+
+_UPSERT = """
+INSERT INTO papers (rowid, id, version_id, title, abstract, authors, published, url, pdf_url, categories)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    version_id = excluded.version_id,
+    title = excluded.title,
+    abstract = excluded.abstract,
+    authors = excluded.authors,
+    published = excluded.published,
+    url = excluded.url,
+    pdf_url = excluded.pdf_url,
+    categories = excluded.categories
+"""
+
+_COLUMNS = "version_id, title, abstract, authors, published, url, pdf_url, categories"
+
+_VERSION = re.compile(r"v\d+$")
+
+# Rowids are the publish time in seconds shifted left by this many bits,
+# plus a per-paper offset. Rowid order is then publish order, so FTS5 can
+# walk matches newest first and stop at the LIMIT instead of sorting every
+# match, and date windows become rowid ranges.
+_ROWID_SHIFT = 8
+
+# arXiv field prefixes the index can answer, mapped to FTS5 columns.
+# None searches every column.
+_FIELDS = {"ti": "title", "abs": "abstract", "au": "authors", "all": None}
+_OPERATORS = {"AND": "AND", "OR": "OR", "ANDNOT": "NOT"}
+_QUERY_TOKEN = re.compile(r'\(|\)|(?:(\w+):)?("[^"]*"|[^\s()"]+)')
+
+
+def to_fts_query(query: str) -> str | None:
+    """Translate an arXiv search query into an FTS5 MATCH expression.
+
+    Supports bare terms, quoted phrases, the ti:/abs:/au:/all: prefixes,
+    parentheses and the AND/OR/ANDNOT operators. Adjacent terms are ANDed.
+    Returns "" for an empty query and None for syntax the index can't
+    answer (e.g. cat: or jr:), in which case callers use the live API.
+    """
+    parts: list[str] = []
+    expect_operand = True
+
+    for match in _QUERY_TOKEN.finditer(query):
+        token = match.group(0)
+        if token == ")":
+            parts.append(token)
+            expect_operand = False
+            continue
+
+        if token in _OPERATORS:
+            if expect_operand:
+                return None
+            parts.append(_OPERATORS[token])
+            expect_operand = True
+            continue
+
+        if not expect_operand:
+            parts.append("AND")
+
+        if token == "(":
+            parts.append(token)
+            expect_operand = True
+            continue
+
+        prefix, value = match.group(1), match.group(2)
+        if prefix is not None and prefix not in _FIELDS:
+            return None
+        column = _FIELDS.get(prefix) if prefix else None
+        value = value.strip('"').replace("_", " ").replace('"', "")
+        if not value.strip():
+            return None
+        phrase = f'"{value}"'
+        parts.append(f"{column} : {phrase}" if column else phrase)
+        expect_operand = False
+
+    return " ".join(parts)
+
+
+def base_id(arxiv_id: str) -> str:
+    """Strip the version suffix from an arXiv ID."""
+    return _VERSION.sub("", arxiv_id)
+
+
+def _rowid_floor(timestamp: float) -> int:
+    """Smallest rowid of a paper published at or after `timestamp`."""
+    return int(timestamp) << _ROWID_SHIFT
+
+
+class MetadataIndex:
+    """Full-text index of paper metadata for the configured categories.
+
+    Filled by MetadataHarvester. Searches are only answered when every
+    category was harvested within `max_age` seconds and the harvest reaches
+    back past the search window; otherwise `search` returns None and
+    callers fall back to the live arXiv API.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        categories: list[str],
+        max_age: float = 6 * 3600,
+    ):
+        self._path = Path(path)
+        self._categories = categories
+        self._max_age = max_age
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self.queries = 0
+        self.served = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if str(self._path) != ":memory:":
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def add(self, papers: list[Paper]) -> int:
+        """Insert or update papers, keyed by ID without version."""
+        rows = [
+            (
+                _rowid_floor(p.published.timestamp())
+                | zlib.crc32(base_id(p.id).encode()) & ((1 << _ROWID_SHIFT) - 1),
+                base_id(p.id),
+                p.id,
+                p.title,
+                p.abstract,
+                json.dumps(p.authors),
+                p.published.timestamp(),
+                p.url,
+                p.pdf_url,
+                json.dumps(p.categories),
+            )
+            for p in papers
+        ]
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                # Ascending rowids append to the B-trees instead of splitting pages.
+                for row in sorted(rows):
+                    self._upsert(conn, row)
+        return len(rows)
+
+    @staticmethod
+    def _upsert(conn: sqlite3.Connection, row: tuple) -> None:
+        # Papers published in the same second can land on the same rowid;
+        # probe upward until a free one is found.
+        while True:
+            try:
+                conn.execute(_UPSERT, row)
+                return
+            except sqlite3.IntegrityError as e:
+                if "papers.rowid" not in str(e):
+                    raise
+                row = (row[0] + 1, *row[1:])
+
+    def search(self, query: str, since: datetime, max_results: int) -> list[Paper] | None:
+        """Return the newest papers matching `query` published since `since`.
+
+        Returns None when the index can't answer: it is stale, doesn't
+        reach back to `since`, or the query uses unsupported syntax.
+        """
+        self.queries += 1
+        if not self.covers(since):
+            return None
+
+        fts_query = to_fts_query(query)
+        if fts_query is None:
+            return None
+
+        if fts_query:
+            sql = (
+                f"SELECT {_COLUMNS} FROM papers WHERE rowid IN ("
+                "SELECT rowid FROM papers_fts WHERE papers_fts MATCH ? AND rowid >= ? "
+                "ORDER BY rowid DESC LIMIT ?"
+                ") ORDER BY rowid DESC"
+            )
+            params = (fts_query, _rowid_floor(since.timestamp()), max_results)
+        else:
+            sql = f"SELECT {_COLUMNS} FROM papers WHERE rowid >= ? ORDER BY rowid DESC LIMIT ?"
+            params = (_rowid_floor(since.timestamp()), max_results)
+
+        with self._lock:
+            try:
+                rows = self._connect().execute(sql, params).fetchall()
+            except sqlite3.OperationalError as e:
+                logger.warning("⚠️ Metadata index could not run query '%s': %s", query, e)
+                return None
+
+        self.served += 1
+        return [self._to_paper(row) for row in rows]
+
+    def covers(self, since: datetime) -> bool:
+        """Whether every category is freshly harvested back to `since`."""
+        if not self._categories:
+            return False
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT category, oldest, harvested_at FROM harvest_state"
+            ).fetchall()
+
+        state = {category: (oldest, harvested_at) for category, oldest, harvested_at in rows}
+        fresh_after = time.time() - self._max_age
+        return all(
+            c in state and state[c][0] <= since.timestamp() and state[c][1] >= fresh_after
+            for c in self._categories
+        )
+
+    def harvest_state(self, category: str) -> tuple[float, float] | None:
+        """Return (newest, oldest) published timestamps harvested for a category."""
+        with self._lock:
+            return self._connect().execute(
+                "SELECT newest, oldest FROM harvest_state WHERE category = ?",
+                (category,),
+            ).fetchone()
+
+    def record_harvest(self, category: str, newest: float, oldest: float) -> None:
+        """Mark a category as completely harvested between oldest and newest."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO harvest_state (category, newest, oldest, harvested_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (category, newest, oldest, time.time()),
+                )
+
+    def prune(self, before: float) -> int:
+        """Delete papers published before `before` and return how many."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                deleted = conn.execute(
+                    "DELETE FROM papers WHERE rowid < ?", (_rowid_floor(before),)
+                ).rowcount
+                conn.execute(
+                    "UPDATE harvest_state SET oldest = ? WHERE oldest < ?", (before, before)
+                )
+        return deleted
+
+    def stats(self) -> dict:
+        """Return size and usage counters for the index."""
+        with self._lock:
+            records = self._connect().execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+        return {
+            "records": records,
+            "queries": self.queries,
+            "served": self.served,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @staticmethod
+    def _to_paper(row: tuple) -> Paper:
+        version_id, title, abstract, authors, published, url, pdf_url, categories = row
+        return Paper(
+            id=version_id,
+            title=title,
+            abstract=abstract,
+            authors=json.loads(authors),
+            published=datetime.fromtimestamp(published, timezone.utc),
+            url=url,
+            pdf_url=pdf_url,
+            categories=json.loads(categories),
+        )
+
+
+_metadata_index: MetadataIndex | None = None
+
+
+def get_metadata_index() -> MetadataIndex | None:
+    """Return the process-wide metadata index, or None when disabled."""
+    global _metadata_index
+    if not settings.metadata_index_enabled:
+        return None
+    if _metadata_index is None:
+        _metadata_index = MetadataIndex(
+            path=settings.metadata_index_path,
+            categories=settings.arxiv_categories,
+            max_age=settings.metadata_index_max_age,
+        )
+    return _metadata_index
@@ -0,0 +1,163 @@
+"""Persistent on-disk cache for extracted paper content."""
+
+import logging
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+
+from arxiv_research_agent.config import settings
+from arxiv_research_agent.models import PaperContent
+
+logger = logging.getLogger(__name__)
+
+# arXiv HTML is immutable once a version suffix is part of the id.
+_VERSIONED_ID = re.compile(r"v\d+$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS paper_contents (
+    key TEXT PRIMARY KEY,
+    content BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS paper_contents_accessed_at ON paper_contents (accessed_at);
+"""
+
+
+class PaperCache:
+    """SQLite-backed LRU cache of PaperContent keyed by arXiv id.
+
+    Versioned ids (e.g. "2401.12345v2") never expire. Unversioned ids point
+    at whatever the latest version is, so they expire after `unversioned_ttl`
+    seconds. Content is zlib-compressed and the cache is trimmed to
+    `max_bytes` of compressed content, evicting least recently read first.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_bytes: int = 512 * 1024 * 1024,
+        unversioned_ttl: float = 24 * 3600,
+    ):
+        self._path = Path(path)
+        self._max_bytes = max_bytes
+        self._unversioned_ttl = unversioned_ttl
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def get(self, arxiv_id: str) -> PaperContent | None:
+        """Return cached content for a paper, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT content, created_at FROM paper_contents WHERE key = ?",
+                (arxiv_id,),
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            blob, created_at = row
+            if not _VERSIONED_ID.search(arxiv_id) and now - created_at > self._unversioned_ttl:
+                conn.execute("DELETE FROM paper_contents WHERE key = ?", (arxiv_id,))
+                conn.commit()
+                self.misses += 1
+                return None
+
+            conn.execute(
+                "UPDATE paper_contents SET accessed_at = ? WHERE key = ?", (now, arxiv_id)
+            )
+            conn.commit()
+            self.hits += 1
+
+        return PaperContent.model_validate_json(zlib.decompress(blob))
+
+    def put(self, arxiv_id: str, paper: PaperContent) -> None:
+        """Store extracted content for a paper and trim the cache to size."""
+        blob = zlib.compress(paper.model_dump_json().encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO paper_contents "
+                "(key, content, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (arxiv_id, blob, len(blob), now, now),
+            )
+            self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop least recently read entries until under the size budget."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM paper_contents").fetchone()[0]
+        if total <= self._max_bytes:
+            return
+
+        rows = conn.execute(
+            "SELECT key, size FROM paper_contents ORDER BY accessed_at ASC"
+        ).fetchall()
+        for key, size in rows:
+            if total <= self._max_bytes:
+                break
+            conn.execute("DELETE FROM paper_contents WHERE key = ?", (key,))
+            total -= size
+            self.evictions += 1
+            logger.info("🧹 paper cache: evicted %s", key)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current cache size."""
+        with self._lock:
+            conn = self._connect()
+            entries, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM paper_contents"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": size,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_paper_cache: PaperCache | None = None
+
+
+def get_paper_cache() -> PaperCache | None:
+    """Return the process-wide paper cache, or None when disabled."""
+    global _paper_cache
+    if not settings.paper_cache_enabled:
+        return None
+    if _paper_cache is None:
+        _paper_cache = PaperCache(
+            path=settings.paper_cache_path,
+            max_bytes=settings.paper_cache_max_bytes,
+            unversioned_ttl=settings.paper_cache_unversioned_ttl,
+        )
+    return _paper_cache
@@ -1,80 +1,242 @@
 """Fetch full paper content from arxiv.org HTML with ar5iv fallback."""
 
+import asyncio
 import logging
 
 import httpx
-import re
 from arxiv_research_agent.models import PaperContent
+from arxiv_research_agent.services.batch_cache import current_batch
+from arxiv_research_agent.services.deadline import remaining
+from arxiv_research_agent.services.executor import ParseExecutor
+from arxiv_research_agent.services.html_extractor import (
+    PaperHTMLExtractor,
+    extract_paper_html,
+)
+from arxiv_research_agent.services.http_client import get_http_client
+from arxiv_research_agent.services.paper_cache import PaperCache
+from arxiv_research_agent.services.rate_limiter import SingleFlight
+from arxiv_research_agent.services import telemetry
 
 logger = logging.getLogger(__name__)
 
+# Decoded characters batched per hand-off to a thread pool worker.
+FEED_BATCH_CHARS = 256 * 1024
+
 
 class PaperFetcher:
-    """Fetches and extracts text from arXiv HTML papers."""
+    """Fetches and extracts text from arXiv HTML papers.
+
+    ar5iv is the fallback source: it is tried when arxiv.org fails, or with
+    `hedge_after` set, as soon as arxiv.org has taken that many seconds
+    without an answer, after which the first success wins. `race_sources`
+    requests both at once.
+    """
 
     ARXIV_HTML_BASE = "https://arxiv.org/html"
     AR5IV_HTML_BASE = "https://ar5iv.org/html"
 
-    def __init__(self, timeout: float = 60.0):
+    def __init__(
+        self,
+        timeout: float = 60.0,
+        http_client: httpx.AsyncClient | None = None,
+        cache: PaperCache | None = None,
+        executor: ParseExecutor | None = None,
+        race_sources: bool = False,
+        hedge_after: float | None = None,
+        html_base_url: str = ARXIV_HTML_BASE,
+        fallback_html_base_url: str = AR5IV_HTML_BASE,
+    ):
         self._timeout = timeout
-
-    async def fetch(self, arxiv_id: str) -> PaperContent | None:
+        self._html_base_url = html_base_url
+        self._fallback_html_base_url = fallback_html_base_url
+        self._http_client = http_client
+        self._cache = cache
+        self._executor = executor
+        self._race_sources = race_sources
+        self._hedge_after = hedge_after
+        self._single_flight = SingleFlight("paper_download")
+
+    async def fetch(self, arxiv_id: str, deadline: float | None = None) -> PaperContent | None:
         """Fetch paper content from arXiv HTML, falling back to ar5iv.
 
+        Papers already read in the current research batch, or in the
+        paper cache, are not downloaded again.
+
         Args:
             arxiv_id: ArXiv paper ID (e.g., "2401.12345").
+            deadline: Wall-clock time by which to give up waiting. A
+                      download other callers share carries on past it.
 
         Returns:
             PaperContent with extracted text, or None if unavailable.
         """
-        # Try arxiv.org first
-        result = await self._fetch_from_url(
-            f"{self.ARXIV_HTML_BASE}/{arxiv_id}", arxiv_id
-        )
-        if result:
-            return result
-
-        # Fall back to ar5iv.org
-        logger.info("📖 Falling back to ar5iv for paper %s", arxiv_id)
-        return await self._fetch_from_url(
-            f"{self.AR5IV_HTML_BASE}/{arxiv_id}", arxiv_id
-        )
+        batch = current_batch()
+        if batch is not None:
+            shared = batch.get_paper(arxiv_id)
+            telemetry.count("cache_lookups", cache="batch_paper", result="miss" if shared is None else "hit")
+            if shared is not None:
+                logger.info("💾 Batch already read paper %s", arxiv_id)
+                return shared
+
+        content = await self._fetch_cached(arxiv_id, deadline)
+        if content is not None and batch is not None:
+            batch.put_paper(arxiv_id, content)
+        return content
+
+    async def fetch_many(
+        self,
+        arxiv_ids: list[str],
+        concurrency: int = 4,
+        deadline: float | None = None,
+    ) -> dict[str, PaperContent | None]:
+        """Fetch several papers concurrently.
 
-    async def _fetch_from_url(self, url: str, arxiv_id: str) -> PaperContent | None:
-        """Fetch paper content from a specific URL."""
-        try:
-            async with httpx.AsyncClient(timeout=self._timeout) as client:
-                response = await client.get(url, follow_redirects=True)
-                response.raise_for_status()
+        Args:
+            arxiv_ids: ArXiv paper IDs. Duplicates are fetched once.
+            concurrency: Maximum papers downloading at the same time.
+            deadline: Wall-clock time by which to stop. Papers finished by
+                      then are returned; the rest count as unavailable.
+
+        Returns:
+            Dict mapping each ID to its PaperContent, or None if unavailable.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
 
-            content = self._extract_text(response.text)
-            title = self._extract_title(response.text)
+        async def fetch_one(arxiv_id: str) -> PaperContent | None:
+            async with semaphore:
+                return await self.fetch(arxiv_id, deadline)
 
-            return PaperContent(
-                paper_id=arxiv_id,
-                title=title,
-                content=content,
+        unique_ids = list(dict.fromkeys(arxiv_ids))
+        if not unique_ids:
+            return {}
+        tasks = {arxiv_id: asyncio.create_task(fetch_one(arxiv_id)) for arxiv_id in unique_ids}
+        left = remaining(deadline)
+        try:
+            _, pending = await asyncio.wait(
+                tasks.values(), timeout=None if left is None else max(left, 0)
             )
-        except httpx.HTTPError:
+        finally:
+            for task in tasks.values():
+                task.cancel()
+        if pending:
+            logger.info("⏱️ Deadline reached with %d of %d papers unread", len(pending), len(tasks))
+        return {
+            arxiv_id: None if task in pending else task.result()
+            for arxiv_id, task in tasks.items()
+        }
+
+    async def _fetch_cached(self, arxiv_id: str, deadline: float | None) -> PaperContent | None:
+        if self._cache is not None:
+            cached = await asyncio.to_thread(self._cache.get, arxiv_id)
+            telemetry.count("cache_lookups", cache="paper", result="miss" if cached is None else "hit")
+            if cached is not None:
+                logger.info("💾 Paper cache hit for %s", arxiv_id)
+                return cached
+
+        # Concurrent reads of the same paper share one download. Callers may
+        # have different deadlines, so the download runs without one and
+        # each caller waits only for its own time left.
+        try:
+            return await asyncio.wait_for(
+                self._single_flight.do(arxiv_id, lambda: self._fetch_and_cache(arxiv_id)),
+                remaining(deadline),
+            )
+        except TimeoutError:
             return None
 
-    def _extract_text(self, html: str) -> str:
-        """Extract readable text from HTML, removing tags and scripts."""
-        # Remove script and style elements
-        html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-        html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL | re.IGNORECASE)
+    async def _fetch_and_cache(self, arxiv_id: str) -> PaperContent | None:
+        result = await self._fetch_uncached(arxiv_id)
 
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', ' ', html)
+        if result is not None and self._cache is not None:
+            await asyncio.to_thread(self._cache.put, arxiv_id, result)
 
-        # Clean up whitespace
-        text = re.sub(r'\s+', ' ', text)
+        return result
 
-        return text.strip()
+    async def _fetch_uncached(self, arxiv_id: str) -> PaperContent | None:
+        """Download and extract a paper, trying arxiv.org then ar5iv."""
+        hedge_after = 0.0 if self._race_sources else self._hedge_after
+        pending = {
+            asyncio.create_task(
+                self._fetch_from_url(f"{self._html_base_url}/{arxiv_id}", arxiv_id)
+            )
+        }
+        try:
+            done, pending = await asyncio.wait(pending, timeout=hedge_after)
+            for task in done:
+                result = task.result()
+                if result is not None:
+                    return result
+                logger.info("📖 Falling back to ar5iv for paper %s", arxiv_id)
+            if pending and hedge_after:
+                logger.info("📖 arxiv.org slow for paper %s, hedging with ar5iv", arxiv_id)
+                telemetry.count("hedged_fetches")
+
+            pending.add(asyncio.create_task(
+                self._fetch_from_url(f"{self._fallback_html_base_url}/{arxiv_id}", arxiv_id)
+            ))
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    result = task.result()
+                    if result is not None:
+                        return result
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
 
-    def _extract_title(self, html: str) -> str:
-        """Extract title from HTML."""
-        match = re.search(r'<title>([^<]+)</title>', html, re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
-        return "Unknown Title"
+    async def _fetch_from_url(self, url: str, arxiv_id: str) -> PaperContent | None:
+        """Fetch paper content from a specific URL."""
+        source = "ar5iv" if url.startswith(self._fallback_html_base_url) else "arxiv"
+        try:
+            client = self._http_client or get_http_client()
+            with telemetry.span("paper_download", source=source):
+                async with client.stream(
+                    "GET", url, timeout=self._timeout, follow_redirects=True
+                ) as response:
+                    response.raise_for_status()
+                    content = await self._extract(response, arxiv_id)
+                telemetry.record_size("paper_download_bytes", response.num_bytes_downloaded, source=source)
+                return content
+        except httpx.HTTPError:
+            return None
+        except Exception:
+            # A failing parser or a broken/shut-down pool shouldn't take the
+            # run down; the other source may still come through.
+            logger.exception("❌ Could not extract paper %s from %s", arxiv_id, source)
+            return None
+
+    async def _extract(self, response: httpx.Response, arxiv_id: str) -> PaperContent:
+        """Extract structured paper content from a streaming response.
+
+        With no executor or a thread pool, decoded chunks are fed to the
+        extractor as they arrive, so the raw HTML is never held whole. A
+        process pool needs the full document to ship to the worker.
+        """
+        executor = self._executor
+
+        if executor is not None and executor.kind == "process":
+            html = "".join([chunk async for chunk in response.aiter_text()])
+            return await executor.run("extract_html", extract_paper_html, html, arxiv_id)
+
+        extractor = PaperHTMLExtractor()
+        if executor is None:
+            async for chunk in response.aiter_text():
+                extractor.feed(chunk)
+            extractor.close()
+            return extractor.to_paper_content(arxiv_id)
+
+        pending: list[str] = []
+        pending_chars = 0
+        async for chunk in response.aiter_text():
+            pending.append(chunk)
+            pending_chars += len(chunk)
+            if pending_chars >= FEED_BATCH_CHARS:
+                await executor.run("extract_html", extractor.feed, "".join(pending))
+                pending.clear()
+                pending_chars = 0
+        await executor.run("extract_html", extractor.feed, "".join(pending))
+        extractor.close()
+        return extractor.to_paper_content(arxiv_id)
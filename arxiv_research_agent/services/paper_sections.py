@@ -0,0 +1,99 @@
+"""Section ordering and chunking for budgeted paper reads."""
+
+from arxiv_research_agent.models import PaperContent, PaperSection
+
+# Keywords of section titles in the order they're most useful for a summary.
+# Sections matching none of these follow in document order.
+SECTION_PRIORITY: tuple[tuple[str, ...], ...] = (
+    ("conclusion", "concluding", "summary"),
+    ("introduction",),
+    ("result", "experiment", "evaluation", "discussion"),
+    ("method", "approach", "framework"),
+)
+
+
+def _priority(title: str) -> int:
+    title = title.lower()
+    for rank, keywords in enumerate(SECTION_PRIORITY):
+        if any(k in title for k in keywords):
+            return rank
+    return len(SECTION_PRIORITY)
+
+
+def order_sections(
+    paper: PaperContent,
+    selected: list[str] | None = None,
+) -> list[PaperSection]:
+    """Return the sections to read, most relevant first.
+
+    With no selection: the abstract, then sections ranked by SECTION_PRIORITY,
+    then the rest in document order. References are only included when
+    selected. With a selection, each entry is matched case-insensitively
+    against section titles ("abstract" and "references" are also accepted)
+    and matches are returned in the order requested.
+    """
+    abstract = PaperSection(title="Abstract", content=paper.abstract)
+    references = PaperSection(title="References", content=" ".join(paper.references))
+
+    if not selected:
+        ordered = sorted(paper.sections, key=lambda s: _priority(s.title))
+        return ([abstract] if paper.abstract else []) + ordered
+
+    result: list[PaperSection] = []
+    for wanted in selected:
+        wanted = wanted.lower().strip()
+        if wanted == "abstract" and paper.abstract:
+            candidates = [abstract]
+        elif wanted in ("references", "bibliography") and paper.references:
+            candidates = [references]
+        else:
+            candidates = [s for s in paper.sections if wanted in s.title.lower()]
+        result.extend(s for s in candidates if s not in result)
+    return result
+
+
+def chunk_sections(sections: list[PaperSection], chunk_chars: int) -> list[PaperSection]:
+    """Split sections longer than chunk_chars at whitespace into parts."""
+    chunks: list[PaperSection] = []
+    for section in sections:
+        text = section.content
+        if len(text) <= chunk_chars:
+            chunks.append(section)
+            continue
+
+        parts = []
+        while text:
+            cut = len(text) if len(text) <= chunk_chars else text.rfind(" ", 0, chunk_chars)
+            if cut <= 0:
+                cut = chunk_chars
+            parts.append(text[:cut])
+            text = text[cut:].lstrip()
+
+        for i, part in enumerate(parts, start=1):
+            chunks.append(
+                PaperSection(title=f"{section.title} (part {i}/{len(parts)})", content=part)
+            )
+    return chunks
+
+
+def read_budgeted(
+    chunks: list[PaperSection],
+    cursor: int,
+    max_chars: int,
+) -> tuple[list[PaperSection], int | None]:
+    """Take chunks from cursor until max_chars is spent.
+
+    At least one chunk is returned if any remain. Returns the chunks and the
+    cursor to continue from, or None when everything has been read.
+    """
+    taken: list[PaperSection] = []
+    used = 0
+    index = max(cursor, 0)
+    while index < len(chunks):
+        size = len(chunks[index].content)
+        if taken and used + size > max_chars:
+            break
+        taken.append(chunks[index])
+        used += size
+        index += 1
+    return taken, index if index < len(chunks) else None
@@ -0,0 +1,105 @@
+"""Local relevance ranking of search results with BM25.
+
+Scores papers' titles and abstracts against the research query so only
+the best matches are handed to the model. Document frequencies come from
+the candidate set itself, which is all a single search has to go on.
+"""
+
+import math
+import re
+from collections import Counter
+
+from arxiv_research_agent.models import Paper
+
+# The usual BM25 parameters.
+K1 = 1.2
+B = 0.75
+
+# Title terms are counted this many times, a cheap stand-in for field weights.
+TITLE_WEIGHT = 2
+
+_WORD = re.compile(r"[a-z0-9]+")
+# arXiv field prefixes such as "ti:" or "abs:".
+_FIELD_PREFIX = re.compile(r"\b[a-z]+:")
+_OPERATORS = frozenset({"and", "or", "andnot"})
+_STOPWORDS = frozenset(
+    "a an and are as at be based by for from in into is it its of on or our over"
+    " that the their this to towards using via we with".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase words of a document, as they appear."""
+    return _WORD.findall(text.lower())
+
+
+def _fold_plural(word: str) -> str:
+    if len(word) > 4 and word.endswith("ies"):
+        return word[:-3] + "y"
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def _surface_forms(term: str) -> tuple[str, ...]:
+    """Document words a folded query term matches: singular and plural."""
+    if term.endswith("y"):
+        return term, term + "s", term[:-1] + "ies"
+    return term, term + "s"
+
+
+def query_terms(*queries: str) -> list[str]:
+    """Distinct terms of plain or arXiv-syntax queries, plurals folded.
+
+    Stopwords, field prefixes and boolean operators are dropped; the terms
+    prefixes qualify are kept.
+    """
+    terms: list[str] = []
+    for query in queries:
+        words = tokenize(_FIELD_PREFIX.sub(" ", query.lower()))
+        terms.extend(
+            _fold_plural(w) for w in words if w not in _STOPWORDS and w not in _OPERATORS
+        )
+    return list(dict.fromkeys(terms))
+
+
+def bm25_scores(terms: list[str], documents: list[list[str]]) -> list[float]:
+    """BM25 score of each tokenized document for the query terms.
+
+    Plurals are folded on the query side only, by matching each term's
+    surface forms, so documents are just counted.
+    """
+    if not documents or not terms:
+        return [0.0] * len(documents)
+
+    counts = [Counter(doc) for doc in documents]
+    lengths = [len(doc) for doc in documents]
+    average_length = sum(lengths) / len(documents) or 1.0
+    norms = [K1 * (1 - B + B * length / average_length) for length in lengths]
+
+    scores = [0.0] * len(documents)
+    for term in terms:
+        forms = _surface_forms(term)
+        matches = [
+            (i, tf) for i, c in enumerate(counts) if (tf := sum(c[form] for form in forms))
+        ]
+        if not matches:
+            continue
+        idf = math.log(1 + (len(documents) - len(matches) + 0.5) / (len(matches) + 0.5))
+        for i, tf in matches:
+            scores[i] += idf * tf * (K1 + 1) / (tf + norms[i])
+    return scores
+
+
+def rank_papers(terms: list[str], papers: list[Paper], top_k: int) -> list[tuple[Paper, float]]:
+    """Return the `top_k` papers by BM25 over title and abstract, best first.
+
+    Papers matching none of the terms are dropped, unless none match at
+    all; then there is nothing to rank on and the original order is kept.
+    Ties also keep the original (newest first) order.
+    """
+    documents = [tokenize(p.title) * TITLE_WEIGHT + tokenize(p.abstract) for p in papers]
+    scores = bm25_scores(terms, documents)
+    ranked = sorted(zip(papers, scores), key=lambda pair: pair[1], reverse=True)
+    matching = [pair for pair in ranked if pair[1] > 0]
+    return (matching or ranked)[:top_k]
@@ -0,0 +1,170 @@
+"""Process-wide pacing and request coalescing for upstream calls."""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Hashable
+
+from arxiv_research_agent.config import settings
+from arxiv_research_agent.services import telemetry
+
+_BUCKETS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS token_buckets (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL
+);
+"""
+
+
+class TokenBucketLimiter:
+    """Async token bucket shared by every session in the process.
+
+    Tokens refill at one per `interval` seconds up to `burst`. Waiters are
+    served in arrival order.
+    """
+
+    def __init__(self, interval: float = 3.0, burst: int = 1):
+        self._rate = 1.0 / interval
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """Wait for a token and return how long that took, in seconds."""
+        started = time.monotonic()
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= 1
+
+        return time.monotonic() - started
+
+
+class SharedTokenBucketLimiter(TokenBucketLimiter):
+    """Token bucket shared by every process on the host through SQLite.
+
+    Each acquisition reserves the next token in one write transaction,
+    letting the balance go negative while callers wait for tokens already
+    promised, then sleeps until its own token is due. Callers are served
+    in reservation order across processes. A caller cancelled while
+    waiting forfeits its token, which only ever slows the pace down.
+    Times are wall-clock, since processes don't share a monotonic clock.
+    """
+
+    def __init__(self, path: str | Path, name: str, interval: float = 3.0, burst: int = 1):
+        super().__init__(interval, burst)
+        self._path = Path(path)
+        self._name = name
+        self._conn: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self._path, timeout=30, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_BUCKETS_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _reserve(self) -> float:
+        """Take the next token and return the seconds until it is due."""
+        with self._db_lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = conn.execute(
+                    "SELECT tokens, updated FROM token_buckets WHERE name = ?", (self._name,)
+                ).fetchone()
+                tokens, updated = row if row is not None else (float(self._burst), now)
+                tokens = min(self._burst, tokens + max(now - updated, 0.0) * self._rate) - 1
+                conn.execute(
+                    "INSERT OR REPLACE INTO token_buckets (name, tokens, updated) VALUES (?, ?, ?)",
+                    (self._name, tokens, now),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return max(-tokens / self._rate, 0.0)
+
+    async def acquire(self) -> float:
+        """Wait for a token and return how long that took, in seconds."""
+        started = time.monotonic()
+        delay = await asyncio.to_thread(self._reserve)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return time.monotonic() - started
+
+    def close(self) -> None:
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class SingleFlight:
+    """Coalesces identical concurrent calls into one upstream request.
+
+    The first caller for a key starts the work as its own task; callers
+    arriving while it runs await the same task. Cancelling one caller
+    doesn't cancel the shared work for the others. Calls are counted in
+    the `single_flight_calls_total` metric, with `name` as the `call` label.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is None:
+            telemetry.count("single_flight_calls", call=self.name, result="started")
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+        else:
+            telemetry.count("single_flight_calls", call=self.name, result="coalesced")
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: asyncio.Task) -> None:
+        self._inflight.pop(key, None)
+        # Mark the exception retrieved in case every caller was cancelled.
+        if not task.cancelled():
+            task.exception()
+
+
+_arxiv_limiter: TokenBucketLimiter | None = None
+
+
+def get_arxiv_rate_limiter() -> TokenBucketLimiter:
+    """Return the limiter pacing requests to the arXiv export API."""
+    global _arxiv_limiter
+    if _arxiv_limiter is None and settings.multi_worker:
+        # One pace for the host, however many worker processes share it.
+        _arxiv_limiter = SharedTokenBucketLimiter(
+            path=settings.shared_state_path("rate_limits.sqlite3"),
+            name="arxiv",
+            interval=settings.arxiv_rate_limit_interval,
+            burst=settings.arxiv_rate_limit_burst,
+        )
+    elif _arxiv_limiter is None:
+        _arxiv_limiter = TokenBucketLimiter(
+            interval=settings.arxiv_rate_limit_interval,
+            burst=settings.arxiv_rate_limit_burst,
+        )
+    return _arxiv_limiter
@@ -0,0 +1,233 @@
+"""TTL cache for arXiv search results."""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, time as dt_time, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from arxiv_research_agent.config import settings
+from arxiv_research_agent.models import Paper
+
+logger = logging.getLogger(__name__)
+
+# arXiv announces new submissions at 20:00 US/Eastern, Sunday to Thursday.
+ARXIV_TZ = ZoneInfo("America/New_York")
+ARXIV_ANNOUNCE_TIME = dt_time(20, 0)
+ARXIV_ANNOUNCE_DAYS = {6, 0, 1, 2, 3}  # Sun, Mon, Tue, Wed, Thu
+
+_OPERATORS = {"AND", "OR", "ANDNOT"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS searches (
+    key TEXT PRIMARY KEY,
+    covered_since REAL NOT NULL,
+    papers TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+def normalize_query(search_query: str) -> str:
+    """Normalize a built arXiv query for use as a cache key.
+
+    Collapses whitespace and lowercases search terms. Boolean operators stay
+    uppercase since arXiv treats them case-sensitively.
+    """
+    tokens = search_query.split()
+    return " ".join(t if t in _OPERATORS else t.lower() for t in tokens)
+
+
+def next_listing_time(now: float) -> float:
+    """Return the timestamp of the next arXiv announcement after `now`."""
+    local = datetime.fromtimestamp(now, ARXIV_TZ)
+    candidate = datetime.combine(local.date(), ARXIV_ANNOUNCE_TIME, ARXIV_TZ)
+    while candidate <= local or candidate.weekday() not in ARXIV_ANNOUNCE_DAYS:
+        candidate = datetime.combine(
+            candidate.date() + timedelta(days=1), ARXIV_ANNOUNCE_TIME, ARXIV_TZ
+        )
+    return candidate.timestamp()
+
+
+class SearchCache:
+    """Cache of parsed search results keyed by normalized query.
+
+    Entries hold every paper fetched for a query, newest first, along with
+    `covered_since`: the timestamp down to which the listing is complete
+    (0 when the whole listing was read). One entry serves any later search
+    whose window falls inside the covered range, or that wants no more
+    papers than the entry already holds for its window. Entries expire after
+    `ttl` seconds or at the next arXiv listing, whichever comes first.
+
+    Results live in an in-process LRU; when `path` is set they are also
+    written to SQLite so other processes on the host can reuse them. Calls
+    may then block on the file, so async callers run them on a thread.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 6 * 3600,
+        max_entries: int = 256,
+        align_to_listing: bool = True,
+        path: str | Path | None = None,
+    ):
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._align_to_listing = align_to_listing
+        self._path = Path(path) if path else None
+        self._entries: OrderedDict[str, tuple[float, list[Paper], float]] = OrderedDict()
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._path is None:
+            return None
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(searches)")}
+            if columns and "covered_since" not in columns:
+                # Cached searches are disposable; rebuild files from older versions.
+                conn.execute("DROP TABLE searches")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _expires_at(self, now: float) -> float:
+        expires_at = now + self._ttl
+        if self._align_to_listing:
+            expires_at = min(expires_at, next_listing_time(now))
+        return expires_at
+
+    def get(
+        self,
+        search_query: str,
+        max_results: int,
+        since: datetime,
+    ) -> list[Paper] | None:
+        """Return up to `max_results` cached papers published since `since`.
+
+        Returns None on a miss, including when the cached listing doesn't
+        reach far enough back to answer the search completely.
+        """
+        key = normalize_query(search_query)
+        now = time.time()
+        with self._lock:
+            # The file may hold a fresher entry, written by another process.
+            for load in (self._entries.get, self._load):
+                entry = load(key)
+                if entry is None:
+                    continue
+                covered_since, papers, expires_at = entry
+                recent = [p for p in papers if p.published >= since]
+                complete = covered_since <= since.timestamp() or len(recent) >= max_results
+                if expires_at > now and complete:
+                    self._entries[key] = entry
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return recent[:max_results]
+
+            self.misses += 1
+            return None
+
+    def put(self, search_query: str, papers: list[Paper], covered_since: float) -> None:
+        """Store the papers fetched for a search, newest first.
+
+        Args:
+            search_query: The built arXiv query.
+            papers: Every paper fetched, before date filtering.
+            covered_since: Timestamp down to which the listing is complete.
+        """
+        key = normalize_query(search_query)
+        expires_at = self._expires_at(time.time())
+        entry = (covered_since, papers, expires_at)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            self._store(key, entry)
+
+    def invalidate(self, search_query: str | None = None) -> None:
+        """Drop one query's cached results, or everything when no query is given."""
+        with self._lock:
+            conn = self._connect()
+            if search_query is None:
+                self._entries.clear()
+                if conn is not None:
+                    conn.execute("DELETE FROM searches")
+                    conn.commit()
+                logger.info("🧹 search cache: invalidated all entries")
+                return
+
+            key = normalize_query(search_query)
+            self._entries.pop(key, None)
+            if conn is not None:
+                conn.execute("DELETE FROM searches WHERE key = ?", (key,))
+                conn.commit()
+
+    def stats(self) -> dict:
+        """Return hit/miss counters for the cache."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+        }
+
+    def _load(self, key: str) -> tuple[float, list[Paper], float] | None:
+        conn = self._connect()
+        if conn is None:
+            return None
+        row = conn.execute(
+            "SELECT covered_since, papers, expires_at FROM searches WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        covered_since, papers_json, expires_at = row
+        papers = [Paper.from_dict(p) for p in json.loads(papers_json)]
+        return covered_since, papers, expires_at
+
+    def _store(self, key: str, entry: tuple[float, list[Paper], float]) -> None:
+        conn = self._connect()
+        if conn is None:
+            return
+        covered_since, papers, expires_at = entry
+        papers_json = json.dumps([p.to_dict() for p in papers])
+        conn.execute(
+            "INSERT OR REPLACE INTO searches (key, covered_since, papers, expires_at) "
+            "VALUES (?, ?, ?, ?)",
+            (key, covered_since, papers_json, expires_at),
+        )
+        conn.execute("DELETE FROM searches WHERE expires_at <= ?", (time.time(),))
+        conn.commit()
+
+
+_search_cache: SearchCache | None = None
+
+
+def get_search_cache() -> SearchCache | None:
+    """Return the process-wide search cache, or None when disabled."""
+    global _search_cache
+    if not settings.search_cache_enabled:
+        return None
+    if _search_cache is None:
+        path = settings.search_cache_path
+        if path is None and settings.multi_worker:
+            path = settings.shared_state_path("searches.sqlite3")
+        _search_cache = SearchCache(
+            ttl=settings.search_cache_ttl,
+            max_entries=settings.search_cache_max_entries,
+            align_to_listing=settings.search_cache_align_to_listing,
+            path=path,
+        )
+    return _search_cache
@@ -0,0 +1,184 @@
+"""Async, retrying wrapper around the SurfaceDocs client."""
+
+import asyncio
+import logging
+import random
+import re
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+import httpx
+
+from arxiv_research_agent.config import settings
+from arxiv_research_agent.services import telemetry
+from arxiv_research_agent.services.deadline import remaining, trim_timeout
+
+# The SDK is imported on first save, keeping it out of application startup.
+if TYPE_CHECKING:
+    from surfacedocs import SaveResult, SurfaceDocs
+
+logger = logging.getLogger(__name__)
+
+_STATUS_CODE = re.compile(r"API error \((\d{3})\)")
+
+# Statuses meaning the server turned the request away without creating
+# anything.
+RETRY_STATUSES = frozenset({429, 503})
+
+# Timeout for the save running on this thread; read by _apply_timeout.
+_request_timeout: ContextVar[float | None] = ContextVar("surfacedocs_timeout", default=None)
+
+
+def _is_transient(exc: Exception) -> bool:
+    """Return True for failures that are safe to retry.
+
+    A save creates a document, so only failures where it cannot have been
+    created are retried: the connection was never made (connect errors and
+    timeouts, no free pool connection), or the server refused it with 429
+    or 503. A read timeout or other 5xx may come after the document exists.
+    """
+    from surfacedocs import SurfaceDocsError
+
+    if isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+        return True
+    if type(exc) is SurfaceDocsError:
+        # The SDK only reports unmapped status codes in the message.
+        match = _STATUS_CODE.match(str(exc))
+        if match:
+            return int(match.group(1)) in RETRY_STATUSES
+    return False
+
+
+def _apply_timeout(request: httpx.Request) -> None:
+    """Request hook: replace the SDK's fixed timeout with this save's."""
+    timeout = _request_timeout.get()
+    if timeout is not None:
+        request.extensions["timeout"] = httpx.Timeout(timeout).as_dict()
+
+
+def _save(
+    client: "SurfaceDocs", document: dict, folder_id: str | None, timeout: float
+) -> "SaveResult":
+    """Run one save on a worker thread with its own request timeout."""
+    token = _request_timeout.set(timeout)
+    try:
+        return client.save(document, folder_id=folder_id)
+    finally:
+        _request_timeout.reset(token)
+
+
+class DocumentPublisher:
+    """Publishes documents to SurfaceDocs without blocking the event loop.
+
+    One SDK client (and its connection pool) is reused for every save. The
+    SDK is synchronous, so saves run on a worker thread and transient
+    failures are retried with exponential backoff and jitter. Each attempt's
+    timeout is trimmed to the run deadline.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str | None = None,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 30.0,
+    ):
+        self._api_key = api_key
+        self._base_url = base_url
+        self._max_retries = max_retries
+        self._backoff = backoff
+        self._timeout = timeout
+        self._client: "SurfaceDocs | None" = None
+
+    def _get_client(self) -> "SurfaceDocs":
+        if self._client is None:
+            from surfacedocs import SurfaceDocs
+
+            self._client = SurfaceDocs(api_key=self._api_key, base_url=self._base_url)
+            # The SDK fixes a 30s timeout on its httpx client and neither its
+            # constructor nor save() takes one, so a request hook on that
+            # (private) client sets each save's own, where it can.
+            http_client = getattr(self._client, "_client", None)
+            if isinstance(http_client, httpx.Client):
+                http_client.event_hooks["request"].append(_apply_timeout)
+            else:
+                logger.warning(
+                    "⚠️ SurfaceDocs SDK has no httpx client to hook; saves use its own timeout"
+                )
+        return self._client
+
+    async def publish(
+        self,
+        document: dict,
+        folder_id: str | None = None,
+        deadline: float | None = None,
+    ) -> "SaveResult":
+        """Save a document, retrying transient failures.
+
+        With `deadline` (a wall-clock time), each attempt's timeout is
+        trimmed to the time left and no retry is started whose backoff would
+        end past it.
+
+        Raises:
+            SurfaceDocsError or httpx.HTTPError once retries are exhausted
+            or on a non-transient failure.
+            DeadlineExceeded: If the deadline passes before an attempt.
+        """
+        with telemetry.span("document_save"):
+            return await self._publish(document, folder_id, deadline)
+
+    async def _publish(
+        self, document: dict, folder_id: str | None, deadline: float | None
+    ) -> "SaveResult":
+        from surfacedocs import SurfaceDocsError
+
+        client = self._get_client()
+        attempt = 0
+        while True:
+            try:
+                timeout = trim_timeout(self._timeout, deadline)
+                return await asyncio.to_thread(_save, client, document, folder_id, timeout)
+            except (SurfaceDocsError, httpx.HTTPError) as e:
+                if attempt >= self._max_retries or not _is_transient(e):
+                    raise
+                delay = self._backoff * (2 ** attempt) * random.uniform(0.5, 1.5)
+                left = remaining(deadline)
+                if left is not None and delay >= left:
+                    raise
+                attempt += 1
+                logger.warning(
+                    "⚠️ SurfaceDocs save failed (%s), retry %d/%d in %.1fs",
+                    e, attempt, self._max_retries, delay,
+                )
+                await asyncio.sleep(delay)
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+_publisher: DocumentPublisher | None = None
+
+
+def get_publisher() -> DocumentPublisher:
+    """Return the process-wide SurfaceDocs publisher."""
+    global _publisher
+    if _publisher is None:
+        _publisher = DocumentPublisher(
+            api_key=settings.surfacedocs_api_key,
+            base_url=settings.surfacedocs_base_url,
+            max_retries=settings.surfacedocs_max_retries,
+            backoff=settings.surfacedocs_retry_backoff,
+            timeout=settings.surfacedocs_timeout,
+        )
+    return _publisher
+
+
+def close_publisher() -> None:
+    """Close the publisher's connections. Called on application shutdown."""
+    global _publisher
+    if _publisher is not None:
+        _publisher.close()
+        _publisher = None
@@ -0,0 +1,217 @@
+"""Process-wide performance metrics and per-run timing breakdowns."""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+
+PREFIX = "arxiv_agent_"
+
+# Bucket upper bounds for durations in seconds, and for sizes (bytes,
+# characters, tokens).
+TIME_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+SIZE_BUCKETS = (100, 1_000, 5_000, 10_000, 50_000, 100_000, 500_000, 1_000_000, 5_000_000)
+
+_SIZE_SUFFIXES = ("_bytes", "_chars", "_tokens")
+
+_HELP = {
+    "research_run_seconds": "Duration of research runs",
+    "research_runs_total": "Research runs by final status",
+    "research_batch_seconds": "Duration of research batches",
+    "llm_turn_seconds": "Duration of model calls",
+    "llm_tokens_total": "Model tokens by kind",
+    "tool_seconds": "Duration of agent tool calls",
+    "tool_result_chars": "Characters returned to the model per tool call",
+    "arxiv_request_seconds": "Duration of arXiv API page requests, including parsing",
+    "arxiv_response_bytes": "Bytes read per arXiv API page",
+    "arxiv_rate_limit_wait_seconds": "Time spent waiting for the arXiv rate limiter",
+    "paper_download_seconds": "Duration of paper HTML downloads, including extraction",
+    "paper_download_bytes": "Bytes downloaded per paper HTML response",
+    "executor_wait_seconds": "Time parsing tasks waited for a worker",
+    "executor_run_seconds": "Time parsing tasks ran on a worker",
+    "executor_queue_depth": "Parsing tasks waiting for a free worker",
+    "executor_in_flight": "Parsing tasks submitted and not yet finished",
+    "executor_max_queue_depth": "Most parsing tasks ever waiting for a free worker at once",
+    "document_save_seconds": "Duration of SurfaceDocs saves, including retries",
+    "cache_lookups_total": "Cache lookups by cache and result",
+    "single_flight_calls_total": "Upstream calls started or coalesced into one already in flight",
+    "llm_turns_total": "Model calls",
+    "research_jobs_queued": "Background research jobs waiting for a worker",
+    "text_store_bytes": "Compressed paper text held in the text store",
+}
+
+
+def _label_key(labels: dict[str, str]) -> tuple[tuple[str, str], ...]:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: tuple[tuple[str, str], ...], le: str | None = None) -> str:
+    pairs = [*labels, ("le", le)] if le is not None else list(labels)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class MetricsRegistry:
+    """Counters, gauges and histograms rendered in Prometheus text format.
+
+    Metrics are created on first use; histograms pick time or size buckets
+    from their name. Safe to update from worker threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[tuple, float]] = {}
+        self._gauges: dict[str, dict[tuple, float]] = {}
+        # name -> label key -> [bucket counts..., sum, count]
+        self._histograms: dict[str, dict[tuple, list[float]]] = {}
+
+    def inc(self, name: str, amount: float = 1, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def set_gauge(self, name: str, value: float, **labels) -> None:
+        with self._lock:
+            self._gauges.setdefault(name, {})[_label_key(labels)] = value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        buckets = self._buckets(name)
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            counts = series.get(key)
+            if counts is None:
+                counts = series[key] = [0] * (len(buckets) + 2)
+            # Buckets are cumulative: a value counts towards every bound above it.
+            for i, bound in enumerate(buckets):
+                if value <= bound:
+                    counts[i] += 1
+            counts[-2] += value
+            counts[-1] += 1
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        lines: list[str] = []
+        with self._lock:
+            for kind, registry in (("counter", self._counters), ("gauge", self._gauges)):
+                for name, series in sorted(registry.items()):
+                    self._header(lines, name, kind)
+                    for key, value in sorted(series.items()):
+                        lines.append(f"{PREFIX}{name}{_format_labels(key)} {_format_value(value)}")
+
+            for name, series in sorted(self._histograms.items()):
+                self._header(lines, name, "histogram")
+                buckets = self._buckets(name)
+                for key, counts in sorted(series.items()):
+                    for bound, in_bucket in zip(buckets, counts):
+                        labels = _format_labels(key, _format_value(bound))
+                        lines.append(f"{PREFIX}{name}_bucket{labels} {in_bucket}")
+                    lines.append(f"{PREFIX}{name}_bucket{_format_labels(key, '+Inf')} {counts[-1]}")
+                    lines.append(f"{PREFIX}{name}_sum{_format_labels(key)} {_format_value(counts[-2])}")
+                    lines.append(f"{PREFIX}{name}_count{_format_labels(key)} {counts[-1]}")
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _header(lines: list[str], name: str, kind: str) -> None:
+        lines.append(f"# HELP {PREFIX}{name} {_HELP.get(name, name.replace('_', ' '))}")
+        lines.append(f"# TYPE {PREFIX}{name} {kind}")
+
+    @staticmethod
+    def _buckets(name: str) -> tuple[float, ...]:
+        return SIZE_BUCKETS if name.endswith(_SIZE_SUFFIXES) else TIME_BUCKETS
+
+
+@dataclass
+class RunStats:
+    """Time and counts accumulated by one research run.
+
+    Phases overlap: a tool call's time includes the downloads it made.
+    """
+
+    started: float = field(default_factory=time.perf_counter)
+    phases: dict[str, float] = field(default_factory=dict)
+    counts: dict[str, int] = field(default_factory=dict)
+
+    def add_time(self, key: str, seconds: float) -> None:
+        self.phases[key] = self.phases.get(key, 0.0) + seconds
+
+    def add_count(self, key: str, amount: int) -> None:
+        self.counts[key] = self.counts.get(key, 0) + amount
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+
+metrics = MetricsRegistry()
+
+_current_run: ContextVar[RunStats | None] = ContextVar("current_run", default=None)
+
+
+def _run_key(name: str, labels: dict[str, str]) -> str:
+    """Key for a run breakdown entry, e.g. "tool.search_arxiv"."""
+    return ".".join([name, *(str(v) for v in labels.values())])
+
+
+@contextmanager
+def track_run() -> Iterator[RunStats]:
+    """Attribute spans and counts recorded in this context to a new run.
+
+    Tasks and threads started inside inherit the run through contextvars.
+    """
+    stats = RunStats()
+    token = _current_run.set(stats)
+    try:
+        yield stats
+    finally:
+        try:
+            _current_run.reset(token)
+        except ValueError:
+            # Closed from another context (e.g. a generator finalized by GC).
+            pass
+
+
+def observe_seconds(name: str, seconds: float, **labels) -> None:
+    """Record a duration in the `<name>_seconds` histogram and the current run."""
+    metrics.observe(f"{name}_seconds", seconds, **labels)
+    run = _current_run.get()
+    if run is not None:
+        run.add_time(_run_key(name, labels), seconds)
+
+
+@contextmanager
+def span(name: str, **labels) -> Iterator[None]:
+    """Time the enclosed block with `observe_seconds`."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_seconds(name, time.perf_counter() - started, **labels)
+
+
+def record_size(name: str, value: int, **labels) -> None:
+    """Record a size (bytes, characters) in the `<name>` histogram and the current run."""
+    metrics.observe(name, value, **labels)
+    run = _current_run.get()
+    if run is not None:
+        run.add_count(_run_key(name, labels), value)
+
+
+def count(name: str, amount: int = 1, **labels) -> None:
+    """Increment the `<name>_total` counter and the current run's count."""
+    metrics.inc(f"{name}_total", amount, **labels)
+    run = _current_run.get()
+    if run is not None:
+        run.add_count(_run_key(name, labels), amount)
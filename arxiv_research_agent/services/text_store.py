@@ -0,0 +1,98 @@
+"""Compressed in-process store for paper text sent to the model."""
+
+import hashlib
+import logging
+import threading
+import zlib
+from collections import OrderedDict
+
+from arxiv_research_agent.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class TextStore:
+    """Bounded LRU of zlib-compressed text, keyed by content hash.
+
+    Tool results keep only a key into the store, so session histories stay
+    small however many papers a run reads; the text is decompressed when a
+    model request is built. The store is shared by every run in the worker
+    and holds at most `max_bytes` of compressed text, evicting least
+    recently used entries first. Identical text read by several runs is
+    stored once.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def put(self, prefix: str, text: str) -> str:
+        """Store text and return its key, which starts with `prefix`."""
+        raw = text.encode("utf-8")
+        key = f"{prefix}:{hashlib.blake2b(raw, digest_size=12).hexdigest()}"
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return key
+        blob = zlib.compress(raw)
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = blob
+                self._size += len(blob)
+                self._evict()
+        return key
+
+    def get(self, key: str) -> str | None:
+        """Return stored text, or None if it was evicted or never stored."""
+        with self._lock:
+            blob = self._entries.get(key)
+            if blob is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return zlib.decompress(blob).decode("utf-8")
+
+    def _evict(self) -> None:
+        while self._size > self._max_bytes and len(self._entries) > 1:
+            key, blob = self._entries.popitem(last=False)
+            self._size -= len(blob)
+            self.evictions += 1
+            logger.info("🧹 text store: evicted %s", key)
+
+    @property
+    def size(self) -> int:
+        """Compressed bytes currently held."""
+        return self._size
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current store size."""
+        with self._lock:
+            entries, size = len(self._entries), self._size
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": size,
+        }
+
+
+_text_store: TextStore | None = None
+
+
+def get_text_store() -> TextStore | None:
+    """Return the process-wide text store, or None when disabled."""
+    global _text_store
+    if not settings.text_store_enabled:
+        return None
+    if _text_store is None:
+        _text_store = TextStore(max_bytes=settings.text_store_max_bytes)
+    return _text_store
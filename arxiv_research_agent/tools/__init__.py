@@ -1,4 +1,4 @@
-from arxiv_research_agent.tools.arxiv import search_arxiv, fetch_paper_content
+from arxiv_research_agent.tools.arxiv import search_arxiv, fetch_paper_content, fetch_papers
 from arxiv_research_agent.tools.surfacedocs import save_document
 
-__all__ = ["search_arxiv", "fetch_paper_content", "save_document"]
+__all__ = ["search_arxiv", "fetch_paper_content", "fetch_papers", "save_document"]
@@ -1,31 +1,91 @@
 """ArXiv tools for the research agent."""
 
+import asyncio
+import json
 import logging
+from typing import Optional
 
+import httpx
 from google.adk.tools import ToolContext
 
-from arxiv_research_agent.services import ArxivClient, PaperFetcher
+from arxiv_research_agent.models import Paper, PaperContent
+from arxiv_research_agent.services import (
+    ArxivClient,
+    PaperFetcher,
+    get_arxiv_rate_limiter,
+    get_html_executor,
+    get_metadata_index,
+    get_paper_cache,
+    get_parse_executor,
+    get_search_cache,
+    get_text_store,
+    telemetry,
+)
+from arxiv_research_agent.services.deadline import remaining
+from arxiv_research_agent.services.paper_sections import (
+    chunk_sections,
+    order_sections,
+    read_budgeted,
+)
+from arxiv_research_agent.services.ranking import query_terms, rank_papers
 from arxiv_research_agent.config import settings
 
 logger = logging.getLogger(__name__)
 
+OUT_OF_TIME = "Out of time for searching and reading. Save your document now with what you have."
+TEXT_UNAVAILABLE = (
+    "The text of this paper is no longer available and could not be read again."
+    " Rely only on what you already noted from it."
+)
+
+# Shared across tool calls; both resolve the pooled HTTP client per request.
+_arxiv_client = ArxivClient(
+    cache=get_search_cache(),
+    executor=get_parse_executor(),
+    rate_limiter=get_arxiv_rate_limiter(),
+    index=get_metadata_index(),
+    page_size=settings.arxiv_page_size,
+    max_pages=settings.arxiv_max_pages,
+    api_url=settings.arxiv_api_url,
+)
+_paper_fetcher = PaperFetcher(
+    cache=get_paper_cache(),
+    executor=get_html_executor(),
+    race_sources=settings.fetch_race_sources,
+    hedge_after=settings.fetch_hedge_after,
+    html_base_url=settings.arxiv_html_base_url,
+    fallback_html_base_url=settings.ar5iv_html_base_url,
+)
+
 
 async def search_arxiv(
     query: str,
     days_back: int,
     max_results: int,
     tool_context: ToolContext,
+    # Optional[...] rather than "| None": ADK's function declaration parser
+    # only handles typing.Union for optional list parameters.
+    additional_queries: Optional[list[str]] = None,
 ) -> dict:
     """Search arXiv for research papers matching the query.
 
     Use this tool to find papers on a topic. You can refine searches
     based on initial results. Each call counts toward the limit.
 
+    To cover several angles of a topic at once, pass extra queries in
+    'additional_queries'. They run together in the same call and the
+    results are merged with duplicates removed.
+
+    Results are ranked by relevance to the research query and only the
+    best matches are returned, each with a relevance 'score'. Papers
+    returned by earlier searches are not repeated.
+
     Args:
         query: Search query. Supports keywords, phrases, and arXiv syntax
                like "ti:transformer" (title) or "au:bengio" (author).
         days_back: How many days back to search (1-30).
-        max_results: Maximum papers to return (1-50).
+        max_results: Maximum papers to return in total (1-50).
+        additional_queries: Optional further queries to run in this call.
 
     Returns:
         Dict with 'papers' list and 'calls_remaining' count.
@@ -33,6 +93,11 @@ async def search_arxiv(
     # Track API calls
     calls_used = tool_context.state.get("arxiv_calls_used", 0)
     max_calls = settings.max_arxiv_calls
+    deadline = _work_deadline(tool_context)
+
+    if _out_of_time(deadline):
+        logger.warning("⏱️ search_arxiv: run deadline reached")
+        return {"status": "error", "error": OUT_OF_TIME, "calls_remaining": max_calls - calls_used}
 
     if calls_used >= max_calls:
         logger.warning("🚫 search_arxiv: API call limit reached (%d/%d)", calls_used, max_calls)
@@ -45,52 +110,116 @@ async def search_arxiv(
     # Increment call counter
     tool_context.state["arxiv_calls_used"] = calls_used + 1
 
-    logger.info("🔍 search_arxiv: query='%s', days_back=%d, max_results=%d (call %d/%d)",
-                query, days_back, max_results, calls_used + 1, max_calls)
+    queries = list(dict.fromkeys([query, *(additional_queries or [])]))
+    queries = queries[:settings.search_max_queries]
 
-    client = ArxivClient()
-    papers = await client.search(
-        query=query,
-        days_back=min(days_back, 30),
-        max_results=min(max_results, 50),
-    )
+    logger.info("🔍 search_arxiv: queries=%s, days_back=%d, max_results=%d (call %d/%d)",
+                queries, days_back, max_results, calls_used + 1, max_calls)
+
+    max_results = min(max_results, 50)
+    candidates = max_results
+    if settings.search_rank_enabled:
+        # Rank from a wider pool than is returned; it costs no extra requests.
+        candidates = min(max(max_results, settings.search_rank_candidates), 50)
+
+    try:
+        async with asyncio.timeout(remaining(deadline)):
+            papers = await _arxiv_client.search_many(
+                queries=queries,
+                days_back=min(days_back, 30),
+                max_results=candidates,
+                deadline=deadline,
+            )
+    except (TimeoutError, httpx.TimeoutException):
+        if not _out_of_time(deadline):
+            raise
+        logger.warning("⏱️ search_arxiv: run deadline reached")
+        return {"status": "error", "error": OUT_OF_TIME, "calls_remaining": max_calls - calls_used - 1}
 
     logger.info("📄 search_arxiv: found %d papers", len(papers))
 
-    return {
+    if not settings.search_rank_enabled:
+        return _with_time_left({
+            "status": "success",
+            "papers": [_search_hit(p) for p in papers[:max_results]],
+            "total_found": len(papers),
+            "queries_run": queries,
+            "calls_remaining": max_calls - calls_used - 1,
+        }, deadline)
+
+    seen = tool_context.state.get("papers_seen", [])
+    seen_ids = set(seen)
+    unseen = [p for p in papers if p.id not in seen_ids]
+    terms = query_terms(tool_context.state.get("research_query", ""), *queries)
+    ranked = await get_parse_executor().run(
+        "rank_results", rank_papers, terms, unseen, min(max_results, settings.search_rank_top_k)
+    )
+    tool_context.state["papers_seen"] = seen + [p.id for p, _ in ranked]
+
+    logger.info("🏅 search_arxiv: returning top %d of %d new papers (%d already seen)",
+                len(ranked), len(unseen), len(papers) - len(unseen))
+
+    response = {
         "status": "success",
-        "papers": [
-            {
-                "id": p.id,
-                "title": p.title,
-                "abstract": p.abstract[:500] + "..." if len(p.abstract) > 500 else p.abstract,
-                "authors": p.authors[:5],
-                "published": p.published.isoformat(),
-                "url": p.url,
-            }
-            for p in papers
-        ],
+        "papers": [{**_search_hit(p), "score": round(score, 2)} for p, score in ranked],
         "total_found": len(papers),
+        "queries_run": queries,
         "calls_remaining": max_calls - calls_used - 1,
     }
+    if len(unseen) < len(papers):
+        response["already_seen"] = len(papers) - len(unseen)
+    return _with_time_left(response, deadline)
 
 
-async def fetch_paper_content(arxiv_id: str, tool_context: ToolContext) -> dict:
-    """Fetch the full text content of a paper from ar5iv.org.
+async def fetch_paper_content(
+    arxiv_id: str,
+    tool_context: ToolContext,
+    sections: Optional[list[str]] = None,
+    # Defaults are resolved here rather than in the signature: Google AI
+    # function declarations can't carry default values.
+    max_chars: Optional[int] = None,
+    cursor: Optional[int] = None,
+) -> dict:
+    """Read a paper's full text from its arXiv HTML version, section by section.
+
+    Use this to read a paper when the abstract isn't enough. Only fetch
+    papers that seem highly relevant based on search results.
 
-    Use this to read the complete paper when the abstract isn't enough.
-    Only fetch papers that seem highly relevant based on search results.
+    By default the most useful sections come first (abstract, conclusion,
+    introduction, results, method, then the rest) up to max_chars. If
+    'next_cursor' is set in the response, call again with that cursor to
+    read more. Pass 'sections' to read only specific sections by title.
 
     Args:
         arxiv_id: The arXiv paper ID (e.g., "2401.12345" or "2401.12345v1").
+        sections: Optional section titles to read, e.g. ["method", "results"].
+                  "abstract" and "references" are also accepted.
+        max_chars: Maximum characters of section text to return
+                   (default {paper_max_chars}).
+        cursor: Where to continue reading, from a previous 'next_cursor'
+                (default 0, the start).
 
     Returns:
-        Dict with paper title and full text content.
+        Dict with the paper title, the returned 'sections', all
+        'available_sections', and 'next_cursor' (null when fully read).
     """
-    logger.info("📖 fetch_paper_content: fetching paper %s", arxiv_id)
+    if max_chars is None:
+        max_chars = settings.paper_max_chars
+    if cursor is None:
+        cursor = 0
+
+    logger.info("📖 fetch_paper_content: fetching paper %s (cursor=%d)", arxiv_id, cursor)
+
+    deadline = _work_deadline(tool_context)
+    try:
+        async with asyncio.timeout(remaining(deadline)):
+            content = await _paper_fetcher.fetch(arxiv_id, deadline)
+    except TimeoutError:
+        content = None
 
-    fetcher = PaperFetcher()
-    content = await fetcher.fetch(arxiv_id)
+    if content is None and _out_of_time(deadline):
+        logger.warning("⏱️ fetch_paper_content: run deadline reached before %s was read", arxiv_id)
+        return {"status": "error", "error": OUT_OF_TIME}
 
     if content is None:
         logger.warning("❌ fetch_paper_content: could not fetch paper %s", arxiv_id)
@@ -99,16 +228,245 @@ async def fetch_paper_content(arxiv_id: str, tool_context: ToolContext) -> dict:
             "error": f"Could not fetch paper {arxiv_id}. It may not have an HTML version.",
         }
 
-    # Track which papers we've read
-    papers_read = tool_context.state.get("papers_read", [])
-    papers_read.append(arxiv_id)
-    tool_context.state["papers_read"] = papers_read
+    _track_papers_read(tool_context, [arxiv_id])
+
+    payload = _paper_payload(content, sections, max_chars, cursor)
+
+    logger.info(
+        "✅ fetch_paper_content: fetched '%s' (%d of %d chars)",
+        content.title[:50],
+        _section_chars(payload),
+        len(content.content),
+    )
+
+    return _with_time_left({"status": "success", **payload}, deadline)
+
+
+fetch_paper_content.__doc__ = fetch_paper_content.__doc__.format(
+    paper_max_chars=settings.paper_max_chars
+)
+
+
+async def fetch_papers(
+    arxiv_ids: list[str],
+    tool_context: ToolContext,
+    max_chars_per_paper: Optional[int] = None,
+) -> dict:
+    """Read several papers at once, fetched in parallel.
+
+    Prefer this over repeated fetch_paper_content calls when you already
+    know which papers you want to read. Each paper returns its most useful
+    sections first, up to max_chars_per_paper. Use fetch_paper_content
+    with a paper's 'next_cursor' to read more of it.
+
+    Args:
+        arxiv_ids: The arXiv paper IDs to read (e.g., ["2401.12345", "2401.54321"]).
+        max_chars_per_paper: Maximum characters of section text per paper
+                             (default {paper_batch_max_chars}).
+
+    Returns:
+        Dict with 'papers' (one entry per paper read) and 'failed' (IDs
+        that could not be fetched).
+    """
+    if max_chars_per_paper is None:
+        max_chars_per_paper = settings.paper_batch_max_chars
+    max_papers = settings.fetch_batch_max_papers
+    requested = list(dict.fromkeys(arxiv_ids))
+    skipped = requested[max_papers:]
+    requested = requested[:max_papers]
+
+    logger.info("📚 fetch_papers: fetching %d papers", len(requested))
+
+    deadline = _work_deadline(tool_context)
+    results = await _paper_fetcher.fetch_many(
+        requested, concurrency=settings.fetch_concurrency, deadline=deadline
+    )
+
+    papers = []
+    failed = []
+    for arxiv_id, content in results.items():
+        if content is None:
+            failed.append(arxiv_id)
+            continue
+        papers.append(_paper_payload(content, None, max_chars_per_paper, 0))
 
-    logger.info("✅ fetch_paper_content: fetched '%s' (%d chars)", content.title[:50], len(content.content))
+    _track_papers_read(tool_context, [p["paper_id"] for p in papers])
 
+    logger.info("✅ fetch_papers: fetched %d, failed %d", len(papers), len(failed))
+
+    response = {
+        "status": "success" if papers else "error",
+        "papers": papers,
+        "failed": failed,
+    }
+    if skipped:
+        response["skipped"] = skipped
+        response["note"] = f"Only the first {max_papers} papers are fetched per call."
+    if failed and _out_of_time(deadline):
+        response["note"] = OUT_OF_TIME
+    return _with_time_left(response, deadline)
+
+
+fetch_papers.__doc__ = fetch_papers.__doc__.format(
+    paper_batch_max_chars=settings.paper_batch_max_chars
+)
+
+
+def _work_deadline(tool_context: ToolContext) -> float | None:
+    """When this run must stop searching and reading, leaving time to save."""
+    return tool_context.state.get("work_deadline")
+
+
+def _out_of_time(deadline: float | None) -> bool:
+    left = remaining(deadline)
+    return left is not None and left <= 0
+
+
+def _with_time_left(response: dict, deadline: float | None) -> dict:
+    """Tell the model how long it has left for searching and reading."""
+    left = remaining(deadline)
+    if left is not None:
+        response["seconds_left"] = max(int(left), 0)
+    return response
+
+
+def _search_hit(paper: Paper) -> dict:
+    """Shape a search hit with only the configured fields, abstract truncated."""
+    hit = {}
+    for field in settings.search_result_fields:
+        if field == "abstract":
+            hit[field] = _truncate(paper.abstract, settings.search_abstract_chars)
+        elif field == "authors":
+            authors = paper.authors[:settings.search_max_authors]
+            if len(paper.authors) > len(authors):
+                authors.append("et al.")
+            hit[field] = authors
+        elif field == "published":
+            hit[field] = paper.published.date().isoformat()
+        else:
+            hit[field] = getattr(paper, field)
+    return hit
+
+
+def _truncate(text: str, max_chars: int) -> str:
+    """Cut text at a word boundary, marking the cut with '...'."""
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars].rsplit(" ", 1)[0] + "..."
+
+
+def _paper_payload(
+    content: PaperContent,
+    sections: list[str] | None,
+    max_chars: int,
+    cursor: int,
+) -> dict:
+    """Shape a paper into budgeted sections for the model.
+
+    With the text store enabled the section text goes into the store and
+    the payload holds a 'sections_ref' instead, so the session history
+    keeps only the reference. `materialize_paper_text` puts the text back
+    into each model request.
+    """
+    returned, next_cursor = _read_sections(content, sections, max_chars, cursor)
+    store = get_text_store()
+    if store is None:
+        text = {"sections": returned}
+    else:
+        stored = json.dumps(returned)
+        text = {"sections_ref": {
+            "key": store.put(content.paper_id, stored),
+            "chars": len(stored),
+            "sections": sections,
+            "max_chars": max_chars,
+            "cursor": cursor,
+        }}
     return {
-        "status": "success",
         "paper_id": content.paper_id,
         "title": content.title,
-        "content": content.content
-    }
\ No newline at end of file
+        **text,
+        "available_sections": [s.title for s in content.sections],
+        "next_cursor": next_cursor,
+    }
+
+
+def _read_sections(
+    content: PaperContent,
+    sections: list[str] | None,
+    max_chars: int,
+    cursor: int,
+) -> tuple[list[dict], int | None]:
+    """The budgeted sections of a read and the cursor to continue from."""
+    chunks = chunk_sections(order_sections(content, sections), settings.paper_chunk_chars)
+    returned, next_cursor = read_budgeted(chunks, cursor, max_chars)
+    return [{"title": s.title, "content": s.content} for s in returned], next_cursor
+
+
+def _section_chars(payload: dict) -> int:
+    """Characters of section text in a paper payload, stored or inline."""
+    if "sections_ref" in payload:
+        return payload["sections_ref"]["chars"]
+    return sum(len(s["content"]) for s in payload["sections"])
+
+
+async def materialize_paper_text(
+    tool_name: str, response: dict, deadline: float | None = None
+) -> None:
+    """Replace 'sections_ref' in a paper tool's result with the stored text.
+
+    Called on the copy of the result in a model request, so the session
+    keeps the reference. Text evicted from the store is read again from
+    the paper, through the paper cache when it is enabled, all papers at
+    once and only until `deadline`. A paper that can't be read again gets
+    a 'text_unavailable' note in place of its sections.
+    """
+    if tool_name == "fetch_papers":
+        payloads = response.get("papers") or []
+    elif tool_name == "fetch_paper_content":
+        payloads = [response]
+    else:
+        return
+
+    payloads = [p for p in payloads if "sections_ref" in p]
+    loaded = await asyncio.gather(
+        *(_load_sections(p["paper_id"], p["sections_ref"], deadline) for p in payloads)
+    )
+    for payload, sections in zip(payloads, loaded):
+        # Rebuilt in order, so the model sees the same layout as inline text.
+        items = list(payload.items())
+        payload.clear()
+        for key, value in items:
+            if key != "sections_ref":
+                payload[key] = value
+            elif sections is None:
+                payload["text_unavailable"] = TEXT_UNAVAILABLE
+            else:
+                payload["sections"] = sections
+
+
+async def _load_sections(paper_id: str, ref: dict, deadline: float | None) -> list[dict] | None:
+    """The referenced sections, or None if they are gone and can't be re-read."""
+    store = get_text_store()
+    text = store.get(ref["key"]) if store is not None else None
+    telemetry.count("cache_lookups", cache="text", result="miss" if text is None else "hit")
+    if text is not None:
+        return json.loads(text)
+
+    logger.info("♻️ materialize_paper_text: re-reading evicted text of %s", paper_id)
+    content = await _paper_fetcher.fetch(paper_id, deadline)
+    if content is None:
+        logger.warning("❌ materialize_paper_text: could not re-read paper %s", paper_id)
+        return None
+    sections, _ = _read_sections(content, ref["sections"], ref["max_chars"], ref["cursor"])
+    if store is not None:
+        store.put(paper_id, json.dumps(sections))
+    return sections
+
+
+def _track_papers_read(tool_context: ToolContext, arxiv_ids: list[str]) -> None:
+    """Record papers read in session state, without duplicates."""
+    papers_read = tool_context.state.get("papers_read", [])
+    for arxiv_id in arxiv_ids:
+        if arxiv_id not in papers_read:
+            papers_read.append(arxiv_id)
+    tool_context.state["papers_read"] = papers_read
@@ -2,14 +2,15 @@
 
 import logging
 
-from surfacedocs import SurfaceDocs
+from google.adk.tools import ToolContext
 
 from arxiv_research_agent.config import settings
+from arxiv_research_agent.services import get_publisher
 
 logger = logging.getLogger(__name__)
 
 
-async def save_document(document: dict) -> dict:
+async def save_document(document: dict, tool_context: ToolContext) -> dict:
     """Save the research document to Surfacedocs.
 
     Call this once you have synthesized your findings into a complete document.
@@ -47,11 +48,10 @@ async def save_document(document: dict) -> dict:
     block_count = len(document.get("blocks", []))
     logger.info("💾 save_document: saving '%s' (%d blocks)", title, block_count)
 
-    client = SurfaceDocs(api_key=settings.surfacedocs_api_key)
-
-    result = client.save(
+    result = await get_publisher().publish(
         document,
         folder_id=settings.surfacedocs_folder_id,
+        deadline=tool_context.state.get("deadline"),
     )
 
     logger.info("✅ save_document: saved to %s", result.url)
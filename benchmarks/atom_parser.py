@@ -0,0 +1,100 @@
+"""Microbenchmark of the streaming Atom parser against feedparser.
+
+Parses synthetic arXiv API feeds (or recorded ones passed with --feed) and
+reports full-parse time, time to the first paper when the body arrives in
+chunks, time when a date cutoff stops the parse early, and peak memory.
+
+    python -m benchmarks.atom_parser --entries 50 500 2000
+    python -m benchmarks.atom_parser --feed recorded.xml
+"""
+
+import argparse
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from arxiv_research_agent.services.atom_parser import AtomFeedParser, parse_feed
+from benchmarks.fixtures import make_feed
+
+try:
+    import feedparser
+except ImportError:  # Only used for comparison; install the "bench" group.
+    feedparser = None
+
+CHUNK_BYTES = 16 * 1024
+
+
+def measure(fn, repeat: int) -> tuple[float, float]:
+    """Return (best time in ms, peak traced memory in MiB) of fn()."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / 2**20
+
+
+def first_paper_ms(data: bytes) -> float:
+    """Time until the streaming parser yields its first paper, fed in chunks."""
+    started = time.perf_counter()
+    parser = AtomFeedParser()
+    for offset in range(0, len(data), CHUNK_BYTES):
+        if parser.feed(data[offset:offset + CHUNK_BYTES]):
+            break
+    return (time.perf_counter() - started) * 1000
+
+
+def streamed_with_cutoff(data: bytes, since: datetime) -> int:
+    parser = AtomFeedParser(since)
+    for offset in range(0, len(data), CHUNK_BYTES):
+        parser.feed(data[offset:offset + CHUNK_BYTES])
+        if parser.done:
+            break
+    return parser.entries
+
+
+def bench(name: str, data: bytes, repeat: int) -> None:
+    _, entries = parse_feed(data)
+    print(f"\n{name}: {entries} entries, {len(data) / 1024:,.0f} KiB")
+
+    if feedparser is not None:
+        ms, mib = measure(lambda: feedparser.parse(data), repeat)
+        print(f"  feedparser full parse        {ms:9.1f} ms  peak {mib:7.1f} MiB")
+    else:
+        print("  feedparser not installed; skipping comparison")
+
+    ms, mib = measure(lambda: parse_feed(data), repeat)
+    print(f"  AtomFeedParser full parse    {ms:9.1f} ms  peak {mib:7.1f} MiB")
+
+    ttfp = min(first_paper_ms(data) for _ in range(repeat))
+    print(f"  AtomFeedParser first paper   {ttfp:9.2f} ms")
+
+    # A 7-day window over hourly entries: everything past entry 168 is discarded.
+    since = datetime.now(timezone.utc) - timedelta(days=7)
+    ms, mib = measure(lambda: streamed_with_cutoff(data, since), repeat)
+    read = streamed_with_cutoff(data, since)
+    print(f"  AtomFeedParser 7-day cutoff  {ms:9.1f} ms  peak {mib:7.1f} MiB  ({read} entries read)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, nargs="*", default=[50, 500, 2000])
+    parser.add_argument("--feed", type=Path, action="append", default=[],
+                        help="Recorded arXiv API response to parse (repeatable)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for path in args.feed:
+        bench(str(path), path.read_bytes(), args.repeat)
+    for entries in args.entries:
+        bench("synthetic feed", make_feed(entries), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""Atom feed and paper HTML fixtures for the benchmarks.
+
+Fixtures are either synthetic (deterministic, arXiv-shaped) or recorded
+from the live services into a directory:
+
+    fixtures/
+    ├── feed.xml          # arXiv API response
+    └── papers/
+        └── 2410.01234v1.html
+
+Record a set with:
+
+    python -m benchmarks.fixtures --query "llm agents" --papers 8 --out fixtures/
+"""
+
+import argparse
+import asyncio
+import random
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import httpx
+
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+ARXIV_HTML_BASE = "https://arxiv.org/html"
+
+_ENTRY = re.compile(rb"<entry>.*?</entry>", re.DOTALL)
+_ENTRY_ID = re.compile(rb"<id>https?://arxiv\.org/abs/([^<]+)</id>")
+_TIMESTAMP = re.compile(rb"<(published|updated)>([^<]+)</\1>")
+
+
+def make_feed(entries: int, seed: int = 0) -> bytes:
+    """Build an arXiv-like Atom feed with entries one hour apart, newest first."""
+    rng = random.Random(seed)
+    words = [f"word{i}" for i in range(5000)]
+    now = datetime.now(timezone.utc)
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom" '
+        'xmlns:arxiv="http://arxiv.org/schemas/atom">'
+        "<title>ArXiv Query</title><id>http://arxiv.org/api/benchmark</id>"
+    ]
+    for i in range(entries):
+        arxiv_id = f"2410.{i:05d}v1"
+        stamp = (now - timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        authors = "".join(
+            f"<author><name>Author{rng.randrange(10000)} Surname{rng.randrange(10000)}</name></author>"
+            for _ in range(rng.randint(1, 8))
+        )
+        parts.append(
+            f"<entry><id>http://arxiv.org/abs/{arxiv_id}</id>"
+            f"<updated>{stamp}</updated><published>{stamp}</published>"
+            f"<title>{' '.join(rng.choices(words, k=rng.randint(6, 14)))}</title>"
+            f"<summary>{' '.join(rng.choices(words, k=rng.randint(120, 250)))}</summary>"
+            f"{authors}"
+            f'<link href="http://arxiv.org/abs/{arxiv_id}" rel="alternate" type="text/html"/>'
+            f'<link title="pdf" href="http://arxiv.org/pdf/{arxiv_id}" rel="related" type="application/pdf"/>'
+            '<arxiv:primary_category term="cs.AI" scheme="http://arxiv.org/schemas/atom"/>'
+            '<category term="cs.AI" scheme="http://arxiv.org/schemas/atom"/>'
+            '<category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>'
+            "</entry>"
+        )
+    parts.append("</feed>")
+    return "".join(parts).encode("utf-8")
+
+
+def make_paper_html(arxiv_id: str, sections: int = 8, paragraphs: int = 6) -> bytes:
+    """Build a LaTeXML-style paper page, deterministic per ID.
+
+    Includes the chrome the extractor has to skip (scripts, navigation,
+    figures, MathML) so extraction cost resembles a real ar5iv page.
+    """
+    rng = random.Random(arxiv_id)
+    words = [f"term{i}" for i in range(8000)]
+
+    def sentence(n: int) -> str:
+        return " ".join(rng.choices(words, k=n)) + "."
+
+    math = (
+        '<math alttext="\\sum_{i=1}^{n} x_i" display="inline"><semantics><mrow>'
+        + "<mi>x</mi><mo>+</mo>" * 20
+        + "</mrow></semantics></math>"
+    )
+    parts = [
+        "<!DOCTYPE html><html><head>",
+        f"<title>{sentence(10)}</title>",
+        "<script>" + "var a = 1 < 2;" * 200 + "</script>",
+        "<style>" + ".ltx_p { margin: 0 }" * 200 + "</style>",
+        '</head><body><nav class="ltx_page_navbar">' + "<a href='#'>link</a>" * 50 + "</nav>",
+        f'<h1 class="ltx_title ltx_title_document">{sentence(10)}</h1>',
+        f'<div class="ltx_abstract"><h6>Abstract</h6><p class="ltx_p">{sentence(150)}</p></div>',
+    ]
+    for s in range(sections):
+        parts.append(f'<section class="ltx_section"><h2 class="ltx_title">{s + 1} {sentence(4)}</h2>')
+        for _ in range(paragraphs):
+            parts.append(f'<div class="ltx_para"><p class="ltx_p">{sentence(120)} {math} {sentence(40)}</p></div>')
+        parts.append('<figure class="ltx_figure"><img src="x.png"/>' f"<figcaption>{sentence(30)}</figcaption></figure>")
+        parts.append("</section>")
+    parts.append('<section class="ltx_bibliography"><h2>References</h2><ul>')
+    parts.extend(f'<li class="ltx_bibitem">{sentence(25)}</li>' for _ in range(40))
+    parts.append('</ul></section><footer class="ltx_page_footer">' + sentence(50) + "</footer></body></html>")
+    return "".join(parts).encode("utf-8")
+
+
+def rebase_feed_dates(feed: bytes, now: datetime | None = None) -> bytes:
+    """Shift every timestamp so the newest entry was published `now`.
+
+    Recorded feeds would otherwise fall outside the `days_back` window as
+    they age.
+    """
+    stamps = [datetime.fromisoformat(m.group(2).decode()) for m in _TIMESTAMP.finditer(feed)]
+    if not stamps:
+        return feed
+    shift = (now or datetime.now(timezone.utc)) - max(stamps)
+
+    def replace(match: re.Match) -> bytes:
+        shifted = datetime.fromisoformat(match.group(2).decode()) + shift
+        stamp = shifted.strftime("%Y-%m-%dT%H:%M:%SZ").encode()
+        return b"<%s>%s</%s>" % (match.group(1), stamp, match.group(1))
+
+    return _TIMESTAMP.sub(replace, feed)
+
+
+@dataclass
+class Fixtures:
+    """A feed split into entries, plus paper HTML by arXiv ID."""
+
+    header: bytes
+    entries: list[bytes]
+    papers: dict[str, bytes] = field(default_factory=dict)
+
+    @classmethod
+    def from_feed(cls, feed: bytes, papers: dict[str, bytes] | None = None) -> "Fixtures":
+        matches = list(_ENTRY.finditer(feed))
+        header = feed[:matches[0].start()] if matches else feed.rsplit(b"</feed>", 1)[0]
+        return cls(header=header, entries=[m.group(0) for m in matches], papers=papers or {})
+
+    @classmethod
+    def synthetic(cls, entries: int = 200) -> "Fixtures":
+        """Synthetic feed; paper HTML is generated on demand for any ID."""
+        return cls.from_feed(make_feed(entries))
+
+    @classmethod
+    def load(cls, directory: Path) -> "Fixtures":
+        """Load a recorded fixture directory, rebasing feed dates to now."""
+        feed = rebase_feed_dates((directory / "feed.xml").read_bytes())
+        papers = {p.stem: p.read_bytes() for p in sorted((directory / "papers").glob("*.html"))}
+        return cls.from_feed(feed, papers)
+
+    def page(self, start: int, max_results: int) -> bytes:
+        """Return the feed restricted to one page of entries."""
+        return self.header + b"".join(self.entries[start:start + max_results]) + b"</feed>"
+
+    def paper(self, arxiv_id: str) -> bytes:
+        """Return paper HTML for an ID.
+
+        Synthetic fixtures generate it. Recorded fixtures without that
+        paper serve one of the recorded papers, picked deterministically,
+        so any ID in the feed can be read.
+        """
+        if arxiv_id in self.papers:
+            return self.papers[arxiv_id]
+        if not self.papers:
+            return make_paper_html(arxiv_id)
+        recorded = sorted(self.papers)
+        return self.papers[recorded[sum(arxiv_id.encode()) % len(recorded)]]
+
+
+async def record(query: str, max_results: int, papers: int, out: Path) -> None:
+    """Save a live arXiv API response and the HTML of its first papers."""
+    (out / "papers").mkdir(parents=True, exist_ok=True)
+    async with httpx.AsyncClient(timeout=60, follow_redirects=True) as client:
+        response = await client.get(ARXIV_API_URL, params={
+            "search_query": f"all:{query}",
+            "max_results": max_results,
+            "sortBy": "submittedDate",
+            "sortOrder": "descending",
+        })
+        response.raise_for_status()
+        (out / "feed.xml").write_bytes(response.content)
+        print(f"feed.xml: {len(response.content) / 1024:,.0f} KiB")
+
+        ids = [m.group(1).decode() for m in _ENTRY_ID.finditer(response.content)]
+        saved = 0
+        for arxiv_id in ids:
+            if saved >= papers:
+                break
+            # Be polite to arxiv.org; recordings are made rarely.
+            await asyncio.sleep(1)
+            html = await client.get(f"{ARXIV_HTML_BASE}/{arxiv_id}")
+            if html.status_code != 200:
+                continue
+            (out / "papers" / f"{arxiv_id}.html").write_bytes(html.content)
+            saved += 1
+            print(f"papers/{arxiv_id}.html: {len(html.content) / 1024:,.0f} KiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Record benchmark fixtures from arXiv")
+    parser.add_argument("--query", required=True)
+    parser.add_argument("--max-results", type=int, default=100)
+    parser.add_argument("--papers", type=int, default=8, help="Papers to save HTML for")
+    parser.add_argument("--out", type=Path, required=True)
+    args = parser.parse_args()
+    asyncio.run(record(args.query, args.max_results, args.papers, args.out))
+
+
+if __name__ == "__main__":
+    main()
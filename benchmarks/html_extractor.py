@@ -0,0 +1,82 @@
+"""Microbenchmark of paper HTML extraction.
+
+Extracts synthetic LaTeXML-style pages (or recorded ones passed with
+--html) and reports whole-document and streamed (chunked) extraction time,
+throughput and peak memory, next to the regex passes the extractor
+replaced as a baseline.
+
+    python -m benchmarks.html_extractor --sections 4 8 32
+    python -m benchmarks.html_extractor --html fixtures/papers/*.html
+"""
+
+import argparse
+import re
+from pathlib import Path
+
+from arxiv_research_agent.services.html_extractor import (
+    PaperHTMLExtractor,
+    extract_paper_html,
+)
+from benchmarks.atom_parser import measure
+from benchmarks.fixtures import make_paper_html
+
+CHUNK_CHARS = 16 * 1024
+
+_SCRIPT = re.compile(r"<script[^>]*>.*?</script>", re.DOTALL | re.IGNORECASE)
+_STYLE = re.compile(r"<style[^>]*>.*?</style>", re.DOTALL | re.IGNORECASE)
+_TAG = re.compile(r"<[^>]+>")
+_WHITESPACE = re.compile(r"\s+")
+_TITLE = re.compile(r"<title>([^<]+)</title>", re.IGNORECASE)
+
+
+def regex_baseline(html: str) -> int:
+    """The whole-document regex passes PaperFetcher used before the extractor."""
+    _TITLE.search(html)
+    text = _STYLE.sub("", _SCRIPT.sub("", html))
+    text = _WHITESPACE.sub(" ", _TAG.sub(" ", text)).strip()
+    return len(text)
+
+
+def streamed(html: str) -> int:
+    extractor = PaperHTMLExtractor()
+    for offset in range(0, len(html), CHUNK_CHARS):
+        extractor.feed(html[offset:offset + CHUNK_CHARS])
+    extractor.close()
+    return len(extractor.to_paper_content("benchmark").content)
+
+
+def bench(name: str, html: str, repeat: int) -> None:
+    content = extract_paper_html(html, "benchmark")
+    kib = len(html) / 1024
+    print(
+        f"\n{name}: {kib:,.0f} KiB HTML -> {len(content.content) / 1024:,.0f} KiB text,"
+        f" {len(content.sections)} sections"
+    )
+
+    ms, mib = measure(lambda: regex_baseline(html), repeat)
+    print(f"  regex baseline   {ms:9.2f} ms  {kib / 1024 / (ms / 1000):7.1f} MiB/s  peak {mib:7.1f} MiB")
+
+    ms, mib = measure(lambda: extract_paper_html(html, "benchmark"), repeat)
+    print(f"  whole document   {ms:9.2f} ms  {kib / 1024 / (ms / 1000):7.1f} MiB/s  peak {mib:7.1f} MiB")
+
+    ms, mib = measure(lambda: streamed(html), repeat)
+    print(f"  16 KiB chunks    {ms:9.2f} ms  {kib / 1024 / (ms / 1000):7.1f} MiB/s  peak {mib:7.1f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", type=int, nargs="*", default=[4, 8, 32])
+    parser.add_argument("--html", type=Path, nargs="*", default=[],
+                        help="Recorded paper HTML files to extract")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for path in args.html:
+        bench(str(path), path.read_text(encoding="utf-8"), args.repeat)
+    for sections in args.sections:
+        html = make_paper_html(f"2410.{sections:05d}", sections=sections).decode("utf-8")
+        bench(f"synthetic paper, {sections} sections", html, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
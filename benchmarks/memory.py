@@ -0,0 +1,157 @@
+"""Memory benchmark: what concurrent research sessions leave resident.
+
+Runs --sessions research requests at once against the stand-in upstreams,
+with in-memory sessions and the scripted model, then reports the size of
+every session, the text store and the worker's RSS growth. Each mode runs
+in a fresh interpreter so RSS figures are comparable.
+
+    python -m benchmarks.memory --sessions 50
+    python -m benchmarks.memory --sessions 50 --papers 6 --max-chars 20000
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from benchmarks.fixtures import Fixtures
+from benchmarks.research import configure, run_load
+from benchmarks.standin import BackgroundServer, create_standin_app
+
+MIB = 2**20
+
+
+def rss_bytes() -> int:
+    """Current resident set size, or the peak where /proc isn't available."""
+    try:
+        pages = int(Path("/proc/self/statm").read_text().split()[1])
+        return pages * resource.getpagesize()
+    except OSError:
+        return peak_rss_bytes()
+
+
+def peak_rss_bytes() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+async def session_bytes() -> tuple[int, int]:
+    """Number of sessions and the size of all of them, serialized."""
+    from api.sessions import APP_NAME, USER_ID, research_sessions
+
+    service = research_sessions.service
+    listed = await service.list_sessions(app_name=APP_NAME, user_id=USER_ID)
+    total = 0
+    for session in listed.sessions:
+        full = await service.get_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+        total += len(full.model_dump_json())
+    return len(listed.sessions), total
+
+
+def child(args: argparse.Namespace) -> None:
+    """One mode's run, reported as JSON on stdout."""
+    fixtures = Fixtures.synthetic(args.feed_entries)
+    standin = BackgroundServer(create_standin_app(fixtures)).start()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        load = argparse.Namespace(
+            arxiv_interval=0.001, concurrency=[args.sessions], session_backend="memory", caches=False,
+            html_executor="thread",
+        )
+        configure(standin.url, load, Path(workdir))
+        os.environ["PAPER_BATCH_MAX_CHARS"] = str(args.max_chars)
+        if args.store_bytes:
+            os.environ["TEXT_STORE_MAX_BYTES"] = str(args.store_bytes)
+
+        from api.main import app
+        from arxiv_research_agent.agent import research_agent
+        from arxiv_research_agent.services import get_text_store
+        from benchmarks.scripted_model import ScriptedLlm
+
+        logging.getLogger().setLevel(logging.WARNING)
+        research_agent.model = ScriptedLlm(papers=args.papers)
+        server = BackgroundServer(app).start()
+        try:
+            with httpx.Client(base_url=server.url) as client:
+                while client.get("/ready").status_code != 200:
+                    time.sleep(0.1)
+            # One run first, so modules loaded on first use don't count as growth.
+            asyncio.run(run_load(server.url, 1, 1, 0))
+            _, warmup_size = asyncio.run(session_bytes())
+            gc.collect()
+            baseline = rss_bytes()
+
+            result = asyncio.run(run_load(server.url, args.sessions, args.sessions, 1))
+            gc.collect()
+            sessions, size = asyncio.run(session_bytes())
+            sessions, size = sessions - 1, size - warmup_size
+            store = get_text_store()
+            report = {
+                "statuses": dict(result["statuses"]),
+                "elapsed": result["elapsed"],
+                "sessions": sessions,
+                "session_bytes": size,
+                "store": store.stats() if store is not None else None,
+                "rss_growth": rss_bytes() - baseline,
+                "peak_rss": peak_rss_bytes(),
+            }
+        finally:
+            server.stop()
+            standin.stop()
+    print(json.dumps(report))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=50, help="Concurrent research runs")
+    parser.add_argument("--papers", type=int, default=4, help="Papers read per run")
+    parser.add_argument("--max-chars", type=int, default=10000, help="Characters read per paper")
+    parser.add_argument("--feed-entries", type=int, default=200, help="Entries in the synthetic feed")
+    parser.add_argument("--store-bytes", type=int, help="TEXT_STORE_MAX_BYTES, to exercise eviction")
+    parser.add_argument("--mode", choices=["inline", "store"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        child(args)
+        return
+
+    samples = {}
+    for mode in ("inline", "store"):
+        env = os.environ | {"TEXT_STORE_ENABLED": str(mode == "store").lower()}
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.memory", "--mode", mode, *sys.argv[1:]],
+            env=env, capture_output=True, text=True, check=True,
+        ).stdout
+        samples[mode] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"\n{args.sessions} concurrent sessions, {args.papers} papers of {args.max_chars} chars each:")
+    print(f"  {'':28s} {'inline text':>12s} {'text store':>12s}")
+    rows = (
+        ("session state MiB", lambda s: s["session_bytes"] / MIB),
+        ("session state KiB / session", lambda s: s["session_bytes"] / max(s["sessions"], 1) / 1024),
+        ("text store MiB (compressed)", lambda s: (s["store"] or {"bytes": 0})["bytes"] / MIB),
+        ("RSS growth MiB", lambda s: s["rss_growth"] / MIB),
+        ("peak RSS MiB", lambda s: s["peak_rss"] / MIB),
+        ("seconds", lambda s: s["elapsed"]),
+    )
+    for label, value in rows:
+        print(f"  {label:28s} {value(samples['inline']):12.2f} {value(samples['store']):12.2f}")
+    for mode, sample in samples.items():
+        print(f"  {mode} statuses: " + ", ".join(f"{k}: {v}" for k, v in sorted(sample["statuses"].items())))
+    store = samples["store"]["store"]
+    print(f"  text store: {store['entries']} entries, {store['hits']} hits,"
+          f" {store['misses']} misses, {store['evictions']} evictions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Ingest and query-latency benchmark for the local metadata index.
+
+Builds a synthetic corpus (Zipf-distributed vocabulary, arXiv-like field
+sizes, publish dates spread over the window) in a fresh SQLite file, then
+times representative searches.
+
+    python -m benchmarks.metadata_index --records 1000000
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from arxiv_research_agent.models import Paper
+from arxiv_research_agent.services.metadata_index import MetadataIndex
+
+CATEGORIES = ["cs.AI", "cs.LG", "cs.CL", "cs.MA"]
+
+QUERIES = [
+    ("common term", "w1"),
+    ("mid-frequency term", "w200"),
+    ("rare term", "w40000"),
+    ("title field", "ti:w50"),
+    ("author field", "au:surname17"),
+    ("phrase", '"w3 w4"'),
+    ("boolean", "(ti:w10 OR ti:w11) AND w25"),
+    ("andnot", "w5 ANDNOT w6"),
+    ("window only", ""),
+]
+
+
+def make_corpus(count: int, vocab_size: int, abstract_words: int, days: int, seed: int):
+    """Yield synthetic papers, newest first."""
+    rng = random.Random(seed)
+    words = [f"w{i}" for i in range(vocab_size)]
+    cum_weights = []
+    total = 0.0
+    for rank in range(1, vocab_size + 1):
+        total += 1.0 / rank
+        cum_weights.append(total)
+
+    now = datetime.now(timezone.utc)
+    step = timedelta(days=days) / count
+    for i in range(count):
+        title = " ".join(rng.choices(words, cum_weights=cum_weights, k=rng.randint(6, 14)))
+        abstract = " ".join(rng.choices(words, cum_weights=cum_weights, k=abstract_words))
+        arxiv_id = f"{2400 + i // 100000}.{i % 100000:05d}"
+        yield Paper(
+            id=f"{arxiv_id}v1",
+            title=title,
+            abstract=abstract,
+            authors=[
+                f"Author{rng.randrange(50000)} Surname{rng.randrange(50000)}"
+                for _ in range(rng.randint(1, 6))
+            ],
+            published=now - step * i,
+            url=f"http://arxiv.org/abs/{arxiv_id}v1",
+            pdf_url=f"http://arxiv.org/pdf/{arxiv_id}v1",
+            categories=[rng.choice(CATEGORIES)],
+        )
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def bench_ingest(index: MetadataIndex, args) -> None:
+    # Only time the index; generating the corpus is slower than ingesting it.
+    elapsed = 0.0
+    batch = []
+    corpus = make_corpus(args.records, args.vocab, args.abstract_words, args.days, args.seed)
+    for i, paper in enumerate(corpus, start=1):
+        batch.append(paper)
+        if len(batch) == args.batch or i == args.records:
+            started = time.perf_counter()
+            index.add(batch)
+            elapsed += time.perf_counter() - started
+            batch = []
+
+    print(f"ingest: {args.records} records in {elapsed:.1f}s "
+          f"({args.records / elapsed:,.0f} records/s, batches of {args.batch})")
+
+
+def bench_queries(index: MetadataIndex, args) -> None:
+    now = datetime.now(timezone.utc)
+    print(f"{'query':<20} {'days':>4} {'hits':>5} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for days_back in (1, 7, args.days):
+        since = now - timedelta(days=days_back)
+        for name, query in QUERIES:
+            samples = []
+            hits = 0
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                papers = index.search(query, since, args.max_results)
+                samples.append((time.perf_counter() - started) * 1000)
+                hits = len(papers or [])
+            print(f"{name:<20} {days_back:>4} {hits:>5} "
+                  f"{percentile(samples, 50):>8.2f} {percentile(samples, 95):>8.2f} "
+                  f"{percentile(samples, 99):>8.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument("--vocab", type=int, default=50_000)
+    parser.add_argument("--abstract-words", type=int, default=150)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--max-results", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--path", help="Index file to build (default: a temporary file)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(args.path or Path(tmp) / "metadata.sqlite3")
+        index = MetadataIndex(path=path, categories=CATEGORIES)
+
+        bench_ingest(index, args)
+        for category in CATEGORIES:
+            index.record_harvest(category, newest=time.time(), oldest=0.0)
+        print(f"index size: {path.stat().st_size / 2**20:,.0f} MiB")
+
+        bench_queries(index, args)
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark of local BM25 ranking of search results.
+
+Reports ranking time per 1000 abstracts, and the model tokens a
+search_arxiv result costs with and without ranking. Every later model call
+in a run resends the result, so savings are multiplied by --later-turns.
+
+    python -m benchmarks.ranking
+    python -m benchmarks.ranking --feed fixtures/feed.xml --query "llm agents"
+"""
+
+import argparse
+import json
+import os
+import random
+from pathlib import Path
+
+# Importing the tools would otherwise open the on-disk paper cache.
+os.environ.setdefault("PAPER_CACHE_ENABLED", "false")
+
+from arxiv_research_agent.config import settings  # noqa: E402
+from arxiv_research_agent.services.atom_parser import parse_feed  # noqa: E402
+from arxiv_research_agent.services.ranking import query_terms, rank_papers  # noqa: E402
+from arxiv_research_agent.tools.arxiv import _search_hit  # noqa: E402
+from benchmarks.atom_parser import measure  # noqa: E402
+from benchmarks.fixtures import make_feed  # noqa: E402
+from benchmarks.scripted_model import CHARS_PER_TOKEN  # noqa: E402
+
+
+def tokens(payload: dict) -> int:
+    return len(json.dumps(payload)) // CHARS_PER_TOKEN
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--feed", type=Path, help="Recorded arXiv API response (default: synthetic)")
+    parser.add_argument("--query", action="append", help="Research query; repeat for several")
+    parser.add_argument("--max-results", type=int, default=20, help="max_results the model asks for")
+    parser.add_argument("--searches", type=int, default=2, help="search_arxiv calls per run")
+    parser.add_argument("--later-turns", type=int, default=3,
+                        help="Model calls after a search that resend its result")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    papers, _ = parse_feed(args.feed.read_bytes() if args.feed else make_feed(1000))
+    # Synthetic text is random words; queries from titles give it matches.
+    rng = random.Random(0)
+    queries = args.query or [" ".join(rng.choice(papers).title.split()[:3]) for _ in range(20)]
+
+    terms = query_terms(queries[0])
+    per_thousand = [papers[i % len(papers)] for i in range(1000)]
+    ms, mib = measure(lambda: rank_papers(terms, per_thousand, settings.search_rank_top_k), args.repeat)
+    print(f"\nranking 1000 abstracts: {ms:8.2f} ms  peak {mib:6.1f} MiB")
+
+    candidates = min(max(args.max_results, settings.search_rank_candidates), 50)
+    before = after = 0
+    for i, query in enumerate(queries):
+        # Each query searches a different stretch of the feed.
+        offset = (i * candidates) % max(len(papers) - candidates, 1)
+        pool = papers[offset:offset + candidates]
+        ranked = rank_papers(query_terms(query), pool, min(args.max_results, settings.search_rank_top_k))
+        before += tokens({"papers": [_search_hit(p) for p in pool[:args.max_results]]})
+        after += tokens({"papers": [{**_search_hit(p), "score": round(s, 2)} for p, s in ranked]})
+    before //= len(queries)
+    after //= len(queries)
+
+    saved = (before - after) * args.searches * args.later_turns
+    print(f"search result tokens  unranked {before:6d}  ranked {after:6d}"
+          f"  ({candidates} candidates, top {settings.search_rank_top_k})")
+    print(f"prompt tokens saved per run: {saved:,}"
+          f" ({args.searches} searches x {args.later_turns} later model calls)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""End-to-end load benchmark of POST /research against replayed upstreams.
+
+Starts the stand-in upstream server (arXiv API, paper HTML, SurfaceDocs),
+then the real FastAPI app with the agent's model swapped for a scripted
+one, and sends research requests at a fixed concurrency. Reports
+throughput, latency percentiles and where the time went.
+
+    python -m benchmarks.research --requests 200 --concurrency 1 8 32
+    python -m benchmarks.research --fixtures fixtures/ --upstream-latency 0.2 --model-latency 1.5
+    python -m benchmarks.research --health-interval 0.01 --html-executor process
+
+Caches are off by default so every request does the full work; each
+request also uses a distinct query.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+
+import httpx
+
+from benchmarks.fixtures import Fixtures
+from benchmarks.standin import BackgroundServer, create_standin_app
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(int(round(pct / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def configure(standin_url: str, args: argparse.Namespace, workdir: Path) -> None:
+    """Point the app at the stand-in. Must run before the app is imported."""
+    env = {
+        "GOOGLE_API_KEY": "benchmark",
+        "SURFACEDOCS_API_KEY": "benchmark",
+        "SURFACEDOCS_BASE_URL": standin_url,
+        "ARXIV_API_URL": f"{standin_url}/api/query",
+        "ARXIV_HTML_BASE_URL": f"{standin_url}/html",
+        "AR5IV_HTML_BASE_URL": f"{standin_url}/ar5iv/html",
+        "ARXIV_RATE_LIMIT_INTERVAL": str(args.arxiv_interval),
+        "ARXIV_RATE_LIMIT_BURST": str(max(args.concurrency)),
+        "SESSION_BACKEND": args.session_backend,
+        "SESSION_DB_URL": f"sqlite:///{workdir / 'sessions.sqlite3'}",
+        "PAPER_CACHE_PATH": str(workdir / "papers.sqlite3"),
+        "METADATA_INDEX_ENABLED": "false",
+        "HTML_EXECUTOR_KIND": args.html_executor,
+    }
+    if not args.caches:
+        env |= {
+            "SEARCH_CACHE_ENABLED": "false",
+            "PAPER_CACHE_ENABLED": "false",
+            "RESULT_CACHE_ENABLED": "false",
+        }
+    os.environ.update(env)
+
+
+async def probe_health(base_url: str, interval: float, done: asyncio.Event) -> list[float]:
+    """GET /health every `interval` seconds until `done`; return the latencies.
+
+    Uses its own connection so probes never queue behind research requests:
+    the latency is the time the event loop takes to get to them.
+    """
+    latencies: list[float] = []
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        while not done.is_set():
+            started = time.perf_counter()
+            await client.get("/health")
+            latencies.append(time.perf_counter() - started)
+            try:
+                await asyncio.wait_for(done.wait(), interval)
+            except asyncio.TimeoutError:
+                pass
+    return latencies
+
+
+async def run_load(
+    base_url: str,
+    requests: int,
+    concurrency: int,
+    offset: int,
+    deadline: float | None = None,
+    health_interval: float | None = None,
+) -> dict:
+    """Send `requests` research requests with `concurrency` in flight.
+
+    With `health_interval`, /health is probed throughout the run.
+    """
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    errors: Counter = Counter()
+    phases: dict[str, float] = defaultdict(float)
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for i in range(requests):
+        queue.put_nowait(offset + i)
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        while not queue.empty():
+            i = queue.get_nowait()
+            started = time.perf_counter()
+            try:
+                body = {"query": f"benchmark topic {i}", "days_back": 7, "max_papers": 4}
+                if deadline is not None:
+                    body["deadline_seconds"] = deadline
+                response = await client.post("/research", json=body)
+                body = response.json()
+                status = body.get("status", f"http_{response.status_code}")
+            except httpx.HTTPError as e:
+                body, status = {}, type(e).__name__
+            latencies.append(time.perf_counter() - started)
+            statuses[status] += 1
+            if body.get("error"):
+                errors[body["error"][:200]] += 1
+            for phase, seconds in ((body.get("timings") or {}).get("phases") or {}).items():
+                phases[phase] += seconds
+
+    limits = httpx.Limits(max_connections=concurrency)
+    done = asyncio.Event()
+    probe = None
+    if health_interval is not None:
+        probe = asyncio.create_task(probe_health(base_url, health_interval, done))
+    async with httpx.AsyncClient(base_url=base_url, timeout=600, limits=limits) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    done.set()
+
+    return {
+        "elapsed": elapsed,
+        "latencies": latencies,
+        "statuses": statuses,
+        "errors": errors,
+        "phases": {k: v / len(latencies) for k, v in phases.items()},
+        "health": await probe if probe is not None else [],
+    }
+
+
+def report(concurrency: int, result: dict) -> None:
+    latencies = result["latencies"]
+    ms = [s * 1000 for s in latencies]
+    print(
+        f"\nconcurrency {concurrency}: {len(latencies)} requests in {result['elapsed']:.2f}s"
+        f" = {len(latencies) / result['elapsed']:.1f} req/s"
+    )
+    print(
+        f"  latency ms  p50 {percentile(ms, 50):8.1f}  p95 {percentile(ms, 95):8.1f}"
+        f"  p99 {percentile(ms, 99):8.1f}  max {max(ms):8.1f}"
+    )
+    if result["health"]:
+        health = [s * 1000 for s in result["health"]]
+        print(
+            f"  /health ms  p50 {percentile(health, 50):8.1f}  p95 {percentile(health, 95):8.1f}"
+            f"  p99 {percentile(health, 99):8.1f}  max {max(health):8.1f}  ({len(health)} probes)"
+        )
+    print("  status      " + ", ".join(f"{k}: {v}" for k, v in sorted(result["statuses"].items())))
+    for error, count in result["errors"].most_common(3):
+        print(f"  error x{count}: {error}")
+    if result["phases"]:
+        print("  mean seconds per run by phase (phases overlap):")
+        for phase, seconds in sorted(result["phases"].items(), key=lambda kv: -kv[1]):
+            print(f"    {phase:32s} {seconds:8.4f}")
+
+
+async def bench(app_url: str, args: argparse.Namespace) -> None:
+    offset = 0
+    if args.warmup:
+        await run_load(app_url, args.warmup, 1, offset, args.deadline)
+        offset += args.warmup
+    for concurrency in args.concurrency:
+        result = await run_load(
+            app_url, args.requests, concurrency, offset, args.deadline, args.health_interval
+        )
+        offset += args.requests
+        report(concurrency, result)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=50, help="Requests per concurrency level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--fixtures", type=Path, help="Recorded fixture directory (default: synthetic)")
+    parser.add_argument("--feed-entries", type=int, default=200, help="Entries in the synthetic feed")
+    parser.add_argument("--upstream-latency", type=float, default=0.0,
+                        help="Seconds added to every stand-in response")
+    parser.add_argument("--model-latency", type=float, default=0.0,
+                        help="Seconds the scripted model takes per call")
+    parser.add_argument("--papers", type=int, default=4, help="Papers read per run")
+    parser.add_argument("--arxiv-interval", type=float, default=0.001,
+                        help="arXiv rate limit interval; 3.0 reproduces production pacing")
+    parser.add_argument("--deadline", type=float, help="deadline_seconds sent with each request")
+    parser.add_argument("--health-interval", type=float,
+                        help="Probe GET /health this often during each run and report its latency")
+    parser.add_argument("--html-executor", choices=["thread", "process"], default="thread",
+                        help="Pool kind for paper HTML extraction")
+    parser.add_argument("--session-backend", choices=["memory", "database"], default="memory")
+    parser.add_argument("--caches", action="store_true",
+                        help="Leave the search, paper and result caches enabled")
+    args = parser.parse_args()
+
+    fixtures = Fixtures.load(args.fixtures) if args.fixtures else Fixtures.synthetic(args.feed_entries)
+    standin_app = create_standin_app(fixtures, args.upstream_latency)
+    standin = BackgroundServer(standin_app).start()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        configure(standin.url, args, Path(workdir))
+
+        # Imported only now: settings are read at import time.
+        from api.main import app
+        from arxiv_research_agent.agent import research_agent
+        from benchmarks.scripted_model import ScriptedLlm
+
+        # Per-request INFO logs would dominate the output and the timings.
+        logging.getLogger().setLevel(logging.WARNING)
+        research_agent.model = ScriptedLlm(latency=args.model_latency, papers=args.papers)
+        server = BackgroundServer(app).start()
+        try:
+            asyncio.run(bench(server.url, args))
+        finally:
+            server.stop()
+            standin.stop()
+
+    requests = standin_app.state.requests
+    print("\nupstream requests: " + ", ".join(f"{k}: {v}" for k, v in sorted(requests.items())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""A deterministic stand-in for Gemini that drives the real agent tools.
+
+Each run makes the same sequence of tool calls a typical research run
+does: one search_arxiv, one fetch_papers for the top results, one
+save_document, then a closing message. The tools, session state and
+callbacks are all the production ones; only the model is replaced.
+"""
+
+import asyncio
+import json
+from typing import AsyncGenerator
+
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+from google.genai import types
+
+# Rough characters per token, for usage figures in telemetry.
+CHARS_PER_TOKEN = 4
+
+
+class ScriptedLlm(BaseLlm):
+    """Scripted model issuing a fixed tool-call sequence per user turn.
+
+    Attributes:
+        latency: Seconds to wait per model call, to model generation time.
+        papers: Papers to read with fetch_papers.
+        search_results: max_results passed to search_arxiv.
+    """
+
+    model: str = "scripted"
+    latency: float = 0.0
+    papers: int = 4
+    search_results: int = 20
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        query, responses = _current_turn(llm_request.contents)
+        step = len(responses)
+
+        if step == 0:
+            part = _call("search_arxiv", {
+                "query": query,
+                "days_back": 7,
+                "max_results": self.search_results,
+            })
+        elif step == 1:
+            papers = responses[0].get("papers", [])
+            part = _call("fetch_papers", {
+                "arxiv_ids": [p["id"] for p in papers[:self.papers] if "id" in p],
+            })
+        elif step == 2:
+            part = _call("save_document", {"document": _document(query, responses[1])})
+        else:
+            part = types.Part(text="The research summary has been saved.")
+
+        content = types.Content(role="model", parts=[part])
+        yield LlmResponse(
+            content=content,
+            usage_metadata=types.GenerateContentResponseUsageMetadata(
+                prompt_token_count=_request_chars(llm_request) // CHARS_PER_TOKEN,
+                candidates_token_count=len(json.dumps(part.model_dump(exclude_none=True))) // CHARS_PER_TOKEN,
+            ),
+        )
+
+
+def _current_turn(contents: list[types.Content]) -> tuple[str, list[dict]]:
+    """Return the latest user query and the tool responses that followed it."""
+    query = ""
+    responses: list[dict] = []
+    for content in contents:
+        for part in content.parts or []:
+            if part.text and content.role == "user":
+                lines = part.text.splitlines()
+                if lines and ":" in lines[0]:
+                    query = lines[0].split(":", 1)[1].strip()
+                    responses = []
+            elif part.function_response is not None:
+                responses.append(part.function_response.response or {})
+    return query, responses
+
+
+def _call(name: str, args: dict) -> types.Part:
+    return types.Part(function_call=types.FunctionCall(name=name, args=args))
+
+
+def _document(query: str, fetched: dict) -> dict:
+    blocks = [
+        {"type": "heading", "content": "Executive summary", "metadata": {"level": 1}},
+        {"type": "paragraph", "content": f"Recent work on {query}."},
+    ]
+    for paper in fetched.get("papers", []):
+        blocks.append({"type": "heading", "content": paper["title"], "metadata": {"level": 2}})
+        text = " ".join(s["content"] for s in paper.get("sections", []))
+        blocks.append({"type": "paragraph", "content": text[:1500]})
+    return {"title": f"Research: {query}", "blocks": blocks}
+
+
+def _request_chars(llm_request: LlmRequest) -> int:
+    chars = len(str(llm_request.config.system_instruction or "")) if llm_request.config else 0
+    for content in llm_request.contents:
+        for part in content.parts or []:
+            if part.text:
+                chars += len(part.text)
+            elif part.function_call is not None:
+                chars += len(json.dumps(part.function_call.args or {}))
+            elif part.function_response is not None:
+                chars += len(json.dumps(part.function_response.response or {}, default=str))
+    return chars
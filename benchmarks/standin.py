@@ -0,0 +1,101 @@
+"""Local stand-in for the arXiv API, arXiv/ar5iv HTML and SurfaceDocs.
+
+Replays fixtures over real HTTP so the agent's clients, connection pools
+and parsers run exactly as in production. Point the app at it with
+ARXIV_API_URL, ARXIV_HTML_BASE_URL, AR5IV_HTML_BASE_URL and
+SURFACEDOCS_BASE_URL.
+"""
+
+import asyncio
+import re
+import socket
+import threading
+import time
+from collections import Counter
+from uuid import uuid4
+
+import uvicorn
+from fastapi import FastAPI, Request, Response
+
+from benchmarks.fixtures import Fixtures
+
+ATOM_MEDIA_TYPE = "application/atom+xml; charset=utf-8"
+HTML_MEDIA_TYPE = "text/html; charset=utf-8"
+# The metadata harvester lists whole categories; agent searches add terms.
+HARVEST_QUERY = re.compile(r"cat:[\w.-]+")
+
+
+def create_standin_app(fixtures: Fixtures, latency: float = 0.0) -> FastAPI:
+    """Build the stand-in app.
+
+    Args:
+        fixtures: Feed entries and paper HTML to serve.
+        latency: Seconds added before every response, to model upstream
+                 round trips.
+    """
+    app = FastAPI()
+    app.state.requests = Counter()
+
+    async def delay(kind: str) -> None:
+        app.state.requests[kind] += 1
+        if latency:
+            await asyncio.sleep(latency)
+
+    @app.get("/api/query")
+    async def arxiv_query(search_query: str = "", start: int = 0, max_results: int = 10) -> Response:
+        if HARVEST_QUERY.fullmatch(search_query):
+            # Counted on top of arxiv_api, to tell harvests from searches.
+            app.state.requests["arxiv_harvest"] += 1
+        await delay("arxiv_api")
+        return Response(fixtures.page(start, max_results), media_type=ATOM_MEDIA_TYPE)
+
+    @app.get("/html/{arxiv_id}")
+    async def arxiv_html(arxiv_id: str) -> Response:
+        await delay("arxiv_html")
+        return Response(fixtures.paper(arxiv_id), media_type=HTML_MEDIA_TYPE)
+
+    @app.get("/ar5iv/html/{arxiv_id}")
+    async def ar5iv_html(arxiv_id: str) -> Response:
+        await delay("ar5iv_html")
+        return Response(fixtures.paper(arxiv_id), media_type=HTML_MEDIA_TYPE)
+
+    @app.post("/v1/documents", status_code=201)
+    async def save_document(request: Request) -> dict:
+        await delay("surfacedocs")
+        await request.body()
+        document_id = uuid4().hex
+        return {
+            "id": document_id,
+            "url": f"http://standin.invalid/d/{document_id}",
+            "folder_id": "benchmark",
+        }
+
+    return app
+
+
+class BackgroundServer:
+    """Serve an ASGI app with uvicorn on its own thread and event loop."""
+
+    def __init__(self, app, host: str = "127.0.0.1"):
+        self._sock = socket.socket()
+        self._sock.bind((host, 0))
+        self.url = f"http://{host}:{self._sock.getsockname()[1]}"
+        self._server = uvicorn.Server(
+            uvicorn.Config(app, log_level="warning", access_log=False, lifespan="on")
+        )
+        self._thread = threading.Thread(
+            target=lambda: self._server.run(sockets=[self._sock]), daemon=True
+        )
+
+    def start(self) -> "BackgroundServer":
+        self._thread.start()
+        while not self._server.started:
+            if not self._thread.is_alive():
+                raise RuntimeError("Server failed to start")
+            time.sleep(0.01)
+        return self
+
+    def stop(self) -> None:
+        self._server.should_exit = True
+        self._thread.join()
+        self._sock.close()
@@ -0,0 +1,79 @@
+"""Cold start benchmark: app import time and time until /ready.
+
+Each run starts a fresh interpreter, imports the app, serves it and polls
+/ready until the agent has loaded. Exits non-zero when the median import
+time is over --budget, so it can guard the cold start budget in CI.
+
+    python -m benchmarks.startup --runs 5 --budget 1.5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+def child() -> None:
+    """One cold start, reported as JSON on stdout."""
+    started = time.perf_counter()
+    from api.main import app
+
+    imported = time.perf_counter() - started
+
+    import httpx
+
+    from benchmarks.standin import BackgroundServer
+
+    server = BackgroundServer(app).start()
+    serving = time.perf_counter() - started
+    try:
+        with httpx.Client(base_url=server.url) as client:
+            while client.get("/ready").status_code != 200:
+                time.sleep(0.1)
+        ready = time.perf_counter() - started
+    finally:
+        server.stop()
+    print(json.dumps({"import": imported, "serving": serving, "ready": ready}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=float, help="Fail if the median import takes longer (seconds)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child()
+        return
+
+    env = os.environ | {
+        "GOOGLE_API_KEY": os.environ.get("GOOGLE_API_KEY", "benchmark"),
+        "SURFACEDOCS_API_KEY": os.environ.get("SURFACEDOCS_API_KEY", "benchmark"),
+        "SESSION_BACKEND": "memory",
+        "PAPER_CACHE_ENABLED": "false",
+    }
+    samples = []
+    for _ in range(args.runs):
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.startup", "--child"],
+            env=env, capture_output=True, text=True, check=True,
+        ).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+
+    print(f"\n{args.runs} cold starts, seconds (median / max):")
+    for key, label in (("import", "import api.main"), ("serving", "accepting requests"), ("ready", "/ready is 200")):
+        values = [s[key] for s in samples]
+        print(f"  {label:20s} {statistics.median(values):7.3f} {max(values):7.3f}")
+
+    median_import = statistics.median(s["import"] for s in samples)
+    if args.budget is not None and median_import > args.budget:
+        print(f"\nimport time {median_import:.3f}s is over the {args.budget:.3f}s budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""Multi-worker benchmark: throughput from 1 to N worker processes on one host.
+
+Serves the real app with `uvicorn --workers N` in multi-worker mode, with
+the scripted model, against the stand-in upstreams, and sends research
+requests at a fixed concurrency. Reports throughput and speedup per worker
+count, and the arXiv API request rate the workers kept to together.
+With --harvest, the workers also keep a metadata index, and the listing
+requests they made to harvest it are reported: one worker's worth means
+the harvest ran once for the host.
+
+    python -m benchmarks.workers --workers 1 2 4 --requests 200 --concurrency 32
+    python -m benchmarks.workers --workers 1 4 --via jobs --arxiv-interval 0.05
+    python -m benchmarks.workers --workers 1 4 --harvest
+
+With --via jobs, requests are queued with POST /research/jobs and polled
+with GET /research/{job_id}, which land on any worker.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+import httpx
+
+from benchmarks.fixtures import Fixtures
+from benchmarks.research import configure, percentile, run_load
+from benchmarks.standin import BackgroundServer, create_standin_app
+
+
+def scripted_app():
+    """App factory for uvicorn workers: the real app with the scripted model."""
+    from api.main import app
+
+    # Per-request INFO logs would dominate the output and the timings.
+    logging.getLogger().setLevel(logging.WARNING)
+    from arxiv_research_agent.agent import research_agent
+    from benchmarks.scripted_model import ScriptedLlm
+
+    research_agent.model = ScriptedLlm(
+        latency=float(os.environ.get("BENCHMARK_MODEL_LATENCY", "0")),
+        papers=int(os.environ.get("BENCHMARK_PAPERS", "4")),
+    )
+    return app
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_ready(url: str, workers: int, timeout: float = 120) -> None:
+    """Poll /ready until enough answers in a row suggest every worker is up."""
+    streak = 0
+    started = time.monotonic()
+    with httpx.Client(base_url=url) as client:
+        while streak < workers * 4:
+            if time.monotonic() - started > timeout:
+                raise RuntimeError("Workers did not become ready")
+            try:
+                streak = streak + 1 if client.get("/ready").status_code == 200 else 0
+            except httpx.HTTPError:
+                streak = 0
+            time.sleep(0.05)
+
+
+async def run_jobs(base_url: str, requests: int, concurrency: int, offset: int) -> dict:
+    """Queue `requests` jobs with `concurrency` outstanding and poll them to completion."""
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for i in range(requests):
+        queue.put_nowait(offset + i)
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        while not queue.empty():
+            i = queue.get_nowait()
+            started = time.perf_counter()
+            body = {"query": f"benchmark topic {i}", "days_back": 7, "max_papers": 4}
+            response = await client.post("/research/jobs", json=body)
+            if response.status_code != 202:
+                statuses[f"http_{response.status_code}"] += 1
+                continue
+            job_id = response.json()["job_id"]
+            while True:
+                await asyncio.sleep(0.05)
+                job = (await client.get(f"/research/{job_id}")).json()
+                if job.get("finished_at"):
+                    break
+            latencies.append(time.perf_counter() - started)
+            statuses[(job.get("result") or {}).get("status", job.get("status"))] += 1
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=600, limits=limits) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return {"elapsed": elapsed, "latencies": latencies, "statuses": statuses}
+
+
+def searches(requests: Counter) -> int:
+    """arXiv API requests made by agent searches rather than harvests."""
+    return requests["arxiv_api"] - requests["arxiv_harvest"]
+
+
+def serve(workers: int, env: dict) -> tuple[subprocess.Popen, str]:
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "benchmarks.workers:scripted_app", "--factory",
+         "--workers", str(workers), "--port", str(port), "--log-level", "warning", "--no-access-log"],
+        env=env,
+    )
+    url = f"http://127.0.0.1:{port}"
+    try:
+        wait_ready(url, workers)
+    except BaseException:
+        process.terminate()
+        raise
+    return process, url
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--requests", type=int, default=100, help="Requests per worker count")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--via", choices=["research", "jobs"], default="research")
+    parser.add_argument("--feed-entries", type=int, default=200, help="Entries in the synthetic feed")
+    parser.add_argument("--upstream-latency", type=float, default=0.0,
+                        help="Seconds added to every stand-in response")
+    parser.add_argument("--model-latency", type=float, default=0.0,
+                        help="Seconds the scripted model takes per call")
+    parser.add_argument("--papers", type=int, default=4, help="Papers read per run")
+    parser.add_argument("--arxiv-interval", type=float, default=0.001,
+                        help="arXiv rate limit interval, shared by all workers")
+    parser.add_argument("--session-backend", choices=["memory", "database"], default="database")
+    parser.add_argument("--caches", action="store_true",
+                        help="Leave the search, paper and result caches enabled")
+    parser.add_argument("--harvest", action="store_true",
+                        help="Enable the metadata index and count its harvest requests")
+    args = parser.parse_args()
+
+    fixtures = Fixtures.synthetic(args.feed_entries)
+    standin_app = create_standin_app(fixtures, args.upstream_latency)
+    standin = BackgroundServer(standin_app).start()
+
+    baseline = None
+    offset = 0
+    try:
+        for workers in args.workers:
+            # Fresh shared state and session files per worker count.
+            with tempfile.TemporaryDirectory() as workdir:
+                load = argparse.Namespace(
+                    **{**vars(args), "concurrency": [args.concurrency], "html_executor": "thread"}
+                )
+                configure(standin.url, load, Path(workdir))
+                env = os.environ | {
+                    "MULTI_WORKER": "true",
+                    # No burst, so the observed rate shows the shared pace.
+                    "ARXIV_RATE_LIMIT_BURST": "1",
+                    "SHARED_STATE_DIR": str(Path(workdir) / "shared"),
+                    "JOB_QUEUE_SIZE": str(args.requests),
+                    "JOB_POLL_INTERVAL": "0.05",
+                    "BENCHMARK_MODEL_LATENCY": str(args.model_latency),
+                    "BENCHMARK_PAPERS": str(args.papers),
+                }
+                if args.harvest:
+                    env |= {
+                        "METADATA_INDEX_ENABLED": "true",
+                        "METADATA_INDEX_PATH": str(Path(workdir) / "metadata.sqlite3"),
+                    }
+                standin_app.state.requests.clear()
+                process, url = serve(workers, env)
+                # Harvests start with the workers; searches are counted from here.
+                startup = standin_app.state.requests.copy()
+                try:
+                    load_fn = run_jobs if args.via == "jobs" else run_load
+                    result = asyncio.run(load_fn(url, args.requests, args.concurrency, offset))
+                finally:
+                    process.terminate()
+                    process.wait()
+                offset += args.requests
+
+            rps = len(result["latencies"]) / result["elapsed"]
+            baseline = baseline or rps
+            ms = [s * 1000 for s in result["latencies"]] or [0.0]
+            requests = standin_app.state.requests
+            arxiv_rate = (searches(requests) - searches(startup)) / result["elapsed"]
+            print(
+                f"\n{workers} workers: {len(result['latencies'])} requests in {result['elapsed']:.2f}s"
+                f" = {rps:.1f} req/s ({rps / baseline:.2f}x)"
+            )
+            print(f"  latency ms  p50 {percentile(ms, 50):8.1f}  p95 {percentile(ms, 95):8.1f}")
+            print("  status      " + ", ".join(f"{k}: {v}" for k, v in sorted(result["statuses"].items())))
+            print(f"  arXiv API   {arxiv_rate:.1f} req/s (limit {1 / args.arxiv_interval:.1f} req/s)")
+            if args.harvest:
+                print(f"  harvest     {requests['arxiv_harvest']} listing requests")
+    finally:
+        standin.stop()
+
+
+if __name__ == "__main__":
+    main()